@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Pattern bundle build tool for MairuCLI.
+
+Loads and validates all pattern files and writes the precompiled
+pattern bundle to the cache directory, so the first interactive start
+does not pay for it (useful in install scripts and container images).
+
+Usage:
+    python scripts/build_pattern_bundle.py
+    MAIRU_CACHE_DIR=/opt/mairu/cache python scripts/build_pattern_bundle.py
+"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.interceptor import PATTERN_BUNDLE, build_pattern_data
+
+
+def main():
+    """Rebuild the pattern bundle."""
+    print("=" * 60)
+    print("MairuCLI Pattern Bundle Builder")
+    print("=" * 60)
+    print()
+
+    data, written = PATTERN_BUNDLE.rebuild(build_pattern_data)
+
+    print(f"Dangerous patterns: {len(data['dangerous'])}")
+    print(f"Caution patterns:   {len(data['caution'])}")
+    print(f"Typo patterns:      {len(data['typo'])}")
+    print(f"Common commands:    {len(data['common_commands'])}")
+    print(f"Bundle version:     {PATTERN_BUNDLE.version}")
+    print()
+
+    if written:
+        print(f"✅ Bundle written to {PATTERN_BUNDLE.path}")
+        return 0
+
+    print("❌ Bundle not written. Fix the errors above or check that")
+    print(f"   {PATTERN_BUNDLE.cache_dir} is writable.")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
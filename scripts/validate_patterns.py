@@ -15,7 +15,12 @@ import os
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.interceptor import PatternLoader, JSONSCHEMA_AVAILABLE
+from src.interceptor import (
+    PatternCompiler,
+    PatternLoader,
+    JSONSCHEMA_AVAILABLE,
+    protected_overlays
+)
 
 
 def main():
@@ -38,6 +43,8 @@ def main():
 
     # Load all patterns (validation happens during load)
     dangerous, caution, typo = loader.load_all_patterns()
+    overlays = protected_overlays()
+    protected = loader.load_protected_directories(overlays)
 
     # Report results
     print("=" * 60)
@@ -66,6 +73,37 @@ def main():
     else:
         print("⚠️  typo_messages.json: No patterns loaded (optional)")
 
+    # Check protected directories (and site overlays)
+    protected_errors = [
+        path for path in loader.load_errors
+        if path.endswith("protected_directories.json") or path in overlays
+    ]
+    rules = sum(len(levels["critical"]) + len(levels["caution"])
+                for levels in protected.values())
+    if protected_errors:
+        print("❌ protected_directories.json: Errors in "
+              f"{', '.join(protected_errors)} (check errors above)")
+        success = False
+    else:
+        print(f"✅ protected_directories.json: {rules} rules for "
+              f"{len(protected)} platforms ({len(overlays)} overlays)")
+
+    # Show how patterns are dispatched (by command or on the whole line)
+    compiler = PatternCompiler()
+    by_command, agnostic = compiler.build_command_index([
+        compiler.compile_patterns(patterns)
+        for patterns in (dangerous, caution, typo)
+    ])
+    print(f"🔎 Command index: {len(by_command)} commands, "
+          f"{len(agnostic)} command-agnostic patterns")
+    spanning = [name
+                for patterns in (dangerous, caution, typo)
+                for name, data in patterns.items()
+                if compiler.spans_commands(data["pattern"])]
+    if spanning:
+        print(f"⚠️  Matched on the whole line (pipe or chain): "
+              f"{', '.join(spanning)}")
+
     print()
 
     if success:
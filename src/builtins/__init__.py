@@ -15,6 +15,7 @@ from . import system_info
 from . import display
 from . import shell_utils
 from . import mairu_commands
+from . import job_control
 
 
 class BuiltinCommands:
@@ -49,8 +50,10 @@ class BuiltinCommands:
             'tree',
             # Shell utils
             'echo', 'clear', 'cls', 'history', 'alias',
+            # Job control
+            'jobs', 'fg', 'wait',
             # MairuCLI specific
-            'help', 'stats', 'lie',
+            'help', 'stats', 'cache', 'lie',
             # Exit commands (handled in main.py)
             'exit', 'quit'
         ]
@@ -96,9 +99,14 @@ class BuiltinCommands:
             'cls': shell_utils.cmd_cls,
             'history': shell_utils.cmd_history,
             'alias': shell_utils.cmd_alias,
+            # Job control
+            'jobs': job_control.cmd_jobs,
+            'fg': job_control.cmd_fg,
+            'wait': job_control.cmd_wait,
             # MairuCLI specific
             'help': mairu_commands.cmd_help,
             'stats': mairu_commands.cmd_stats,
+            'cache': mairu_commands.cmd_cache,
             'lie': mairu_commands.cmd_lie,
         }
 
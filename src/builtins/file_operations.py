@@ -4,7 +4,6 @@ File operation commands for MairuCLI.
 Provides file management commands: ls, cat, touch, mkdir
 """
 
-import subprocess
 import sys
 from pathlib import Path
 from typing import List
@@ -28,6 +27,8 @@ def cmd_ls(args: List[str]) -> bool:
         # Unix: use ls
         cmd = ["ls", "--color=auto"] + args
 
+    import subprocess
+
     try:
         subprocess.run(cmd, check=False)
     except Exception as e:
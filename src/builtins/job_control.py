@@ -0,0 +1,129 @@
+"""
+Job control commands for MairuCLI.
+
+Provides commands for background jobs (`command &`): jobs, fg, wait
+"""
+
+from typing import List
+
+
+def _parse_job_spec(name: str, spec: str):
+    """
+    Find the job a `%n` (or `n`) argument refers to.
+
+    Args:
+        name: Command name (for the error message)
+        spec: Job argument
+
+    Returns:
+        Job, or None if there is no such job (after saying so)
+    """
+    from src.jobs import get_job_table
+
+    job = None
+    number = spec[1:] if spec.startswith("%") else spec
+    if number.isdigit():
+        job = get_job_table().get(int(number))
+    if job is None:
+        print(f"{name}: {spec}: no such job")
+    return job
+
+
+def _wait_for(job) -> None:
+    """
+    Wait for a job to finish; Ctrl+C interrupts the job.
+
+    Args:
+        job: Job to wait for
+    """
+    import signal
+    from src.jobs import get_job_table
+
+    try:
+        job.finished.wait()
+    except KeyboardInterrupt:
+        # As if the job had been started in the foreground
+        get_job_table().send_signal(job, signal.SIGINT)
+        job.finished.wait(1.0)
+        print()
+
+
+def cmd_jobs(args: List[str]) -> bool:
+    """
+    List background jobs; finished ones are listed once, then forgotten.
+
+    Args:
+        args: Command arguments (ignored)
+
+    Returns:
+        True (always handled)
+    """
+    from src.jobs import get_job_table
+
+    table = get_job_table()
+    for job in table.jobs():
+        print(job.describe())
+    table.finished_jobs()
+    return True
+
+
+def cmd_fg(args: List[str]) -> bool:
+    """
+    Bring a background job to the foreground (wait for it).
+
+    Its output keeps going to the terminal; Ctrl+C interrupts it.
+
+    Args:
+        args: Optional job (%n or n, default: the most recent job)
+
+    Returns:
+        True (always handled)
+    """
+    from src.jobs import get_job_table
+
+    table = get_job_table()
+    if args:
+        job = _parse_job_spec("fg", args[0])
+    else:
+        job = table.get()
+        if job is None:
+            print("fg: no current job")
+    if job is None:
+        return True
+
+    print(job.command)
+    _wait_for(job)
+    if job.finished.is_set() and not job.not_found:
+        # Ended in the foreground: nothing left to report at the prompt
+        table.remove(job)
+    return True
+
+
+def cmd_wait(args: List[str]) -> bool:
+    """
+    Wait for background jobs to finish.
+
+    They are reported as done at the next prompt.
+
+    Args:
+        args: Jobs to wait for (%n or n, default: all of them)
+
+    Returns:
+        True (always handled)
+    """
+    from src.jobs import get_job_table
+
+    table = get_job_table()
+    if args:
+        jobs = [job for job in (_parse_job_spec("wait", spec)
+                                for spec in args) if job is not None]
+    else:
+        jobs = table.jobs()
+
+    try:
+        for job in jobs:
+            job.finished.wait()
+    except KeyboardInterrupt:
+        # Stop waiting; the jobs keep running
+        print()
+    return True
@@ -1,13 +1,14 @@
 """
 MairuCLI-specific commands.
 
-Provides MairuCLI-specific commands: help, stats
+Provides MairuCLI-specific commands: help, stats, cache
 """
 
 import json
 from pathlib import Path
 from typing import List, Dict
 from src.config import DISPLAY_SEPARATOR_WIDTH
+from src.content_store import get_content_store
 from src.project_paths import get_data_dir, get_builtins_dir
 
 
@@ -46,10 +47,7 @@ class HelpGenerator:
             Dictionary of patterns
         """
         try:
-            file_path = self.data_dir / filename
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return data.get(key, {})
+            return get_content_store().section(self.data_dir / filename, key, {})
         except (FileNotFoundError, json.JSONDecodeError):
             return {}
 
@@ -140,9 +138,7 @@ class HelpGenerator:
         builtin_path = self.builtins_dir / "builtin_commands.json"
 
         try:
-            with open(builtin_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return data.get('categories', {})
+            return get_content_store().section(builtin_path, 'categories', {})
         except FileNotFoundError:
             print(f"Warning: {builtin_path} not found.")
             return {}
@@ -296,6 +292,15 @@ def cmd_stats(args: List[str]) -> bool:
                 print(f"  {colorize('✓', 'green')} {achievement}")
             print()
 
+    # Display verdict cache effectiveness
+    from src.verdict_cache import get_verdict_cache
+    cache = get_verdict_cache().get_stats()
+    print(f"⚡ {colorize('Verdict cache:', 'purple')} "
+          f"{cache['hits']} hits, {cache['misses']} misses "
+          f"({cache['hit_rate']:.0%} hit rate), "
+          f"{cache['entries']}/{cache['max_entries']} commands cached")
+    print()
+
     # Show encouraging message based on activity
     if total_saves >= 10:
         msg = "🏆 Wow! You really like living dangerously!"
@@ -313,6 +318,59 @@ def cmd_stats(args: List[str]) -> bool:
     return True
 
 
+def cmd_cache(args: List[str]) -> bool:
+    """
+    Show or clear the verdict caches.
+
+    Usage: cache [stats|clear]
+
+    Args:
+        args: Optional subcommand (default: stats)
+
+    Returns:
+        True (always handled)
+    """
+    from src.display import colorize
+    from src.verdict_cache import get_verdict_cache
+    from src.verdict_store import get_verdict_store
+
+    action = args[0] if args else "stats"
+    memory = get_verdict_cache()
+    store = get_verdict_store()
+
+    if action == "clear":
+        memory.clear()
+        if store is not None:
+            store.clear()
+        print(colorize("🧹 Verdict caches cleared.", "green"))
+        return True
+
+    if action != "stats":
+        print("Usage: cache [stats|clear]")
+        return True
+
+    cache = memory.get_stats()
+    print(f"⚡ {colorize('Session cache:', 'purple')} "
+          f"{cache['hits']} hits, {cache['misses']} misses "
+          f"({cache['hit_rate']:.0%} hit rate), "
+          f"{cache['entries']}/{cache['max_entries']} commands")
+
+    if store is None:
+        print(f"💾 {colorize('Verdict store:', 'purple')} "
+              "disabled (MAIRU_NO_CACHE)")
+        return True
+
+    stored = store.get_stats()
+    print(f"💾 {colorize('Verdict store:', 'purple')} "
+          f"{stored['hits']} hits, {stored['misses']} misses, "
+          f"{stored['entries']} commands for this version "
+          f"({stored['total_entries']}/{stored['max_entries']} total, "
+          f"{stored['size_bytes'] / 1024:.0f} KB)")
+    print(f"   {stored['path']}")
+
+    return True
+
+
 def cmd_lie(args: List[str]) -> bool:
     """
     Tell a harmless lie (educational about misinformation).
@@ -479,9 +537,7 @@ def _load_opposites() -> Dict[str, str]:
     opposites_path = get_builtins_dir() / "lie_opposites.json"
 
     try:
-        with open(opposites_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data.get('opposites', {})
+        return get_content_store().section(opposites_path, 'opposites', {})
     except (FileNotFoundError, json.JSONDecodeError):
         # Return empty dict if file not found or invalid
         return {}
@@ -6,7 +6,6 @@ Provides search and find commands: find, grep, which
 
 import os
 import re
-import sys
 from pathlib import Path
 from typing import List
 
@@ -163,41 +162,26 @@ def cmd_which(args: List[str]) -> bool:
 
     # Import here to avoid circular dependency
     from src.builtins import BuiltinCommands
+    from src.path_index import get_path_index
 
-    path_env = os.environ.get('PATH', '')
-    path_dirs = path_env.split(os.pathsep)
+    path_index = get_path_index()
 
     for cmd_name in args:
-        found = False
-
         # Check if it's a builtin first
         if BuiltinCommands.is_builtin(cmd_name):
             print(f"{colorize(cmd_name, 'green')}: MairuCLI builtin command")
-            found = True
             continue
 
-        # Search in PATH
-        for path_dir in path_dirs:
-            if sys.platform == "win32":
-                # Windows: check with common extensions
-                for ext in ['', '.exe', '.bat', '.cmd', '.com']:
-                    cmd_path = Path(path_dir) / f"{cmd_name}{ext}"
-                    if cmd_path.is_file():
-                        print(f"{colorize(cmd_name, 'green')}: {cmd_path}")
-                        found = True
-                        break
-            else:
-                # Unix: check without extension
-                cmd_path = Path(path_dir) / cmd_name
-                if cmd_path.is_file() and os.access(cmd_path, os.X_OK):
-                    print(f"{colorize(cmd_name, 'green')}: {cmd_path}")
-                    found = True
-                    break
-
-            if found:
-                break
-
-        if not found:
+        if os.path.dirname(cmd_name):
+            # A path is not searched for, only checked
+            cmd_path = cmd_name if os.path.isfile(cmd_name) and \
+                os.access(cmd_name, os.X_OK) else None
+        else:
+            # Look up the PATH index instead of probing every directory
+            cmd_path = path_index.lookup(cmd_name)
+        if cmd_path:
+            print(f"{colorize(cmd_name, 'green')}: {cmd_path}")
+        else:
             print(f"{EMOJI['ghost']} {cmd_name}: not found in PATH")
 
     return True
@@ -6,11 +6,13 @@ Provides utility commands: echo, clear, history, alias
 
 import os
 import sys
-from typing import List
+from typing import Dict, List
 
 
 # Shared state for history
 _history: List[str] = []
+# Times each command name was entered (first word of history entries)
+_command_counts: Dict[str, int] = {}
 
 
 def cmd_echo(args: List[str]) -> bool:
@@ -138,6 +140,9 @@ def add_to_history(command: str) -> None:
         command: Command to add to history
     """
     _history.append(command)
+    words = command.split()
+    if words:
+        _command_counts[words[0]] = _command_counts.get(words[0], 0) + 1
 
 
 def get_history() -> List[str]:
@@ -148,3 +153,16 @@ def get_history() -> List[str]:
         List of commands in history
     """
     return _history.copy()
+
+
+def get_command_count(name: str) -> int:
+    """
+    Get how many times a command name was entered this session.
+
+    Args:
+        name: Command name
+
+    Returns:
+        Number of history entries starting with the name
+    """
+    return _command_counts.get(name, 0)
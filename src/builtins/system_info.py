@@ -6,8 +6,6 @@ Provides system info commands: whoami, date, hostname, env, export
 
 import os
 import getpass
-import datetime
-import socket
 from typing import List
 
 
@@ -42,6 +40,7 @@ def cmd_date(args: List[str]) -> bool:
     Returns:
         True (always handled)
     """
+    import datetime
     from src.display import colorize
 
     now = datetime.datetime.now()
@@ -61,6 +60,7 @@ def cmd_hostname(args: List[str]) -> bool:
     Returns:
         True (always handled)
     """
+    import socket
     from src.display import colorize
 
     try:
@@ -2,13 +2,14 @@
 Command parser module for MairuCLI system directory protection.
 
 This module provides utilities to parse commands and extract file paths
-for protection checking.
+for protection checking. Tokenizing is done by src.shell_lexer, so every
+layer shares one cached parse of each command.
 """
 
 import re
-import shlex
-from typing import List, Dict, Any, Optional
-from src.config import DISPLAY_MIN_QUOTE_LENGTH
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from src.shell_lexer import PARSE_CACHE_SIZE, Segment, parse_command
 
 
 class CommandParser:
@@ -29,10 +30,32 @@ class CommandParser:
         "ln": {"path_positions": [0, 1], "has_options": True},  # source, dest
     }
 
+    # Commands that run a command given in their arguments (sudo rm ...)
+    WRAPPER_COMMANDS = frozenset({
+        "sudo", "doas", "env", "nohup", "nice", "ionice", "time", "timeout",
+        "exec", "command", "builtin", "xargs", "watch", "strace", "chroot",
+    })
+
+    # find options followed by a command
+    EXEC_OPTIONS = frozenset({"-exec", "-execdir", "-ok", "-okdir"})
+
+    # Commands whose -c argument is a whole command line
+    SHELL_COMMANDS = frozenset({"sh", "bash", "zsh", "dash", "ksh", "fish", "su"})
+
+    # Nested command lines (sh -c, eval, backquotes) are parsed this deep
+    MAX_NESTING = 3
+
+    # Characters that make an argument a possible command line of its own
+    # (echo "rm -rf /" | sh, ssh host "rm -rf /", watch "rm -rf /")
+    COMMAND_LINE_CHARS = frozenset(" \t\n;|&")
+
     def parse(self, command: str) -> Dict[str, Any]:
         """
         Parse command to extract operation and target paths.
 
+        Only the first simple command is described; use extract_all_paths
+        for chained commands.
+
         Args:
             command: Full command string
 
@@ -44,7 +67,8 @@ class CommandParser:
                 - has_redirect: bool
                 - redirect_target: Optional[str]
         """
-        if not command or not command.strip():
+        segments = parse_command(command).segments
+        if not segments or not segments[0].argv:
             return {
                 "command": "",
                 "paths": [],
@@ -53,54 +77,196 @@ class CommandParser:
                 "redirect_target": None
             }
 
-        try:
-            # Check for output redirection first
-            redirect_target = self._check_redirect(command)
-
-            # Split command into parts
-            # On Windows, use posix=False to preserve backslashes
-            import sys
-            posix_mode = sys.platform != 'win32'
-            parts = shlex.split(command, posix=posix_mode)
-            if not parts:
-                return {
-                    "command": "",
-                    "paths": [],
-                    "operation": "",
-                    "has_redirect": False,
-                    "redirect_target": None
-                }
-
-            cmd = parts[0]
-            args = parts[1:]
-
-            # Extract paths based on command type
-            paths = self._extract_paths(cmd, args)
-
-            # Strip quotes from paths if present (Windows with posix=False)
-            paths = [self._strip_quotes(p) for p in paths]
-
-            # Add redirect target if present
-            if redirect_target:
-                paths.append(redirect_target)
+        segment = segments[0]
+        cmd = segment.argv[0]
+        paths = self._segment_paths(segment)
+        redirect_target = self._first_output_target(segment)
+
+        return {
+            "command": cmd,
+            "paths": paths,
+            "operation": self._get_operation_type(cmd),
+            "has_redirect": redirect_target is not None,
+            "redirect_target": redirect_target
+        }
 
-            return {
-                "command": cmd,
-                "paths": paths,
-                "operation": self._get_operation_type(cmd),
-                "has_redirect": redirect_target is not None,
-                "redirect_target": redirect_target
-            }
+    @staticmethod
+    def command_name(word: str) -> str:
+        """
+        Get the program name of a command word (/bin/rm -> rm).
 
-        except Exception:
-            # If parsing fails, return empty result (fail-safe)
-            return {
-                "command": "",
-                "paths": [],
-                "operation": "",
-                "has_redirect": False,
-                "redirect_target": None
-            }
+        Args:
+            word: First word of a simple command
+
+        Returns:
+            Word without its directory
+        """
+        return word[max(word.rfind("/"), word.rfind("\\")) + 1:]
+
+    def simple_commands(self, command: str) -> Tuple[Segment, ...]:
+        """
+        List every simple command a command line runs.
+
+        Besides the segments of the command line itself (pipeline stages,
+        chained and subshell commands) this includes commands run through
+        wrappers (sudo rm ..., find -exec rm ...) and nested command lines
+        (sh -c "...", eval, backquotes). Every argument after a wrapper is
+        treated as a possible command word, which errs on the side of
+        checking too much.
+
+        Args:
+            command: Full command string
+
+        Returns:
+            Segments whose argv starts at a command word; redirections stay
+            with the outermost command of each segment
+        """
+        return _simple_commands(command)
+
+    def _expand(self, command: str, depth: int) -> List[Segment]:
+        """
+        Expand one command line into simple commands (see simple_commands).
+
+        Args:
+            command: Full command string
+            depth: Nesting level of command
+
+        Returns:
+            List of segments
+        """
+        commands = []
+        for segment in parse_command(command).segments:
+            argv = segment.argv
+            if not argv:
+                # Redirection only (e.g. "> /etc/passwd")
+                commands.append(segment)
+                continue
+
+            positions = self._command_positions(argv)
+            for position in positions:
+                commands.append(segment._replace(
+                    argv=argv[position:],
+                    redirects=segment.redirects if position == 0 else ()
+                ))
+
+            if depth < self.MAX_NESTING:
+                for nested in self._nested_command_lines(segment, positions):
+                    commands.extend(self._expand(nested, depth + 1))
+
+        return commands
+
+    def _command_positions(self, argv: tuple) -> List[int]:
+        """
+        Find the argv indices that start a command.
+
+        Args:
+            argv: Arguments of one segment
+
+        Returns:
+            Sorted indices (always including 0)
+        """
+        positions = [0]
+        if self.command_name(argv[0]) in self.WRAPPER_COMMANDS:
+            positions.extend(i for i in range(1, len(argv))
+                             if not argv[i].startswith("-"))
+        for i, word in enumerate(argv[:-1]):
+            if word in self.EXEC_OPTIONS and i + 1 not in positions:
+                positions.append(i + 1)
+        return sorted(positions)
+
+    def _nested_command_lines(self, segment: Segment,
+                              positions: List[int]) -> List[str]:
+        """
+        Get command lines passed as arguments (sh -c, eval, backquotes,
+        $(...), here-strings and quoted arguments).
+
+        Any argument that reads as a command line (one with spaces or
+        chain operators once quotes are removed) is checked as one, since
+        a shell or another program may run it: echo "rm -rf /" | sh,
+        ssh host "rm -rf /", alias x='rm -rf /'. The value of an
+        assignment counts too (cmd="dd if=...").
+
+        Args:
+            segment: One segment (argv is non-empty)
+            positions: Indices of command words in argv
+
+        Returns:
+            Nested command lines
+        """
+        argv = segment.argv
+        nested = []
+        for position in positions:
+            args = argv[position + 1:]
+            if self.command_name(argv[position]) == "eval" and args:
+                nested.append(" ".join(args))
+
+        # Shells anywhere in argv (docker exec c sh -c ..., runuser -- sh)
+        for position, word in enumerate(argv):
+            if self.command_name(word) in self.SHELL_COMMANDS:
+                script = self._shell_script(argv[position + 1:])
+                if script is not None:
+                    nested.append(script)
+
+        for word in argv:
+            value = word.split("=", 1)[1] if _ASSIGNMENT.match(word) else word
+            if not self.COMMAND_LINE_CHARS.isdisjoint(value):
+                nested.append(value)
+        nested.extend(redirect.target for redirect in segment.redirects
+                      if redirect.op == "<<<")
+
+        if any("`" in word for word in argv):
+            nested.extend(" ".join(argv).split("`")[1::2])
+        for word in argv:
+            if "$(" in word:
+                nested.extend(_substitution_bodies(word))
+        return nested
+
+    @staticmethod
+    def _shell_script(args: tuple) -> Optional[str]:
+        """
+        Get the -c command line of a shell's arguments.
+
+        Args:
+            args: Arguments after the shell name
+
+        Returns:
+            The argument after -c (or a combined flag such as -lc, and an
+            optional --), or None if there is none
+        """
+        for i, arg in enumerate(args[:-1]):
+            if arg.startswith("-") and not arg.startswith("--") \
+                    and "c" in arg:
+                rest = args[i + 1:]
+                if rest[0] == "--":
+                    rest = rest[1:]
+                return rest[0] if rest else None
+        return None
+
+    def _segment_paths(self, segment: Segment) -> List[str]:
+        """
+        Get the paths a simple command touches.
+
+        Args:
+            segment: Segment from parse_command
+
+        Returns:
+            Paths from the arguments, then output redirection targets
+        """
+        paths = []
+        if segment.argv:
+            paths = self._extract_paths(self.command_name(segment.argv[0]),
+                                        list(segment.argv[1:]))
+        paths.extend(redirect.target for redirect in segment.redirects
+                     if redirect.writes_file)
+        return paths
+
+    @staticmethod
+    def _first_output_target(segment: Segment) -> Optional[str]:
+        """Get the first file a segment writes by redirection, if any."""
+        for redirect in segment.redirects:
+            if redirect.writes_file:
+                return redirect.target
+        return None
 
     def _extract_paths(self, cmd: str, args: List[str]) -> List[str]:
         """
@@ -167,31 +333,6 @@ class CommandParser:
 
         return paths
 
-    def _check_redirect(self, command: str) -> Optional[str]:
-        """
-        Check for output redirection and extract target file.
-
-        Args:
-            command: Full command string
-
-        Returns:
-            Redirect target path if found, None otherwise
-        """
-        # Match > or >> followed by a file path
-        # Handle quoted paths
-        quoted_pattern = r'(?:>>?)\s+["\']([^"\']+)["\']'
-        match = re.search(quoted_pattern, command)
-        if match:
-            return match.group(1)
-
-        # Handle unquoted paths
-        unquoted_pattern = r'(?:>>?)\s+([^\s]+)'
-        match = re.search(unquoted_pattern, command)
-        if match:
-            return match.group(1)
-
-        return None
-
     def _get_operation_type(self, cmd: str) -> str:
         """
         Determine the type of operation being performed.
@@ -222,8 +363,8 @@ class CommandParser:
         """
         Convenience method to extract all paths from a command.
 
-        Handles command chaining (;, &&, ||, |) by splitting and parsing
-        each sub-command separately.
+        Handles command chaining (;, &&, ||, |, &), subshells, wrappers
+        such as sudo and nested command lines (see simple_commands).
 
         Args:
             command: Full command string (may contain chained commands)
@@ -232,86 +373,10 @@ class CommandParser:
             List of all file paths found in the command
         """
         all_paths = []
-
-        # Split by command chaining operators
-        # Handle: ; && || |
-        sub_commands = self._split_chained_commands(command)
-
-        # Parse each sub-command
-        for sub_cmd in sub_commands:
-            parsed = self.parse(sub_cmd)
-            all_paths.extend(parsed["paths"])
-
+        for segment in self.simple_commands(command):
+            all_paths.extend(self._segment_paths(segment))
         return all_paths
 
-    def _split_chained_commands(self, command: str) -> List[str]:
-        """
-        Split command string by chaining operators.
-
-        Handles: ; && || |
-
-        Args:
-            command: Full command string
-
-        Returns:
-            List of individual commands
-        """
-        import re
-
-        # Split by chaining operators while preserving quoted strings
-        # Pattern matches: ; or && or || or |
-        # But not inside quotes
-        parts = []
-        current = []
-        in_quotes = False
-        quote_char = None
-        i = 0
-
-        while i < len(command):
-            char = command[i]
-
-            # Handle quotes
-            if char in ['"', "'"]:
-                if not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                elif char == quote_char:
-                    in_quotes = False
-                    quote_char = None
-                current.append(char)
-                i += 1
-                continue
-
-            # Handle operators (only outside quotes)
-            if not in_quotes:
-                # Check for && or ||
-                if i + 1 < len(command):
-                    two_char = command[i:i+2]
-                    if two_char in ['&&', '||']:
-                        if current:
-                            parts.append(''.join(current).strip())
-                            current = []
-                        i += 2
-                        continue
-
-                # Check for ; or |
-                if char in [';', '|']:
-                    if current:
-                        parts.append(''.join(current).strip())
-                        current = []
-                    i += 1
-                    continue
-
-            current.append(char)
-            i += 1
-
-        # Add remaining
-        if current:
-            parts.append(''.join(current).strip())
-
-        # Filter out empty parts
-        return [p for p in parts if p]
-
     def extract_redirection_target(self, command: str) -> Optional[str]:
         """
         Extract output redirection target from command.
@@ -336,20 +401,49 @@ class CommandParser:
             >>> parser.extract_redirection_target("ls -la")
             None
         """
-        return self._check_redirect(command)
-
-    def _strip_quotes(self, path: str) -> str:
-        """
-        Strip surrounding quotes from path.
-
-        Args:
-            path: Path that may have surrounding quotes
-
-        Returns:
-            Path with quotes removed
-        """
-        if len(path) >= DISPLAY_MIN_QUOTE_LENGTH:
-            if (path[0] == '"' and path[-1] == '"') or \
-               (path[0] == "'" and path[-1] == "'"):
-                return path[1:-1]
-        return path
+        targets = parse_command(command).output_targets
+        return targets[0] if targets else None
+
+
+# NAME=value word (shell assignment, alias definition)
+_ASSIGNMENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*=")
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _simple_commands(command: str) -> Tuple[Segment, ...]:
+    """Cached CommandParser.simple_commands (the result is immutable)."""
+    return tuple(CommandParser()._expand(command, 0))
+
+
+def _substitution_bodies(word: str) -> List[str]:
+    """
+    Get the command lines of the $(...) substitutions in a word.
+
+    Quotes are already removed from argv words, so this also finds
+    substitutions that were inside double quotes (which the shell runs).
+    Nested substitutions stay in their outer body and are found when it
+    is expanded in turn.
+
+    Args:
+        word: One argv word
+
+    Returns:
+        Bodies of the outermost substitutions (an unterminated one runs to
+        the end of the word)
+    """
+    bodies = []
+    start = word.find("$(")
+    while start != -1:
+        depth = 0
+        end = len(word)
+        for i in range(start + 1, len(word)):
+            if word[i] == "(":
+                depth += 1
+            elif word[i] == ")":
+                depth -= 1
+                if depth == 0:
+                    end = i
+                    break
+        bodies.append(word[start + 2:end])
+        start = word.find("$(", end)
+    return bodies
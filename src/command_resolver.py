@@ -0,0 +1,108 @@
+"""
+Command resolution for MairuCLI.
+
+Decides before execution whether the first word of a command is
+something the system shell can run: a MairuCLI builtin (including the
+builtin aliases such as dir, cls and quit), a shell builtin or keyword,
+or an executable in the PATH index. A command that is none of these is
+reported as not found right away instead of starting a shell that can
+only fail.
+
+Whenever the shell itself decides what runs (expansions, assignments,
+explicit paths, chained commands, redirections), the command is left
+unresolved and handed to the shell as before.
+
+Aliases and shell functions are not known here. An unknown name is only
+reported as not found for a fresh non-interactive /bin/sh, which has
+none; for a shell that may define them (the persistent shell), it is
+left unresolved and the shell's exit status 127 decides.
+
+A name missing from the PATH index is confirmed with shutil.which before
+it is reported, so a command installed or made executable a moment ago
+is never turned away.
+"""
+
+import os
+import shutil
+import sys
+from typing import NamedTuple
+
+from src.builtins import BuiltinCommands
+from src.path_index import get_path_index
+from src.shell_lexer import parse_command
+from src.typo_index import SHELL_WORDS
+
+# Resolution kinds
+RESOLVED_BUILTIN = "builtin"
+RESOLVED_SHELL = "shell"
+RESOLVED_PATH = "path"
+UNRESOLVED = "unresolved"
+NOT_FOUND = "not_found"
+
+# Characters of a command word looked up by name; anything else ($VAR,
+# globs, quotes, paths, assignments) is resolved by the shell
+_NAME_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_+-."
+)
+
+
+class Resolution(NamedTuple):
+    """What the first word of a command refers to."""
+
+    kind: str        # RESOLVED_*, UNRESOLVED or NOT_FOUND
+    name: str        # Command word ("" if there is none)
+    target: str = ""  # Executable path (RESOLVED_PATH only)
+
+
+def _in_working_directory(name: str) -> bool:
+    """Check whether cmd.exe would run a file from the current directory."""
+    if sys.platform != "win32":
+        return False
+    extensions = os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD")
+    return any(
+        os.path.isfile(name + extension)
+        for extension in [""] + extensions.split(os.pathsep)
+    )
+
+
+def resolve_command(command: str,
+                    shell_definitions: bool = False) -> Resolution:
+    """
+    Resolve the command word of a command line without running it.
+
+    Args:
+        command: Command line (as passed to the system shell)
+        shell_definitions: True if the shell may have aliases or functions
+            (the persistent shell); unknown names are then UNRESOLVED
+
+    Returns:
+        Resolution; UNRESOLVED when only the shell can tell
+    """
+    parsed = parse_command(command)
+    if len(parsed.segments) != 1 or parsed.unterminated_quote:
+        return Resolution(UNRESOLVED, "")
+
+    segment = parsed.segments[0]
+    if not segment.argv or segment.redirects or segment.operator:
+        return Resolution(UNRESOLVED, "")
+
+    name = segment.argv[0]
+    if not name or not _NAME_CHARS.issuperset(name):
+        return Resolution(UNRESOLVED, name)
+
+    if BuiltinCommands.is_builtin(name):
+        return Resolution(RESOLVED_BUILTIN, name)
+    folded = name.lower() if sys.platform == "win32" else name
+    if folded in SHELL_WORDS:
+        return Resolution(RESOLVED_SHELL, name)
+
+    target = get_path_index().lookup(name)
+    if target:
+        return Resolution(RESOLVED_PATH, name, target)
+    if shell_definitions or _in_working_directory(name):
+        return Resolution(UNRESOLVED, name)
+    # The index may be stale; ask the filesystem before saying "not found"
+    target = shutil.which(name)
+    if target:
+        return Resolution(RESOLVED_PATH, name, target)
+    return Resolution(NOT_FOUND, name)
@@ -7,19 +7,18 @@ Timing Constants (Day 8 - Adjusted for dramatic effect):
 - TIMING_ASCII_CHAR_DELAY: Delay between ASCII art lines (0.08s)
 - TIMING_PAUSE_SHORT: Short pause after art/achievements (0.5s)
 - TIMING_PAUSE_MEDIUM: Medium pause before explanations (1.0s)
+Delays go through display.render_scheduler: any key skips them, and they
+are left out when not running in a terminal.
 
 Display Constants:
 - DISPLAY_SEPARATOR_WIDTH: Width of separator lines (60 chars)
 - DISPLAY_MIN_QUOTE_LENGTH: Minimum length for quoted strings (2 chars)
 
 Configuration:
-- MairuConfig: Dataclass for user preferences (colors, behavior, etc.)
+- MairuConfig: User preferences (colors, behavior, etc.)
 - Currently uses default values (file loading not implemented in MVP)
 """
 
-from dataclasses import dataclass
-
-
 # Timing constants (in seconds)
 # Day 8: Adjusted for more dramatic effect (demo-friendly)
 TIMING_ASCII_CHAR_DELAY = 0.08  # Delay between ASCII art characters (was 0.05)
@@ -31,24 +30,48 @@ DISPLAY_SEPARATOR_WIDTH = 60    # Width of separator lines (=====)
 DISPLAY_MIN_QUOTE_LENGTH = 2    # Minimum length for quoted strings in command parser
 
 
-@dataclass
 class MairuConfig:
-    """Configuration for MairuCLI."""
-
-    # Color settings
-    colors_enabled: bool = True
-    color_scheme: str = "halloween"  # Future: support other themes
-
-    # Display settings
-    show_ascii_art: bool = True
-    show_educational_messages: bool = True
+    """
+    Configuration for MairuCLI.
 
-    # Behavior settings
-    intercept_dangerous: bool = True
-    intercept_typos: bool = True
+    A plain class rather than a @dataclass: this module is imported before
+    the first prompt, and importing dataclasses (which pulls in inspect)
+    cost more than everything else in it.
+    """
 
-    # Performance settings
-    pattern_match_timeout_ms: int = 50
+    def __init__(
+        self,
+        colors_enabled: bool = True,
+        color_scheme: str = "halloween",  # Future: support other themes
+        show_ascii_art: bool = True,
+        show_educational_messages: bool = True,
+        intercept_dangerous: bool = True,
+        intercept_typos: bool = True,
+        pattern_match_timeout_ms: int = 50
+    ):
+        # Color settings
+        self.colors_enabled = colors_enabled
+        self.color_scheme = color_scheme
+
+        # Display settings
+        self.show_ascii_art = show_ascii_art
+        self.show_educational_messages = show_educational_messages
+
+        # Behavior settings
+        self.intercept_dangerous = intercept_dangerous
+        self.intercept_typos = intercept_typos
+
+        # Performance settings
+        self.pattern_match_timeout_ms = pattern_match_timeout_ms
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MairuConfig):
+            return NotImplemented
+        return vars(self) == vars(other)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in vars(self).items())
+        return f"MairuConfig({fields})"
 
 
 # Global config instance
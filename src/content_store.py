@@ -0,0 +1,92 @@
+"""
+Shared content store for MairuCLI.
+
+Warning catalogs, variations, help and command lists live in JSON files
+under data/ that several parts of MairuCLI read: the interceptor (when
+the pattern bundle is rebuilt), the display components and help. Each
+file is parsed once per process here and the parsed object is shared by
+every reader. A file is parsed again only if its mtime or size changed.
+
+Parsed objects are shared, so readers must not modify them (copy what
+needs changing).
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+# (mtime_ns, size) of a file when it was parsed
+_Stamp = Tuple[int, int]
+
+
+class ContentStore:
+    """JSON data files, parsed on first use and shared."""
+
+    def __init__(self):
+        """Initialize an empty store (files are parsed when first read)."""
+        self._files: Dict[str, Tuple[_Stamp, Any]] = {}
+
+    def load(self, path: Union[str, Path]) -> Any:
+        """
+        Get the parsed contents of a JSON file.
+
+        Args:
+            path: File path
+
+        Returns:
+            Parsed JSON (shared: do not modify)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._files.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        with open(key, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self._files[key] = (stamp, data)
+        return data
+
+    def section(self, path: Union[str, Path], name: str,
+                default: Any = None) -> Any:
+        """
+        Get one top-level section of a JSON file.
+
+        Args:
+            path: File path
+            name: Top-level key (e.g. "warnings", "categories")
+            default: Value if the file has no such section
+
+        Returns:
+            The section (shared: do not modify)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        data = self.load(path)
+        if not isinstance(data, dict):
+            return default
+        return data.get(name, default)
+
+    def clear(self) -> None:
+        """Forget every parsed file."""
+        self._files.clear()
+
+
+_store: Optional[ContentStore] = None
+
+
+def get_content_store() -> ContentStore:
+    """Get the process-wide content store."""
+    global _store
+    if _store is None:
+        _store = ContentStore()
+    return _store
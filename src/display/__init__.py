@@ -5,37 +5,108 @@ This module provides the public API for the display system.
 Internal implementation uses modular components from display/ subdirectory.
 """
 
-from typing import Dict
-from src.display.ascii_renderer import AsciiRenderer
-from src.display.content_loader import ContentLoader
-from src.display.message_formatter import MessageFormatter
-from src.display.statistics import Statistics
-from src.display.achievements import AchievementTracker
+import importlib
+from typing import Any, Dict, Tuple
+
 from src.project_paths import get_ascii_art_dir
-from src.display.warning_components import (
-    DangerWarning,
-    TypoWarning,
-    RepeatWarning,
-    EMOJI
-)
-from src.display.caution_warning import CautionWarning
-from src.display.system_protection_warning import SystemProtectionWarning
-from src.display.educational_breakdown import EducationalBreakdown
-
-# Initialize components
-_renderer = AsciiRenderer()
-_content_loader = ContentLoader()
-_formatter = MessageFormatter()
-_statistics = Statistics()
-_achievement_tracker = AchievementTracker(_statistics)
-
-# Initialize warning components
-_danger_warning = DangerWarning(_renderer, _formatter, _content_loader)
-_typo_warning = TypoWarning(_renderer, _formatter, _content_loader)
-_repeat_warning = RepeatWarning(_renderer, _formatter, _content_loader)
-_caution_warning = CautionWarning(_renderer)
-_system_protection_warning = SystemProtectionWarning(_renderer)
-_educational_breakdown = EducationalBreakdown()
+
+# Components are created on first use instead of at import time.
+# Most sessions never show a warning, so importing the warning modules
+# and loading their content up front only delays the first prompt.
+_components: Dict[str, Any] = {}
+
+# Names re-exported from submodules, imported when first accessed
+_LAZY_EXPORTS = {
+    "AsciiRenderer": "src.display.ascii_renderer",
+    "ContentLoader": "src.display.content_loader",
+    "MessageFormatter": "src.display.message_formatter",
+    "Statistics": "src.display.statistics",
+    "AchievementTracker": "src.display.achievements",
+    "DangerWarning": "src.display.warning_components",
+    "TypoWarning": "src.display.warning_components",
+    "RepeatWarning": "src.display.warning_components",
+    "EMOJI": "src.display.warning_components",
+    "CautionWarning": "src.display.caution_warning",
+    "SystemProtectionWarning": "src.display.system_protection_warning",
+    "EducationalBreakdown": "src.display.educational_breakdown",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve re-exported names on first access (PEP 562).
+
+    Args:
+        name: Attribute being looked up on this module
+
+    Returns:
+        The attribute from its submodule
+
+    Raises:
+        AttributeError: If name is not a known export
+    """
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+# Display components: name -> (module, factory, components passed to it).
+# The factory is a class, or a function returning a shared instance.
+_COMPONENT_FACTORIES: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "renderer": ("src.display.ascii_renderer", "AsciiRenderer", ()),
+    "content_loader": ("src.display.content_loader", "ContentLoader", ()),
+    "formatter": ("src.display.message_formatter", "MessageFormatter", ()),
+    "statistics": ("src.display.statistics", "Statistics", ()),
+    "achievement_tracker": (
+        "src.display.achievements", "AchievementTracker", ("statistics",)
+    ),
+    "danger_warning": (
+        "src.display.warning_components", "DangerWarning",
+        ("renderer", "formatter", "content_loader")
+    ),
+    "typo_warning": (
+        "src.display.warning_components", "TypoWarning",
+        ("renderer", "formatter", "content_loader")
+    ),
+    "repeat_warning": (
+        "src.display.warning_components", "RepeatWarning",
+        ("renderer", "formatter", "content_loader")
+    ),
+    "caution_warning": (
+        "src.display.caution_warning", "CautionWarning", ("renderer",)
+    ),
+    "system_protection_warning": (
+        "src.display.system_protection_warning", "SystemProtectionWarning",
+        ("renderer",)
+    ),
+    # Share the instance used by show_educational_mode()
+    "educational_breakdown": (
+        "src.display.educational_breakdown", "get_educational_breakdown", ()
+    ),
+}
+
+
+def _component(name: str) -> Any:
+    """
+    Get a display component, creating it on first use.
+
+    Args:
+        name: Component name (key of _COMPONENT_FACTORIES)
+
+    Returns:
+        Shared component instance
+    """
+    component = _components.get(name)
+    if component is None:
+        module, factory, dependencies = _COMPONENT_FACTORIES[name]
+        create = getattr(importlib.import_module(module), factory)
+        component = create(*(_component(dependency)
+                             for dependency in dependencies))
+        _components[name] = component
+    return component
 
 
 def colorize(text: str, color_name: str) -> str:
@@ -49,7 +120,7 @@ def colorize(text: str, color_name: str) -> str:
     Returns:
         Colorized text with reset code
     """
-    return _renderer.colorize(text, color_name)
+    return _component("renderer").colorize(text, color_name)
 
 
 def display_welcome_banner() -> None:
@@ -98,6 +169,8 @@ def display_goodbye_message() -> None:
     """
     Display goodbye message when user exits.
     """
+    from src.display.warning_components import EMOJI
+
     ghost = EMOJI['ghost']
     thanks = colorize("Thanks for using MairuCLI!", "purple")
     reminder = colorize("Stay safe out there, and remember:", "orange")
@@ -121,25 +194,25 @@ def show_warning(pattern_name: str, command: str) -> None:
     """
     # Update statistics
     if pattern_name.startswith("typo_"):
-        _statistics.increment_typos_caught()
+        _component("statistics").increment_typos_caught()
     else:
-        _statistics.increment_dangerous_blocked()
+        _component("statistics").increment_dangerous_blocked()
 
     # Check if this command was already warned about
-    repeat_count = _statistics.track_repeat_command(command)
+    repeat_count = _component("statistics").track_repeat_command(command)
 
     if repeat_count > 1:
         # Show repeat warning
-        _repeat_warning.display(command, repeat_count)
+        _component("repeat_warning").display(command, repeat_count)
     else:
         # Show normal warning
         if pattern_name.startswith("typo_"):
-            _typo_warning.display(pattern_name, command)
+            _component("typo_warning").display(pattern_name, command)
         else:
-            _danger_warning.display(pattern_name, command)
+            _component("danger_warning").display(pattern_name, command)
 
     # Check for achievements
-    _achievement_tracker.check_achievements()
+    _component("achievement_tracker").check_achievements()
 
     # Offer educational breakdown for dangerous commands (not typos)
     if not pattern_name.startswith("typo_"):
@@ -153,7 +226,7 @@ def get_stats() -> Dict[str, int]:
     Returns:
         Dictionary with statistics
     """
-    return _statistics.get_stats()
+    return _component("statistics").get_stats()
 
 
 def track_safe_command(command: str) -> None:
@@ -163,8 +236,8 @@ def track_safe_command(command: str) -> None:
     Args:
         command: The safe command being used
     """
-    _statistics.track_safe_command(command)
-    _achievement_tracker.check_achievements()
+    _component("statistics").track_safe_command(command)
+    _component("achievement_tracker").check_achievements()
 
 
 def show_caution_warning(pattern_name: str, command: str) -> bool:
@@ -179,19 +252,19 @@ def show_caution_warning(pattern_name: str, command: str) -> bool:
         True if user wants to proceed, False to cancel
     """
     # Update statistics
-    _statistics.increment_caution_shown()
+    _component("statistics").increment_caution_shown()
 
     # Show warning and get confirmation
-    proceed = _caution_warning.display(pattern_name, command)
+    proceed = _component("caution_warning").display(pattern_name, command)
 
     # Track user decision
     if proceed:
-        _statistics.increment_caution_proceeded()
+        _component("statistics").increment_caution_proceeded()
     else:
-        _statistics.increment_caution_cancelled()
+        _component("statistics").increment_caution_cancelled()
 
     # Check for achievements
-    _achievement_tracker.check_achievements()
+    _component("achievement_tracker").check_achievements()
 
     return proceed
 
@@ -203,7 +276,7 @@ def get_unlocked_achievements() -> list:
     Returns:
         List of achievement display names
     """
-    return _achievement_tracker.get_unlocked_achievement_names()
+    return _component("achievement_tracker").get_unlocked_achievement_names()
 
 
 def get_achievements_by_category(category: str) -> list:
@@ -217,7 +290,7 @@ def get_achievements_by_category(category: str) -> list:
     Returns:
         List of achievement display names in the specified category
     """
-    return _achievement_tracker.get_achievements_by_category(category)
+    return _component("achievement_tracker").get_achievements_by_category(category)
 
 
 def show_system_protection_warning(
@@ -238,16 +311,16 @@ def show_system_protection_warning(
     """
     # Update statistics for blocked command
     if level == "critical":
-        _statistics.increment_dangerous_blocked()
+        _component("statistics").increment_dangerous_blocked()
 
     # Track system protection block
-    _statistics.track_system_protection_block(target_path)
+    _component("statistics").track_system_protection_block(target_path)
 
     # Display warning
-    result = _system_protection_warning.display(level, target_path, command)
+    result = _component("system_protection_warning").display(level, target_path, command)
 
     # Check for achievements
-    _achievement_tracker.check_achievements()
+    _component("achievement_tracker").check_achievements()
 
     return result
 
@@ -265,7 +338,7 @@ def _offer_educational_breakdown(pattern_name: str) -> None:
         return
 
     # Check if breakdown is available
-    if not _educational_breakdown.has_breakdown(pattern_name):
+    if not _component("educational_breakdown").has_breakdown(pattern_name):
         return
 
     print()
@@ -276,6 +349,6 @@ def _offer_educational_breakdown(pattern_name: str) -> None:
         response = input("> ").strip().lower()
         if response in ['breakdown', 'b', 'yes', 'y']:
             print()
-            _educational_breakdown.show_full_breakdown(pattern_name)
+            _component("educational_breakdown").show_full_breakdown(pattern_name)
     except (KeyboardInterrupt, EOFError):
         print()  # Clean exit on Ctrl+C or Ctrl+D
@@ -16,11 +16,11 @@ New achievements added in Day 8:
 - Detective: Use 'grep' or 'find' command
 """
 
-import time
 from typing import List
 from src.display.statistics import Statistics
 from src.display.ascii_renderer import AsciiRenderer
 from src.config import TIMING_PAUSE_SHORT, TIMING_PAUSE_MEDIUM, DISPLAY_SEPARATOR_WIDTH
+from src.display.render_scheduler import get_render_scheduler
 
 
 # Achievement threshold constants
@@ -261,7 +261,8 @@ class AchievementTracker:
             title: Achievement title
             description: Achievement description
         """
-        time.sleep(TIMING_PAUSE_MEDIUM)  # Pause before achievement (dramatic timing)
+        scheduler = get_render_scheduler()
+        scheduler.pause(TIMING_PAUSE_MEDIUM)  # Pause before achievement (dramatic timing)
         print()
         print("=" * DISPLAY_SEPARATOR_WIDTH)
         trophy = "🏆"
@@ -273,7 +274,7 @@ class AchievementTracker:
         print(f"  {description}")
         print("=" * DISPLAY_SEPARATOR_WIDTH)
         print()
-        time.sleep(TIMING_PAUSE_SHORT)  # Brief pause after achievement
+        scheduler.pause(TIMING_PAUSE_SHORT)  # Brief pause after achievement
 
     def get_unlocked_achievements(self) -> List[str]:
         """
@@ -2,13 +2,20 @@
 ASCII art renderer for MairuCLI display system.
 
 Handles loading and displaying ASCII art with color and timing effects.
+
+Colorized art files are cached as frames (the colored lines and their
+pre-joined text) for the session, keyed by (file, color) and checked
+against the file's mtime, so a repeated warning neither rereads the
+file nor rebuilds its ANSI strings.
 """
 
-import time
+import os
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from src.config import TIMING_ASCII_CHAR_DELAY
+from src.display.render_scheduler import get_render_scheduler
 from src.project_paths import get_ascii_art_dir
 
 
@@ -39,6 +46,9 @@ class AsciiRenderer:
             self.art_dir = get_ascii_art_dir()
         else:
             self.art_dir = Path(art_dir)
+        # (path, color) -> (mtime_ns, colored lines, joined frame)
+        self._frames: Dict[Tuple[str, str],
+                           Tuple[int, Tuple[str, ...], str]] = {}
 
     def load_art(self, filename: str) -> str:
         """
@@ -59,6 +69,38 @@ class AsciiRenderer:
         except Exception as e:
             return f"[Error loading ASCII art: {e}]"
 
+    def render_art(self, filename: str,
+                   color: str) -> Tuple[Tuple[str, ...], str]:
+        """
+        Get the colorized frame of an ASCII art file (cached).
+
+        Args:
+            filename: Name of ASCII art file
+            color: Color name from COLORS dict
+
+        Returns:
+            (colored lines, the same lines joined into one string ending
+            with a newline)
+        """
+        path = self.art_dir / filename
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            # Missing file: render the placeholder, nothing to cache
+            mtime = None
+
+        key = (str(path), color)
+        cached = self._frames.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        lines = tuple(self.colorize(line, color)
+                      for line in self.load_art(filename).split('\n'))
+        frame = '\n'.join(lines) + '\n'
+        if mtime is not None:
+            self._frames[key] = (mtime, lines, frame)
+        return lines, frame
+
     def display_art(self, art: str, color: str) -> None:
         """
         Display ASCII art with color (no timing effects).
@@ -79,15 +121,41 @@ class AsciiRenderer:
         """
         Display ASCII art line by line with dramatic effect.
 
+        Delays are skippable (see render_scheduler).
+
         Args:
             art: ASCII art string
             color: Color name for the art
             delay: Delay between lines in seconds
         """
         lines = art.split('\n')
-        for line in lines:
-            print(self.colorize(line, color))
-            time.sleep(delay)
+        get_render_scheduler().print_lines(
+            (self.colorize(line, color) for line in lines), delay
+        )
+
+    def display_art_file(
+        self,
+        filename: str,
+        color: str,
+        delay: float = TIMING_ASCII_CHAR_DELAY
+    ) -> None:
+        """
+        Display an ASCII art file line by line with dramatic effect.
+
+        Without delays (not a terminal, or skipped; see render_scheduler)
+        the cached frame is written in one go.
+
+        Args:
+            filename: Name of ASCII art file
+            color: Color name for the art
+            delay: Delay between lines in seconds
+        """
+        lines, frame = self.render_art(filename, color)
+        scheduler = get_render_scheduler()
+        if delay > 0 and scheduler.animated:
+            scheduler.print_lines(lines, delay)
+        else:
+            sys.stdout.write(frame)
 
     def colorize(self, text: str, color_name: str) -> str:
         """
@@ -4,9 +4,9 @@ Educational breakdown formatter for MairuCLI.
 Formats command breakdowns, simulations, and incident stories with Halloween theme.
 """
 
-import time
 from typing import Dict
 from src.config import DISPLAY_SEPARATOR_WIDTH
+from src.display.render_scheduler import get_render_scheduler
 
 
 class BreakdownFormatter:
@@ -21,9 +21,7 @@ class BreakdownFormatter:
             delay: Delay in seconds between lines
         """
         lines = text.split('\n')
-        for line in lines:
-            print(line)
-            time.sleep(delay)
+        get_render_scheduler().print_lines(lines, delay)
 
     def format_command_breakdown(self, breakdown: Dict) -> str:
         """
@@ -181,9 +179,9 @@ class BreakdownFormatter:
                 # Pause for dramatic effect
                 # Longer pause for critical events
                 if severity == 'critical':
-                    time.sleep(TIMING_PAUSE_SHORT * 1.5)  # 0.75s for critical
+                    get_render_scheduler().pause(TIMING_PAUSE_SHORT * 1.5)  # 0.75s for critical
                 else:
-                    time.sleep(TIMING_PAUSE_SHORT)  # 0.5s for others
+                    get_render_scheduler().pause(TIMING_PAUSE_SHORT)  # 0.5s for others
 
         # Print recovery info if available
         if 'recovery' in simulation:
@@ -2,12 +2,15 @@
 Content loader for MairuCLI display system.
 
 Loads warning messages, variations, and metadata from JSON files.
+Files are parsed through the shared content store (src/content_store.py),
+so the catalog the interceptor or help already read is not parsed again.
 """
 
 import json
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+from src.content_store import get_content_store
 from src.project_paths import get_warnings_dir
 
 
@@ -45,8 +48,7 @@ class ContentLoader:
         catalog_path = self.warnings_dir / "warning_catalog.json"
 
         try:
-            with open(catalog_path, "r", encoding="utf-8") as f:
-                self._catalog = json.load(f)
+            self._catalog = get_content_store().load(catalog_path)
             return self._catalog
         except FileNotFoundError:
             # Return fallback catalog if file doesn't exist
@@ -99,6 +101,7 @@ class ContentLoader:
         if cache_key in self._variations:
             return self._variations[cache_key]
 
+        store = get_content_store()
         merged_variations = []
 
         # Step 1: Get category variations (8 variations)
@@ -107,10 +110,7 @@ class ContentLoader:
                 self.warnings_dir / "category_variations.json"
             )
             try:
-                with open(category_vars_path, "r", encoding="utf-8") as f:
-                    category_variations = json.load(f)
-
-                categories = category_variations.get("categories", {})
+                categories = store.section(category_vars_path, "categories", {})
                 if pattern_category in categories:
                     cat_data = categories[pattern_category]
                     variations_list = cat_data["variations"]
@@ -127,10 +127,7 @@ class ContentLoader:
             self.warnings_dir / "pattern_variations.json"
         )
         try:
-            with open(pattern_vars_path, "r", encoding="utf-8") as f:
-                pattern_variations = json.load(f)
-
-            patterns = pattern_variations.get("patterns", {})
+            patterns = store.section(pattern_vars_path, "patterns", {})
             if variation_set in patterns:
                 pattern_data = patterns[variation_set]
                 variations_list = pattern_data["variations"]
@@ -150,8 +147,7 @@ class ContentLoader:
         # Step 4: Fallback to legacy danger_variations.json
         legacy_path = self.warnings_dir / "danger_variations.json"
         try:
-            with open(legacy_path, "r", encoding="utf-8") as f:
-                legacy_variations = json.load(f)
+            legacy_variations = store.load(legacy_path)
 
             if variation_set in legacy_variations:
                 variations_list = legacy_variations[variation_set]
@@ -0,0 +1,123 @@
+"""
+Render scheduler for MairuCLI display system.
+
+Every dramatic delay (ASCII art drawn line by line, pauses before
+explanations and achievements, timeline simulations) goes through the
+shared RenderScheduler instead of time.sleep:
+
+- Delays only happen in an interactive session (stdin and stdout are
+  terminals, MAIRU_TEST_MODE is not set). Piped output, scripted sessions
+  and the test suite render at once.
+- While waiting, any keypress skips to the end: the key is swallowed and
+  the rest of the animation is printed without delays, until the next
+  prompt (see reset()).
+
+Rendering itself stays on the main thread, in order: warnings are often
+followed by a confirmation prompt, which must come after them.
+"""
+
+import os
+import sys
+import time
+from typing import Iterable, Optional
+
+
+class RenderScheduler:
+    """Paces animated output; skippable, and instant when not interactive."""
+
+    def __init__(self):
+        """Initialize the scheduler (animations play until skipped)."""
+        self.skipping = False
+
+    @property
+    def animated(self) -> bool:
+        """Whether delays are shown (interactive session, not skipped)."""
+        if self.skipping or os.environ.get('MAIRU_TEST_MODE') == '1':
+            return False
+        try:
+            return sys.stdout.isatty() and sys.stdin.isatty()
+        except (AttributeError, ValueError):
+            # Replaced or closed streams
+            return False
+
+    def pause(self, seconds: float) -> None:
+        """
+        Wait for dramatic effect, unless a key is pressed first.
+
+        Args:
+            seconds: Delay in seconds
+        """
+        if seconds <= 0 or not self.animated:
+            return
+        sys.stdout.flush()
+        if _wait_for_key(seconds):
+            self.skipping = True
+
+    def print_lines(self, lines: Iterable[str], delay: float) -> None:
+        """
+        Print lines one by one with a delay after each.
+
+        Args:
+            lines: Lines to print
+            delay: Delay in seconds after each line
+        """
+        for line in lines:
+            print(line)
+            self.pause(delay)
+
+    def reset(self) -> None:
+        """Play animations again (called before each prompt)."""
+        self.skipping = False
+
+
+def _wait_for_key(seconds: float) -> bool:
+    """
+    Wait until a key is pressed or the time is up.
+
+    Args:
+        seconds: Longest wait in seconds
+
+    Returns:
+        True if a key was pressed (it is consumed)
+    """
+    if sys.platform == "win32":
+        import msvcrt
+
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                while msvcrt.kbhit():
+                    msvcrt.getwch()
+                return True
+            time.sleep(0.02)
+        return False
+
+    import select
+    import termios
+
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    # Get keys as they are typed, without echoing them
+    attributes = termios.tcgetattr(fd)
+    attributes[3] &= ~(termios.ICANON | termios.ECHO)
+    attributes[6][termios.VMIN] = 1
+    attributes[6][termios.VTIME] = 0
+    termios.tcsetattr(fd, termios.TCSANOW, attributes)
+    try:
+        ready, _, _ = select.select([fd], [], [], seconds)
+        if ready:
+            os.read(fd, 1024)
+        return bool(ready)
+    finally:
+        termios.tcsetattr(fd, termios.TCSANOW, saved)
+
+
+_scheduler: Optional[RenderScheduler] = None
+
+
+def get_render_scheduler() -> RenderScheduler:
+    """Get the shared render scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = RenderScheduler()
+    return _scheduler
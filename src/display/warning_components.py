@@ -5,10 +5,10 @@ Provides modular warning display components for different warning types.
 """
 
 import random
-import time
 from abc import ABC, abstractmethod
 from src.display.ascii_renderer import AsciiRenderer
 from src.display.message_formatter import MessageFormatter
+from src.display.render_scheduler import get_render_scheduler
 from src.display.content_loader import ContentLoader
 from src.project_paths import get_warnings_dir
 from src.config import (
@@ -113,7 +113,6 @@ class DangerWarning(WarningComponent):
 
         # Load and display ASCII art
         art_file = warning_content.get("ascii_art", "fired.txt")
-        art = self.renderer.load_art(art_file)
         color = warning_content.get("color", "red")
         timing = warning_content.get("timing", {})
 
@@ -121,8 +120,9 @@ class DangerWarning(WarningComponent):
 
         # Display ASCII art slowly for dramatic effect
         art_delay = timing.get("art_delay", TIMING_ASCII_CHAR_DELAY)
-        self.renderer.display_art_slowly(art, color, delay=art_delay)
-        time.sleep(timing.get("pause_after_art", TIMING_PAUSE_SHORT))
+        self.renderer.display_art_file(art_file, color, delay=art_delay)
+        scheduler = get_render_scheduler()
+        scheduler.pause(timing.get("pause_after_art", TIMING_PAUSE_SHORT))
 
         # Display title and subtitle
         emoji_name = warning_content.get("emoji", "fire")
@@ -132,7 +132,7 @@ class DangerWarning(WarningComponent):
         subtitle_colored = self.renderer.colorize(subtitle, "orange")
         print(subtitle_colored)
         print()
-        time.sleep(timing.get("pause_before_explanation", TIMING_PAUSE_MEDIUM))
+        scheduler.pause(timing.get("pause_before_explanation", TIMING_PAUSE_MEDIUM))
 
         # Display explanation and consequence
         explanation = warning_content.get("explanation", "This command is dangerous.")
@@ -148,7 +148,7 @@ class DangerWarning(WarningComponent):
         print(f"{lightbulb} {advice_title}")
         for item in advice:
             print(f"  - {item}")
-        time.sleep(timing.get("pause_before_achievement", TIMING_PAUSE_SHORT))
+        scheduler.pause(timing.get("pause_before_achievement", TIMING_PAUSE_SHORT))
 
         print()
         command_text = self.renderer.colorize(f"Blocked command: {command}", "chocolate")
@@ -229,12 +229,12 @@ class RepeatWarning(WarningComponent):
         """
         # Load repeat warnings from content
         import json
+        from src.content_store import get_content_store
 
         warnings_path = get_warnings_dir() / "repeat_warnings.json"
 
         try:
-            with open(warnings_path, "r", encoding="utf-8") as f:
-                repeat_warnings = json.load(f)
+            repeat_warnings = get_content_store().load(warnings_path)
         except (FileNotFoundError, json.JSONDecodeError):
             # Fallback if file not found
             repeat_warnings = {
@@ -8,10 +8,43 @@ import json
 import os
 import re
 import sys
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Tuple, Optional
-
-from src.project_paths import get_data_dir, get_builtins_dir
+from typing import (
+    Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+)
+
+from src.command_parser import CommandParser
+from src.content_store import get_content_store
+from src.pattern_bundle import PatternBundle
+from src.pattern_table import (
+    LEVEL_CAUTION,
+    LEVEL_CRITICAL,
+    LEVEL_NAMES,
+    LEVEL_SAFE,
+    NO_PATTERN,
+    PATTERN_FLAGS,
+    TYPO_PREFIX,
+    PatternRecord,
+    PatternTable
+)
+from src.shell_lexer import PARSE_CACHE_SIZE, Segment
+from src.typo_index import (
+    EDIT_EXTRA,
+    EDIT_MISSING,
+    EDIT_MISSING_LAST,
+    EDIT_PREFERENCE,
+    EDIT_SWAPPED,
+    EDIT_WRONG,
+    SHELL_WORDS,
+    STANDARD_UTILITIES,
+    TypoCandidate,
+    TypoIndex
+)
+from src.path_index import get_path_index
+from src.project_paths import get_data_dir, get_builtins_dir, get_warnings_dir
 
 try:
     import jsonschema
@@ -19,6 +52,29 @@ try:
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
 
+try:
+    # Python 3.11+ keeps the regex parser private
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+# Repeat and atomic-group opcodes differ between Python versions
+_REPEAT_OPS = tuple(
+    getattr(sre_constants, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(sre_constants, name)
+)
+_ATOMIC_GROUP = getattr(sre_constants, "ATOMIC_GROUP", None)
+
+# Non-ASCII characters that case-insensitive regexes match to ASCII letters
+_ASCII_CASE_FOLD = str.maketrans({
+    "\u0130": "i",  # LATIN CAPITAL LETTER I WITH DOT ABOVE
+    "\u0131": "i",  # LATIN SMALL LETTER DOTLESS I
+    "\u017f": "s",  # LATIN SMALL LETTER LONG S
+    "\u212a": "k",  # KELVIN SIGN
+})
+
 
 class PatternLoader:
     """Load patterns from JSON files for data-driven architecture."""
@@ -39,6 +95,8 @@ class PatternLoader:
             self.data_dir = data_dir
         self.validate_schema = validate_schema and JSONSCHEMA_AVAILABLE
         self._schemas = {}
+        # Files that were missing, unreadable or failed validation
+        self.load_errors: List[str] = []
 
         if validate_schema and not JSONSCHEMA_AVAILABLE:
             print("Warning: jsonschema library not available. Schema validation disabled.")
@@ -60,15 +118,16 @@ class PatternLoader:
         schema_path = os.path.join(self.data_dir, "schemas", f"{schema_name}.json")
 
         try:
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                schema = json.load(f)
+            schema = get_content_store().load(schema_path)
             self._schemas[schema_name] = schema
             return schema
         except FileNotFoundError:
             print(f"Warning: Schema file {schema_path} not found. Skipping validation.")
+            self.load_errors.append(schema_path)
             return None
         except json.JSONDecodeError as e:
             print(f"Warning: Invalid JSON in schema {schema_path}: {e}")
+            self.load_errors.append(schema_path)
             return None
 
     def _validate_json(self, data: Dict, schema_name: str, file_path: str) -> bool:
@@ -124,12 +183,12 @@ class PatternLoader:
         catalog_path = os.path.join(self.data_dir, "warning_catalog.json")
 
         try:
-            with open(catalog_path, 'r', encoding='utf-8') as f:
-                catalog = json.load(f)
+            catalog = get_content_store().load(catalog_path)
 
             # Validate against schema
             if not self._validate_json(catalog, "warning_catalog_schema", catalog_path):
                 print(f"Warning: Validation failed for {catalog_path}. Using patterns anyway.")
+                self.load_errors.append(catalog_path)
 
             patterns = {}
             for name, data in catalog.get('warnings', {}).items():
@@ -140,6 +199,8 @@ class PatternLoader:
                         'severity': data.get('severity', 'medium'),
                         'art_file': data.get('ascii_art', 'default.txt')
                     }
+                    if 'commands' in data:
+                        patterns[name]['commands'] = data['commands']
 
             # Sort patterns by specificity (more specific patterns first)
             # This ensures system_modify is checked before overwrite_file
@@ -147,9 +208,11 @@ class PatternLoader:
 
         except FileNotFoundError:
             print(f"Warning: {catalog_path} not found. Using empty patterns.")
+            self.load_errors.append(catalog_path)
             return {}
         except json.JSONDecodeError as e:
             print(f"Warning: Invalid JSON in {catalog_path}: {e}")
+            self.load_errors.append(catalog_path)
             return {}
 
     def _sort_patterns_by_specificity(self, patterns: Dict) -> Dict:
@@ -203,27 +266,116 @@ class PatternLoader:
         catalog_path = os.path.join(self.data_dir, "caution_catalog.json")
 
         try:
-            with open(catalog_path, 'r', encoding='utf-8') as f:
-                catalog = json.load(f)
+            catalog = get_content_store().load(catalog_path)
 
             # Validate against schema
             if not self._validate_json(catalog, "caution_catalog_schema", catalog_path):
                 print(f"Warning: Validation failed for {catalog_path}. Using patterns anyway.")
+                self.load_errors.append(catalog_path)
 
             patterns = {}
             for name, data in catalog.get('cautions', {}).items():
                 if 'pattern' in data:
-                    patterns[name] = data
+                    # Copied: the catalog is shared and patterns get analysed
+                    patterns[name] = dict(data)
 
             return patterns
 
         except FileNotFoundError:
             print(f"Warning: {catalog_path} not found. Using empty patterns.")
+            self.load_errors.append(catalog_path)
             return {}
         except json.JSONDecodeError as e:
             print(f"Warning: Invalid JSON in {catalog_path}: {e}")
+            self.load_errors.append(catalog_path)
             return {}
 
+    def load_protected_directories(self, overlays: List[str] = ()) -> Dict:
+        """
+        Load protected directories from protected_directories.json.
+
+        Site overlays use the same format; their rules are added to the
+        shipped ones.
+
+        Args:
+            overlays: Paths of overlay files, applied in order
+
+        Returns:
+            Dictionary of platform -> {"critical": rules, "caution": rules},
+            where a rule is a directory path or a {"glob"} / {"regex"} dict
+        """
+        catalog_path = os.path.join(self.data_dir, "protected_directories.json")
+
+        directories: Dict = {}
+        for path in [catalog_path, *overlays]:
+            catalog = self._load_protected_file(path)
+            if not catalog and path == catalog_path:
+                catalog = {'platforms': _FALLBACK_PROTECTED_DIRECTORIES}
+            for platform, levels in catalog.get('platforms', {}).items():
+                merged = directories.setdefault(
+                    platform, {"critical": [], "caution": []}
+                )
+                for level in ("critical", "caution"):
+                    merged[level].extend(
+                        rule for rule in levels.get(level, [])
+                        if self._valid_protected_rule(rule, path)
+                    )
+
+        return directories
+
+    def _load_protected_file(self, path: str) -> Dict:
+        """
+        Read and validate one protected directories file.
+
+        Args:
+            path: File path
+
+        Returns:
+            Parsed file, or an empty dict if it is missing or not JSON
+        """
+        try:
+            catalog = get_content_store().load(path)
+        except FileNotFoundError:
+            print(f"Warning: {path} not found. Its protected directories are not applied.")
+            self.load_errors.append(path)
+            return {}
+        except json.JSONDecodeError as e:
+            print(f"Warning: Invalid JSON in {path}: {e}")
+            self.load_errors.append(path)
+            return {}
+
+        if not self._validate_json(catalog, "protected_directories_schema", path):
+            print(f"Warning: Validation failed for {path}. Using directories anyway.")
+            self.load_errors.append(path)
+
+        return catalog
+
+    def _valid_protected_rule(self, rule, path: str) -> bool:
+        """
+        Check that a protected directory rule can be used.
+
+        Args:
+            rule: Directory string, or dict with 'glob' or 'regex'
+            path: File the rule came from (for error messages)
+
+        Returns:
+            True if the rule is usable
+        """
+        if isinstance(rule, str) and rule:
+            return True
+        if isinstance(rule, dict) and isinstance(rule.get('glob'), str):
+            return True
+        if isinstance(rule, dict) and isinstance(rule.get('regex'), str):
+            try:
+                re.compile(rule['regex'])
+                return True
+            except re.error as e:
+                print(f"Warning: Invalid regex {rule['regex']!r} in {path}: {e}")
+        else:
+            print(f"Warning: Invalid protected directory rule {rule!r} in {path}")
+        self.load_errors.append(path)
+        return False
+
     def _load_typo_patterns(self) -> Dict:
         """
         Load typo patterns from typo_messages.json.
@@ -234,48 +386,71 @@ class PatternLoader:
         typo_path = os.path.join(self.data_dir, "typo_messages.json")
 
         try:
-            with open(typo_path, 'r', encoding='utf-8') as f:
-                typo_data = json.load(f)
+            typo_data = get_content_store().load(typo_path)
 
             # Validate against schema
             if not self._validate_json(typo_data, "typo_messages_schema", typo_path):
                 print(f"Warning: Validation failed for {typo_path}. Using patterns anyway.")
+                self.load_errors.append(typo_path)
 
             patterns = {}
             for name, data in typo_data.get('typos', {}).items():
                 if 'pattern' in data:
-                    patterns[name] = data
+                    # Copied: the catalog is shared and patterns get analysed
+                    patterns[name] = dict(data)
 
             return patterns
 
         except FileNotFoundError:
             print(f"Warning: {typo_path} not found. Using empty patterns.")
+            self.load_errors.append(typo_path)
             return {}
         except json.JSONDecodeError as e:
             print(f"Warning: Invalid JSON in {typo_path}: {e}")
+            self.load_errors.append(typo_path)
             return {}
 
 
 class PatternCompiler:
     """Compile regex patterns for efficient matching."""
 
-    def compile_patterns(self, patterns: Dict) -> Dict:
+    # What may follow a leading command name: whitespace, a word boundary,
+    # the end, or a suffix such as mkfs(.ext4)
+    _COMMAND_END = re.compile(r'\\s|\\b|\$|\(\\\.')
+
+    def compile_patterns(self, patterns: Dict) -> Dict[str, PatternRecord]:
         """
         Compile all patterns in dictionary.
 
+        Also records the literals each pattern requires (see
+        extract_literals) so matchers can skip patterns whose literals
+        do not appear in a command, and the commands it applies to (see
+        command_names). The pattern data is not modified.
+
+        Bundled pattern data (which carries its literals) was compiled
+        when the bundle was built, so its regexes are compiled on first
+        use instead of here.
+
         Args:
             patterns: Dictionary of pattern data
 
         Returns:
-            Dictionary with compiled regex patterns
+            Dictionary of read-only PatternRecord objects
         """
         compiled = {}
 
         for name, data in patterns.items():
             try:
-                # Compile the pattern
-                data['compiled'] = re.compile(data['pattern'], re.IGNORECASE)
-                compiled[name] = data
+                if 'literals' in data:
+                    # Bundled pattern data: checked by build_pattern_data
+                    regex = None
+                    literals = data['literals']
+                else:
+                    regex = re.compile(data['pattern'], PATTERN_FLAGS)
+                    literals = self.extract_literals(data['pattern'])
+                compiled[name] = PatternRecord(
+                    name, regex, literals, self.command_names(data), data
+                )
             except re.error as e:
                 print(f"Warning: Invalid pattern '{name}': {e}")
                 # Skip invalid patterns
@@ -283,47 +458,785 @@ class PatternCompiler:
 
         return compiled
 
+    def command_names(self, data: Dict) -> Tuple[str, ...]:
+        """
+        Get the commands a pattern applies to.
 
-# Protected system directories by platform
-# These directories are critical for system operation and should not be modified
-PROTECTED_DIRECTORIES = {
-    "win32": {
-        "critical": [
-            r"c:\windows",
-            r"c:\windows\system32",
-            r"c:\windows\syswow64",
-            r"c:\windows\winsxs",
-        ],
-        "caution": [
-            r"c:\program files",
-            r"c:\program files (x86)",
-            r"c:\programdata",
-        ]
-    },
-    "linux": {
-        "critical": [
-            "/bin", "/sbin", "/boot", "/etc",
-            "/lib", "/lib64", "/proc", "/sys",
-            "/root", "/dev"
-        ],
-        "caution": [
-            "/usr/bin", "/usr/sbin", "/usr/lib",
-            "/var/log", "/usr"
+        A pattern that can match a pipe or chain (see spans_commands) is
+        always command-agnostic: matching it against one simple command at
+        a time would never see the operator.
+
+        Args:
+            data: Pattern data; its optional 'commands' list overrides the
+                command inferred from the pattern (an empty list makes the
+                pattern command-agnostic)
+
+        Returns:
+            Lowercase command names, or () for a command-agnostic pattern
+        """
+        if self.spans_commands(data['pattern']):
+            return ()
+        if 'commands' in data:
+            return tuple(command.lower() for command in data['commands'])
+        return self.extract_commands(data['pattern'])
+
+    def extract_commands(self, pattern: str) -> Tuple[str, ...]:
+        """
+        Infer the command a pattern is anchored to.
+
+        Args:
+            pattern: Regex source
+
+        Returns:
+            (name,) for a pattern starting with a lowercase command name
+            followed by whitespace, a word boundary or a suffix (rm\\s+...,
+            mkfs(\\.\\w+)?...), else () (anchors, groups, alternation, an
+            uppercase keyword such as DROP, or a pipe or chain operator)
+        """
+        if self.spans_commands(pattern):
+            return ()
+        literal, remainder = self.split_leading_literal(pattern)
+        if not literal or not literal[0].isalpha() or not literal.islower():
+            return ()
+        if remainder and not self._COMMAND_END.match(remainder):
+            return ()
+        return (literal,)
+
+    @staticmethod
+    def spans_commands(pattern: str) -> bool:
+        """
+        Check whether a pattern can match across commands.
+
+        Args:
+            pattern: Regex source
+
+        Returns:
+            True if the pattern matches a pipe or chain operator (\\|, |
+            in a character class, ; or &), e.g. curl\\s+.*\\|\\s*sh
+        """
+        in_class = False
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if char == '\\':
+                if pattern[i + 1:i + 2] in ('|', ';', '&'):
+                    return True
+                i += 2
+                continue
+            if char in ';&' or (in_class and char == '|'):
+                return True
+            if char == '[' and not in_class:
+                in_class = True
+                # A leading ']' (or '^]') is a literal bracket
+                if pattern[i + 1:i + 2] == '^':
+                    i += 1
+                if pattern[i + 1:i + 2] == ']':
+                    i += 1
+            elif char == ']' and in_class:
+                in_class = False
+            i += 1
+        return False
+
+    def build_command_index(
+        self,
+        catalogs: List[Dict]
+    ) -> Tuple[Dict[str, List[int]], List[int]]:
+        """
+        Index compiled patterns by the commands they apply to.
+
+        Patterns are numbered across the catalogs in order, which is the
+        priority order matchers use.
+
+        Args:
+            catalogs: Compiled pattern dictionaries (see compile_patterns)
+
+        Returns:
+            Tuple of (command name -> pattern numbers, numbers of
+            command-agnostic patterns)
+        """
+        by_command: Dict[str, List[int]] = {}
+        agnostic: List[int] = []
+        index = 0
+        for patterns in catalogs:
+            for data in patterns.values():
+                commands = data.get('commands')
+                if commands is None:
+                    commands = self.command_names(data)
+                for command in commands:
+                    by_command.setdefault(command, []).append(index)
+                if not commands:
+                    agnostic.append(index)
+                index += 1
+        return by_command, agnostic
+
+    @staticmethod
+    def split_leading_literal(source: str) -> Tuple[str, str]:
+        """
+        Split a pattern into its leading plain literal and the remainder.
+
+        Args:
+            source: Regex source
+
+        Returns:
+            Tuple of (literal, remainder); literal is empty when the pattern
+            cannot be factored (anchors, groups, or top-level alternation)
+        """
+        match = re.match(r'[A-Za-z0-9_]+', source)
+        if not match:
+            return "", source
+
+        literal = match.group(0)
+        # A quantifier binds to the last character only
+        if source[match.end():match.end() + 1] in ('*', '+', '?', '{'):
+            literal = literal[:-1]
+        if not literal:
+            return "", source
+
+        # 'ab|cd' must not become 'a(?:b|cd)'
+        depth = 0
+        in_class = False
+        i = 0
+        while i < len(source):
+            char = source[i]
+            if char == '\\':
+                i += 2
+                continue
+            if in_class:
+                if char == ']':
+                    in_class = False
+            elif char == '[':
+                in_class = True
+                # A leading ']' (or '^]') is a literal bracket
+                if source[i + 1:i + 2] == '^':
+                    i += 1
+                if source[i + 1:i + 2] == ']':
+                    i += 1
+            elif char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+            elif char == '|' and depth == 0:
+                return "", source
+            i += 1
+
+        return literal, source[len(literal):]
+
+    def extract_literals(self, pattern: str) -> Optional[FrozenSet[str]]:
+        """
+        Extract literals that any match of the pattern must contain.
+
+        The result is a set of alternatives: every match contains at least
+        one of them as a substring (compared in lowercase, since patterns
+        are case-insensitive). For example 'dd\\s+if=/dev/zero' requires
+        'if=/dev/zero' and 'chmod\\s+(666|755)' requires 'chmod'.
+
+        Args:
+            pattern: Regex source
+
+        Returns:
+            Frozen set of lowercase literals, or None if no literal is
+            guaranteed (such patterns must always be evaluated)
+        """
+        try:
+            parsed = sre_parse.parse(pattern, re.IGNORECASE)
+        except (re.error, RecursionError):
+            return None
+        return self._required_literals(parsed)
+
+    def _required_literals(self, items) -> Optional[FrozenSet[str]]:
+        """
+        Find the most selective required literal set of a parsed sequence.
+
+        Args:
+            items: Sequence of (opcode, argument) pairs from sre_parse
+
+        Returns:
+            Frozen set of lowercase literals, or None if none is required
+        """
+        best = None
+        run: List[str] = []
+
+        def consider(candidate: Optional[FrozenSet[str]]) -> None:
+            nonlocal best
+            if not candidate or not all(candidate):
+                return
+            # Prefer the longest shortest-literal, then fewer alternatives
+            score = (min(len(lit) for lit in candidate), -len(candidate))
+            if best is None or score > (
+                min(len(lit) for lit in best), -len(best)
+            ):
+                best = candidate
+
+        def end_run() -> None:
+            if run:
+                consider(frozenset({''.join(run)}))
+                run.clear()
+
+        for op, av in items:
+            if op is sre_constants.LITERAL and av < 128:
+                run.append(chr(av).lower())
+                continue
+            if op is sre_constants.AT:
+                # Anchors are zero-width; surrounding literals stay adjacent
+                continue
+
+            end_run()
+            if op is sre_constants.SUBPATTERN:
+                consider(self._required_literals(av[-1]))
+            elif op is _ATOMIC_GROUP:
+                consider(self._required_literals(av))
+            elif op in _REPEAT_OPS and av[0] >= 1:
+                consider(self._required_literals(av[2]))
+            elif op is sre_constants.BRANCH:
+                alternatives = [
+                    self._required_literals(branch) for branch in av[1]
+                ]
+                if all(alternatives):
+                    consider(frozenset().union(*alternatives))
+
+        end_run()
+        return best
+
+
+def _literal_alternation(literals: List[str]) -> str:
+    """
+    Build a prefix-factored alternation that matches the longest literal.
+
+    At any position the regex matches the longest literal starting there,
+    because longer continuations are tried before stopping at a node.
+
+    Args:
+        literals: Distinct lowercase literals
+
+    Returns:
+        Regex source
+    """
+    root: Dict = {}
+    for literal in literals:
+        node = root
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict) -> str:
+        alternatives = []
+        for char, child in node.items():
+            if not char:
+                continue
+            # Collapse single-child chains into one literal run
+            run = char
+            while len(child) == 1 and "" not in child:
+                next_char, child = next(iter(child.items()))
+                run += next_char
+            if list(child) == [""]:
+                alternatives.append(re.escape(run))
+            else:
+                alternatives.append(re.escape(run) + "(?:" + emit(child) + ")")
+        if "" in node:
+            alternatives.append("")
+        return "|".join(alternatives)
+
+    return emit(root)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _command_words(command: str) -> Tuple[Tuple[str, str, Segment, int], ...]:
+    """
+    List the words of a command that may name a command.
+
+    Args:
+        command: User-entered command string
+
+    Returns:
+        Tuples of (lookup key, program name, simple command, argv index);
+        the key is lowercased and drops suffixes (mkfs.ext4 -> mkfs)
+    """
+    parser = CommandParser()
+    words = []
+    for segment in parser.simple_commands(command):
+        for position, word in enumerate(segment.argv):
+            name = parser.command_name(word)
+            if not name[:1].isalpha():
+                continue
+            # Fold the few non-ASCII characters that match ASCII letters
+            key = name.translate(_ASCII_CASE_FOLD).lower().split(".", 1)[0]
+            words.append((key, name, segment, position))
+    return tuple(words)
+
+
+def _anchored_text(name: str, segment: Segment, position: int) -> str:
+    """
+    Render a simple command from one of its words for anchored matching.
+
+    Args:
+        name: Program name of the word (see _command_words)
+        segment: Simple command containing the word
+        position: argv index of the word
+
+    Returns:
+        The word and the arguments after it, quotes removed, followed by
+        the segment's redirections in normalized form
+    """
+    return " ".join(
+        (name,) + segment.argv[position + 1:] + tuple(
+            f"{redirect.fd}{redirect.op} {redirect.target}"
+            for redirect in segment.redirects
+        )
+    )
+
+
+class _RegexCache(dict):
+    """Pattern ID -> compiled regex, compiled when first looked up."""
+
+    __slots__ = ("_records",)
+
+    def __init__(self, records: Sequence[Mapping]):
+        """
+        Initialize the cache.
+
+        Args:
+            records: Pattern records (or catalog dicts) by pattern ID
+        """
+        super().__init__()
+        self._records = records
+
+    def __missing__(self, index: int) -> re.Pattern:
+        """Compile the regex of a pattern on its first lookup."""
+        data = self._records[index]
+        compiled = data.get('compiled')
+        if compiled is None:
+            compiled = re.compile(data['pattern'], PATTERN_FLAGS)
+        self[index] = compiled
+        return compiled
+
+
+class PatternMatcher:
+    """
+    Match commands against all pattern catalogs in a single pass.
+
+    Patterns that start with a lowercase command name (rm\\s+..., mkfs(\\.\\w+)?
+    ...) are indexed by it and matched per simple command (pipeline stages,
+    chained commands, subshells, sh -c strings; see
+    CommandParser.simple_commands) against its arguments without quotes.
+    They are anchored at a word naming the command: argv[0], or a later
+    word, so sudo rm and xargs rm are still caught. Only the rm patterns
+    run for an rm word. Quoting does not hide a command ("rm" -rf /), and
+    a quoted argument that reads as a command line is checked as one,
+    since a shell or another program may run it (echo "rm -rf /" | sh,
+    ssh host "rm -rf /").
+
+    Other (command-agnostic) patterns search the raw command. Those that
+    require a literal (see PatternCompiler.extract_literals)
+    are indexed by it. One scan of the lowercased command finds the
+    literals present, and only the patterns indexed under them are run,
+    so a command mentioning none of them costs a single scan whatever the
+    catalog size.
+
+    Patterns without a required literal are merged into one alternation.
+    Branches are factored by their leading literal so the regex engine
+    tests shared prefixes once, and each branch ends with an empty named
+    group that identifies the pattern. A regex search reports the leftmost
+    match rather than the highest-priority one, so on a hit the patterns
+    ranked above it are re-checked individually.
+    """
+
+    # Name prefix of the empty marker group that closes each branch
+    GROUP_PREFIX = "mairu_p"
+
+    def __init__(self, dangerous: Dict, caution: Dict, typo: Dict):
+        """
+        Build the combined matcher.
+
+        Args:
+            dangerous: Compiled dangerous patterns (already in priority order)
+            caution: Compiled caution patterns
+            typo: Compiled typo patterns
+        """
+        compiler = PatternCompiler()
+
+        # Names, levels and metadata by pattern ID (priority order)
+        self.table = PatternTable(dangerous, caution, typo)
+        # Compiled regex by pattern ID (compiled on first use)
+        self._regexes = _RegexCache(self.table.records)
+        # Literal -> indices of patterns requiring it
+        literal_index: Dict[str, List[int]] = {}
+        # Indices of patterns without a required literal
+        self._unfiltered: List[int] = []
+        unfiltered_sources: List[str] = []
+        # Command name -> indices of patterns anchored to it
+        self._by_command, agnostic = compiler.build_command_index(
+            [dangerous, caution, typo]
+        )
+        agnostic = set(agnostic)
+
+        for index, data in enumerate(self.table.records):
+            if 'literals' in data:
+                literals = data['literals']
+            else:
+                literals = compiler.extract_literals(data['pattern'])
+
+            if index not in agnostic:
+                continue
+            if literals:
+                for literal in literals:
+                    literal_index.setdefault(literal, []).append(index)
+            else:
+                self._unfiltered.append(index)
+                unfiltered_sources.append(data['pattern'])
+
+        self._literal_scanner = None
+        # Scanner hit -> sorted indices of every pattern whose literal is
+        # a prefix of the hit (all of those start at the same position)
+        self._literal_hits: Dict[str, Tuple[int, ...]] = {}
+        if literal_index:
+            self._literal_scanner = re.compile(
+                _literal_alternation(sorted(literal_index))
+            )
+            for literal in literal_index:
+                hits = set()
+                for end in range(1, len(literal) + 1):
+                    hits.update(literal_index.get(literal[:end], ()))
+                self._literal_hits[literal] = tuple(sorted(hits))
+
+        self._combined = self._build_combined(
+            self._unfiltered, unfiltered_sources
+        )
+
+    def __len__(self) -> int:
+        """Return the number of patterns in the matcher."""
+        return len(self.table)
+
+    def compile_all(self) -> None:
+        """Compile every pattern now (e.g. before forking workers)."""
+        for index in range(len(self.table)):
+            self._regexes[index]
+
+    def patterns(self) -> List[Tuple[str, str]]:
+        """
+        List the patterns in priority order.
+
+        Returns:
+            (level, pattern_name) per pattern; the position is the
+            pattern ID
+        """
+        return [(LEVEL_NAMES[level], name)
+                for level, name in zip(self.table.levels, self.table.names)]
+
+    def match_many(self, commands: Sequence[str]) -> List[Optional[int]]:
+        """
+        Find the highest-priority pattern for each of many commands.
+
+        Gives the same results as match, but the literal prefilter scans
+        all commands at once and each candidate pattern is then run over
+        every command that needs it in one loop, in priority order.
+
+        Args:
+            commands: Command strings
+
+        Returns:
+            ID of the matching pattern (see table) per command, or None
+            where nothing matches
+        """
+        best: List[Optional[int]] = [
+            self._match_unfiltered(command) for command in commands
         ]
-    },
-    "darwin": {  # macOS
-        "critical": [
-            "/system", "/bin", "/sbin",
-            "/etc", "/var", "/private"
-        ],
-        "caution": [
-            "/library", "/applications",
-            "/usr/bin", "/usr/sbin", "/usr"
+
+        # Pattern index -> (command number, text to match) pairs
+        groups: Dict[int, List[Tuple[int, str]]] = {}
+
+        if self._literal_scanner is not None and commands:
+            # One scan over all commands, separated so no literal found
+            # in one command is attributed to another
+            folded = [command.translate(_ASCII_CASE_FOLD).lower()
+                      for command in commands]
+            starts = []
+            offset = 0
+            for text in folded:
+                starts.append(offset)
+                offset += len(text) + 1
+            text = "\n".join(folded)
+
+            found: Dict[int, set] = {}
+            search = self._literal_scanner.search
+            hit = search(text)
+            while hit is not None:
+                number = bisect_right(starts, hit.start()) - 1
+                for index in self._literal_hits[hit.group()]:
+                    found.setdefault(index, set()).add(number)
+                hit = search(text, hit.start() + 1)
+
+            for index, numbers in found.items():
+                groups[index] = [(number, commands[number])
+                                 for number in numbers]
+
+        # Command-anchored patterns match the rendered simple commands
+        anchored = set()
+        if self._by_command:
+            for number, command in enumerate(commands):
+                for key, name, segment, position in _command_words(command):
+                    indices = self._by_command.get(key)
+                    if not indices:
+                        continue
+                    text = _anchored_text(name, segment, position)
+                    for index in indices:
+                        groups.setdefault(index, []).append((number, text))
+                        anchored.add(index)
+
+        # Lower indices first, so the first match per command is the best
+        for index in sorted(groups):
+            compiled = self._regexes[index]
+            run = compiled.match if index in anchored else compiled.search
+            for number, text in groups[index]:
+                current = best[number]
+                if (current is None or index < current) and run(text):
+                    best[number] = index
+
+        return best
+
+    def match(self, command: str) -> Tuple[str, str]:
+        """
+        Find the highest-priority pattern matching the command.
+
+        Args:
+            command: User-entered command string
+
+        Returns:
+            Tuple of (level, pattern_name), or ("safe", "") if nothing matches
+        """
+        index = self.match_id(command)
+        if index is None:
+            return "safe", ""
+        return LEVEL_NAMES[self.table.levels[index]], self.table.names[index]
+
+    def match_id(self, command: str) -> Optional[int]:
+        """
+        Find the ID of the highest-priority pattern matching the command.
+
+        Args:
+            command: User-entered command string
+
+        Returns:
+            Pattern ID (see table), or None if nothing matches
+        """
+        index = self._match_unfiltered(command)
+        limit = len(self.table) if index is None else index
+
+        for candidate in self.candidates(command):
+            if candidate >= limit:
+                break
+            if self._regexes[candidate].search(command):
+                index = candidate
+                break
+
+        if self._by_command:
+            index = self._match_commands(command, index)
+
+        return index
+
+    def _match_commands(self, command: str,
+                        best: Optional[int]) -> Optional[int]:
+        """
+        Match command-anchored patterns against each simple command.
+
+        Args:
+            command: User-entered command string
+            best: Index of the best match so far, or None
+
+        Returns:
+            Index of the highest-priority match, or best
+        """
+        for key, name, segment, position in _command_words(command):
+            indices = self._by_command.get(key)
+            if not indices or (best is not None and indices[0] >= best):
+                continue
+
+            text = _anchored_text(name, segment, position)
+            for index in indices:
+                if best is not None and index >= best:
+                    break
+                if self._regexes[index].match(text):
+                    best = index
+                    break
+
+        return best
+
+    def candidates(self, command: str) -> List[int]:
+        """
+        List command-agnostic patterns whose required literals appear in
+        the command.
+
+        Args:
+            command: User-entered command string
+
+        Returns:
+            Sorted pattern indices (priority order)
+        """
+        if self._literal_scanner is None:
+            return []
+
+        # Fold the few non-ASCII characters that match ASCII letters
+        # case-insensitively, so the substring test never misses a match
+        text = command.translate(_ASCII_CASE_FOLD).lower()
+        search = self._literal_scanner.search
+        found = set()
+        hit = search(text)
+        while hit is not None:
+            found.update(self._literal_hits[hit.group()])
+            hit = search(text, hit.start() + 1)
+
+        return sorted(found)
+
+    def _match_unfiltered(self, command: str) -> Optional[int]:
+        """
+        Find the first matching pattern among those without literals.
+
+        Args:
+            command: User-entered command string
+
+        Returns:
+            Index of the highest-priority match, or None
+        """
+        if self._combined is None:
+            return self._match_sequential(command, self._unfiltered)
+
+        hit = self._combined.search(command)
+        if hit is None:
+            return None
+
+        # A higher-priority pattern may still match further right
+        index = int(hit.lastgroup[len(self.GROUP_PREFIX):])
+        higher = [i for i in self._unfiltered if i < index]
+        found = self._match_sequential(command, higher)
+        return index if found is None else found
+
+    def _match_sequential(
+        self,
+        command: str,
+        indices: List[int]
+    ) -> Optional[int]:
+        """
+        Check the given patterns one by one in priority order.
+
+        Args:
+            command: User-entered command string
+            indices: Pattern indices in priority order
+
+        Returns:
+            Index of the first match, or None
+        """
+        for index in indices:
+            if self._regexes[index].search(command):
+                return index
+        return None
+
+    def _build_combined(
+        self,
+        indices: List[int],
+        sources: List[str]
+    ) -> Optional[re.Pattern]:
+        """
+        Merge pattern sources into one prefix-factored alternation.
+
+        Args:
+            indices: Pattern indices, in priority order
+            sources: Regex sources matching indices
+
+        Returns:
+            Compiled combined regex, or None if there is nothing to merge
+            or the patterns cannot be merged safely (matching then falls
+            back to one search each)
+        """
+        if not sources:
+            return None
+
+        # Numbered backreferences would point at the wrong group once merged
+        if any(re.search(r'\\[1-9]|\(\?P=', source) for source in sources):
+            return None
+
+        # Character trie over leading literals; each node holds the
+        # (index, remainder) branches whose literal ends at that node
+        root: Dict = {"children": {}, "branches": []}
+        for index, source in zip(indices, sources):
+            literal, remainder = PatternCompiler.split_leading_literal(source)
+            node = root
+            for char in literal.lower():
+                node = node["children"].setdefault(
+                    char, {"children": {}, "branches": []}
+                )
+            node["branches"].append((index, remainder))
+
+        try:
+            return re.compile(self._emit_trie(root), re.IGNORECASE)
+        except (re.error, RecursionError) as e:
+            print(f"Warning: Could not build combined pattern matcher: {e}")
+            return None
+
+    def _emit_trie(self, node: Dict) -> str:
+        """
+        Render a trie node as a regex alternation.
+
+        Args:
+            node: Trie node built by _build_combined
+
+        Returns:
+            Regex source matching any branch below the node
+        """
+        alternatives = [
+            f"(?:{remainder})(?P<{self.GROUP_PREFIX}{index}>)"
+            for index, remainder in node["branches"]
         ]
-    }
+
+        for char, child in node["children"].items():
+            # Collapse single-child chains into one literal run
+            literal = char
+            while not child["branches"] and len(child["children"]) == 1:
+                next_char, child = next(iter(child["children"].items()))
+                literal += next_char
+            alternatives.append(
+                re.escape(literal) + "(?:" + self._emit_trie(child) + ")"
+            )
+
+        return "|".join(alternatives)
+
+
+# Environment variable listing site overlay files for protected directories
+# (separated by os.pathsep), e.g. MAIRU_PROTECTED_DIRS=/etc/mairu/protected.json
+PROTECTED_OVERLAY_ENV = "MAIRU_PROTECTED_DIRS"
+
+# Used when protected_directories.json cannot be read, so a broken install
+# still blocks the most critical system directories
+_FALLBACK_PROTECTED_DIRECTORIES = {
+    "win32": {"critical": [r"c:\windows"], "caution": []},
+    "linux": {"critical": ["/bin", "/sbin", "/boot", "/etc", "/lib"], "caution": []},
+    "darwin": {"critical": ["/system", "/bin", "/sbin", "/etc"], "caution": []},
 }
 
 
+# Protected directory indexes by platform, built on first use
+_PROTECTED_INDEXES: Dict[str, "ProtectedPathIndex"] = {}
+
+
+def _protected_index(platform: str) -> "ProtectedPathIndex":
+    """
+    Get the protected directory index for a platform.
+
+    Args:
+        platform: Key of PROTECTED_DIRECTORIES (e.g. "linux")
+
+    Returns:
+        ProtectedPathIndex with the platform's directories normalized once
+    """
+    from src.protected_paths import ProtectedPathIndex
+
+    index = _PROTECTED_INDEXES.get(platform)
+    if index is None:
+        directories = PROTECTED_DIRECTORIES[platform]
+        index = ProtectedPathIndex(directories["critical"],
+                                   directories["caution"])
+        _PROTECTED_INDEXES[platform] = index
+    return index
+
+
 # All patterns (Dangerous, Caution, and Typo) are now loaded from JSON files
 # See: data/warnings/warning_catalog.json, caution_catalog.json, and typo_messages.json
 # This enables data-driven architecture where patterns can be managed without code changes
@@ -331,43 +1244,167 @@ PROTECTED_DIRECTORIES = {
 
 # Common command list for generic typo detection
 # Loaded from builtin_commands.json to avoid duplication
-def _load_common_commands() -> list:
-    """Load common command names from builtin_commands.json."""
+_FALLBACK_COMMON_COMMANDS = ["ls", "cd", "pwd", "cat", "echo", "help", "exit"]
+
+# Modules whose code shapes the bundled literals and command names; the
+# bundle is rebuilt when one of them changes
+_BUNDLE_CODE_MODULES = (
+    "interceptor.py",
+    "command_parser.py",
+    "shell_lexer.py",
+    "pattern_table.py",
+)
+
+
+def _read_common_commands() -> list:
+    """
+    Read common command names from builtin_commands.json.
+
+    Raises:
+        FileNotFoundError: If builtin_commands.json is missing
+        json.JSONDecodeError: If builtin_commands.json is invalid
+    """
+    builtin_path = get_builtins_dir() / "builtin_commands.json"
+    categories = get_content_store().section(builtin_path, 'categories', {})
+
+    commands = []
+    for category_data in categories.values():
+        for cmd in category_data.get('commands', []):
+            # Extract command name (first word before space or special chars)
+            name = cmd.get('name', '').split()[0].split('/')[0].strip('<>')
+            # Skip generic descriptions like "Any other command"
+            if name and name.lower() not in ['any', 'other'] and name not in commands:
+                commands.append(name)
+
+    return commands
+
+
+def protected_overlays() -> List[str]:
+    """
+    Get the site overlay files for protected directories.
+
+    Returns:
+        Paths listed in MAIRU_PROTECTED_DIRS, in order
+    """
+    value = os.environ.get(PROTECTED_OVERLAY_ENV, "")
+    return [path for path in value.split(os.pathsep) if path]
+
+
+def pattern_sources() -> List[Path]:
+    """
+    Get the data files that pattern loading depends on.
+
+    Returns:
+        Paths of the catalogs, their schemas, builtin_commands.json and
+        protected directory overlays
+    """
+    warnings_dir = get_warnings_dir()
+    schemas_dir = warnings_dir / "schemas"
+    return [
+        warnings_dir / "warning_catalog.json",
+        warnings_dir / "caution_catalog.json",
+        warnings_dir / "typo_messages.json",
+        warnings_dir / "protected_directories.json",
+        schemas_dir / "warning_catalog_schema.json",
+        schemas_dir / "caution_catalog_schema.json",
+        schemas_dir / "typo_messages_schema.json",
+        schemas_dir / "protected_directories_schema.json",
+        get_builtins_dir() / "builtin_commands.json",
+    ] + [Path(path) for path in protected_overlays()]
+
+
+def bundle_code_modules() -> List[Path]:
+    """
+    Get the modules whose code computes the bundled pattern data.
+
+    Returns:
+        Paths of this module and the parser and lexer it analyses
+        patterns with
+    """
+    source_dir = Path(__file__).resolve().parent
+    return [source_dir / name for name in _BUNDLE_CODE_MODULES]
+
+
+def build_pattern_data() -> Tuple[Dict, bool]:
+    """
+    Load, validate and analyse all pattern sources (the uncached path).
+
+    Patterns are returned uncompiled, sorted by priority and with their
+    required literals and commands, so the result can be stored in a
+    PatternBundle.
+
+    Returns:
+        Tuple of (data, cacheable). data has 'dangerous', 'caution',
+        'typo', 'common_commands' and 'protected_directories' keys.
+        cacheable is False if any file was missing or invalid or a
+        pattern does not compile (it is left out), so the warnings are
+        shown again next time.
+    """
+    loader = PatternLoader()
+    compiler = PatternCompiler()
+    dangerous, caution, typo = loader.load_all_patterns()
+
+    cacheable = not loader.load_errors
+    for patterns in (dangerous, caution, typo):
+        for name, data in list(patterns.items()):
+            # Bundled regexes are compiled on first use, so check them here
+            try:
+                re.compile(data['pattern'], PATTERN_FLAGS)
+            except re.error as e:
+                print(f"Warning: Invalid pattern '{name}': {e}")
+                del patterns[name]
+                cacheable = False
+                continue
+            data['literals'] = compiler.extract_literals(data['pattern'])
+            data['commands'] = compiler.command_names(data)
+
+    protected_directories = loader.load_protected_directories(
+        protected_overlays()
+    )
     try:
-        builtin_path = get_builtins_dir() / "builtin_commands.json"
-        with open(builtin_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        commands = []
-        for category_data in data.get('categories', {}).values():
-            for cmd in category_data.get('commands', []):
-                # Extract command name (first word before space or special chars)
-                name = cmd.get('name', '').split()[0].split('/')[0].strip('<>')
-                # Skip generic descriptions like "Any other command"
-                if name and name.lower() not in ['any', 'other'] and name not in commands:
-                    commands.append(name)
-
-        return commands
+        common_commands = _read_common_commands()
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Warning: Could not load common commands: {e}")
-        # Fallback to minimal list
-        return ["ls", "cd", "pwd", "cat", "echo", "help", "exit"]
-
-COMMON_COMMANDS = _load_common_commands()
+        common_commands = list(_FALLBACK_COMMON_COMMANDS)
+        cacheable = False
+
+    data = {
+        'dangerous': dangerous,
+        'caution': caution,
+        'typo': typo,
+        'common_commands': common_commands,
+        'protected_directories': protected_directories,
+    }
+    return data, cacheable
 
 
-# Load patterns from JSON files (data-driven architecture)
+# Load patterns from the cached bundle, rebuilding it from the JSON files
+# (data-driven architecture) whenever one of them changes.
 # JSON files are the ONLY source of pattern definitions
-_loader = PatternLoader()
-_compiler = PatternCompiler()
+PATTERN_BUNDLE = PatternBundle(
+    pattern_sources(), key=f"jsonschema={JSONSCHEMA_AVAILABLE}",
+    code=bundle_code_modules()
+)
+_bundle_data = PATTERN_BUNDLE.load(build_pattern_data)
+
+# Changes whenever any pattern source changes (use as a cache key)
+PATTERN_BUNDLE_VERSION = PATTERN_BUNDLE.version
+
+COMMON_COMMANDS = _bundle_data['common_commands']
 
-# Load patterns from JSON
-_loaded_dangerous, _loaded_caution, _loaded_typo = _loader.load_all_patterns()
+# Generic typos of these names block the command; typos of other $PATH
+# executables only get a suggestion when the shell cannot find them
+_BLOCKING_TYPO_NAMES = frozenset(name.lower() for name in COMMON_COMMANDS)
+
+# Protected system directories by platform (rules from
+# protected_directories.json plus site overlays)
+PROTECTED_DIRECTORIES = _bundle_data['protected_directories']
 
 # Compile patterns for performance
-DANGEROUS_PATTERNS = _compiler.compile_patterns(_loaded_dangerous)
-CAUTION_PATTERNS = _compiler.compile_patterns(_loaded_caution)
-TYPO_PATTERNS = _compiler.compile_patterns(_loaded_typo)
+_compiler = PatternCompiler()
+DANGEROUS_PATTERNS = _compiler.compile_patterns(_bundle_data['dangerous'])
+CAUTION_PATTERNS = _compiler.compile_patterns(_bundle_data['caution'])
+TYPO_PATTERNS = _compiler.compile_patterns(_bundle_data['typo'])
 
 # Validate that patterns were loaded successfully
 if not DANGEROUS_PATTERNS:
@@ -384,10 +1421,124 @@ if not TYPO_PATTERNS:
     print("Warning: No typo patterns loaded from data/warnings/typo_messages.json")
     TYPO_PATTERNS = {}  # Empty dict is acceptable for typo patterns
 
+# Merge all catalogs into a single-scan matcher (keeps priority order)
+_MATCHER = PatternMatcher(DANGEROUS_PATTERNS, CAUTION_PATTERNS, TYPO_PATTERNS)
+
+# Every pattern by integer ID: names, levels and catalog metadata
+PATTERN_TABLE = _MATCHER.table
+
+# Pattern ID of generic typos (check_generic_typo). They are not in the
+# table: their name includes the typed word (typo_generic_gti).
+GENERIC_TYPO = len(PATTERN_TABLE)
+GENERIC_TYPO_PREFIX = f"{TYPO_PREFIX}generic_"
+
+# Typed words whose generic typo candidates are kept (least recently used
+# are dropped and recomputed when seen again)
+GENERIC_TYPO_CACHE_SIZE = 4096
+
+# Generic typo messages by kind of edit
+_TYPO_MESSAGES = {
+    EDIT_MISSING_LAST:
+        "⚡ Speedy fingers! Missing the last letter? Try '{correct}'!",
+    EDIT_WRONG: "🎃 Close! One letter off. Did you mean '{correct}'?",
+    EDIT_SWAPPED: "🔀 Letters swapped! Did you mean '{correct}'?",
+    EDIT_MISSING: "⚡ Speedy fingers! A letter went missing. Try '{correct}'!",
+    EDIT_EXTRA: "🎃 One letter too many! Did you mean '{correct}'?",
+}
+
+
+class TypoSuggestion(NamedTuple):
+    """Generic typo suggestion for a mistyped command word."""
+
+    correct: str
+    message: str
+
+
+class CommandVerdicts(NamedTuple):
+    """Verdicts from check_commands as parallel arrays (one item per command)."""
+
+    levels: array       # LEVEL_SAFE, LEVEL_CAUTION or LEVEL_CRITICAL
+    pattern_ids: array  # Pattern ID (see pattern_name), or NO_PATTERN
+    commands: Sequence[str]
+
+    def verdict(self, position: int) -> Tuple[str, str]:
+        """
+        Get one verdict in check_command form.
+
+        Args:
+            position: Index of the command
+
+        Returns:
+            Tuple of (level, pattern_name)
+        """
+        return _named_verdict(self.commands[position], self.levels[position],
+                              self.pattern_ids[position])
+
+
+def pattern_id(name: str) -> int:
+    """
+    Get the ID of a pattern name.
+
+    Args:
+        name: Pattern name as reported by check_command
+
+    Returns:
+        Pattern ID, GENERIC_TYPO for generic typos, or NO_PATTERN if there
+        is no such pattern
+    """
+    found = PATTERN_TABLE.id_of(name)
+    if found == NO_PATTERN and name.startswith(GENERIC_TYPO_PREFIX):
+        return GENERIC_TYPO
+    return found
+
+
+def pattern_name(pattern_id: int) -> str:
+    """
+    Get the pattern name of an ID from check_command_id or check_commands.
+
+    Args:
+        pattern_id: Pattern ID, or NO_PATTERN
+
+    Returns:
+        Pattern name, or "" for NO_PATTERN. Generic typos get
+        GENERIC_TYPO_PREFIX without the typed word (see generic_typo_name).
+    """
+    if pattern_id == NO_PATTERN:
+        return ""
+    if pattern_id == GENERIC_TYPO:
+        return GENERIC_TYPO_PREFIX
+    return PATTERN_TABLE.names[pattern_id]
+
+
+def generic_typo_name(command: str) -> str:
+    """
+    Get the pattern name reported for a generic typo.
+
+    Args:
+        command: Command whose first word is the typo
+
+    Returns:
+        Pattern name, e.g. typo_generic_gti
+    """
+    words = command.split()
+    return f"{GENERIC_TYPO_PREFIX}{words[0] if words else command}"
+
+
+def _named_verdict(command: str, level: int, found: int) -> Tuple[str, str]:
+    """Convert a (level code, pattern ID) verdict into check_command form."""
+    if found == GENERIC_TYPO:
+        return LEVEL_NAMES[level], generic_typo_name(command)
+    return LEVEL_NAMES[level], pattern_name(found)
+
 
 def check_generic_typo(command: str) -> Tuple[bool, str, str]:
     """
-    Check for generic typo patterns (missing last character, etc.).
+    Check whether the command word is one edit away from a known command.
+
+    Known commands are the MairuCLI builtins and every executable on
+    $PATH (see typo_index). Suggestions are ranked by how often the
+    session used them, then by kind of edit (a missing last letter
+    first), then builtins before $PATH.
 
     Args:
         command: First word of the command
@@ -397,27 +1548,19 @@ def check_generic_typo(command: str) -> Tuple[bool, str, str]:
     """
     cmd_word = command.split()[0] if command.split() else command
 
-    # Check if command is missing last character
-    for correct_cmd in COMMON_COMMANDS:
-        if len(correct_cmd) > 2 and cmd_word == correct_cmd[:-1]:
-            return (
-                True,
-                correct_cmd,
-                f"⚡ Speedy fingers! Missing the last letter? Try '{correct_cmd}'!"
-            )
+    typo_index()  # Drops cached candidates if $PATH changed
+    candidates = generic_typo_candidates(cmd_word)
+    if not candidates:
+        return False, "", ""
 
-    # Check if command has one character wrong (simple substitution)
-    for correct_cmd in COMMON_COMMANDS:
-        if len(cmd_word) == len(correct_cmd) and len(cmd_word) > 2:
-            diff_count = sum(1 for a, b in zip(cmd_word, correct_cmd) if a != b)
-            if diff_count == 1:
-                return (
-                    True,
-                    correct_cmd,
-                    f"🎃 Close! One letter off. Did you mean '{correct_cmd}'?"
-                )
+    from src.builtins.shell_utils import get_command_count
 
-    return False, "", ""
+    best = min(candidates, key=lambda candidate: (
+        -get_command_count(candidate.name),
+        EDIT_PREFERENCE[candidate.edit],
+        candidate.rank
+    ))
+    return True, best.name, _TYPO_MESSAGES[best.edit].format(correct=best.name)
 
 
 def check_redirection_target(target: str) -> Tuple[bool, str]:
@@ -465,6 +1608,16 @@ def check_redirection_target(target: str) -> Tuple[bool, str]:
     return False, ""
 
 
+def compile_all_patterns() -> None:
+    """
+    Compile every catalog regex now instead of on first use.
+
+    Used before forking screening workers, so they share the compiled
+    patterns.
+    """
+    _MATCHER.compile_all()
+
+
 def check_command(command: str) -> Tuple[str, str]:
     """
     Check if command matches any dangerous, caution, or typo pattern.
@@ -479,63 +1632,221 @@ def check_command(command: str) -> Tuple[str, str]:
 
     Performance: Must complete within 50ms
     """
-    # Check critical patterns first (highest priority)
-    for pattern_name, pattern_data in DANGEROUS_PATTERNS.items():
-        # Use compiled pattern if available (faster)
-        if 'compiled' in pattern_data:
-            if pattern_data['compiled'].search(command):
-                return "critical", pattern_name
-        else:
-            # Fallback to re.search for backward compatibility
-            if re.search(pattern_data["pattern"], command, re.IGNORECASE):
-                return "critical", pattern_name
-
-    # Check caution patterns (medium priority)
-    for pattern_name, pattern_data in CAUTION_PATTERNS.items():
-        # Use compiled pattern if available (faster)
-        if 'compiled' in pattern_data:
-            if pattern_data['compiled'].search(command):
-                return "caution", pattern_name
+    return _named_verdict(command, *check_command_id(command))
+
+
+def check_command_id(command: str) -> Tuple[int, int]:
+    """
+    Check a command like check_command, reporting integer codes.
+
+    Args:
+        command: User-entered command string
+
+    Returns:
+        Tuple of (level code, pattern ID); (LEVEL_SAFE, NO_PATTERN) if
+        nothing matches. pattern_name and get_pattern_info resolve the ID
+        (generic typos need the name from generic_typo_name).
+    """
+    # Check critical, caution and typo patterns in one scan (priority order)
+    found = _MATCHER.match_id(command)
+    if found is not None:
+        return PATTERN_TABLE.levels[found], found
+
+    return _check_generic_typos(command)
+
+
+def check_commands(commands: Sequence[str]) -> CommandVerdicts:
+    """
+    Check many commands at once (same verdicts as check_command).
+
+    Tokenizes each command once, runs the literal prefilter over all of
+    them in one scan and evaluates each candidate pattern over all the
+    commands that need it, which avoids per-call overhead for history
+    audits.
+
+    Args:
+        commands: Command strings
+
+    Returns:
+        CommandVerdicts with one level code and pattern ID per command
+    """
+    count = len(commands)
+    levels = array('b', bytes(count))
+    pattern_ids = array('i', [NO_PATTERN]) * count
+
+    for number, found in enumerate(_MATCHER.match_many(commands)):
+        if found is not None:
+            levels[number] = PATTERN_TABLE.levels[found]
+            pattern_ids[number] = found
         else:
-            # Fallback to re.search for backward compatibility
-            if re.search(pattern_data["pattern"], command, re.IGNORECASE):
-                return "caution", pattern_name
-
-    # Check specific typo patterns (treated as critical for blocking)
-    for pattern_name, pattern_data in TYPO_PATTERNS.items():
-        if re.search(pattern_data["pattern"], command, re.IGNORECASE):
-            return "critical", f"typo_{pattern_name}"
-
-    # Check generic typo patterns
-    is_typo, correct_cmd, message = check_generic_typo(command)
-    if is_typo:
-        # Create a dynamic typo pattern
-        cmd_word = command.split()[0] if command.split() else command
-        TYPO_PATTERNS[f"generic_{cmd_word}"] = {
-            "pattern": f"^{re.escape(cmd_word)}\\b",
-            "correct": correct_cmd,
-            "message": message
-        }
-        return "critical", f"typo_generic_{cmd_word}"
+            levels[number], pattern_ids[number] = \
+                _check_generic_typos(commands[number])
+
+    return CommandVerdicts(levels, pattern_ids, commands)
+
+
+def _check_generic_typos(command: str) -> Tuple[int, int]:
+    """
+    Check a command no catalog pattern matched for generic typos.
+
+    Only typos of the builtins (COMMON_COMMANDS) are blocked. A word one
+    edit from some other $PATH executable is often a tool or alias of its
+    own (nvm, rvm, gst, ll), and a standard utility name (at, ed) is
+    meant as typed, so these run, and the suggestion is shown if the
+    shell cannot find them.
+
+    Args:
+        command: User-entered command string
+
+    Returns:
+        Tuple of (level code, pattern ID); (LEVEL_SAFE, NO_PATTERN) if it
+        is no typo of a builtin
+    """
+    words = command.split()
+    word = words[0] if words else command
+    typo_index()  # Drops cached candidates if $PATH changed
+    if not any(_is_blocking_typo(word, candidate)
+               for candidate in generic_typo_candidates(word)):
+        return LEVEL_SAFE, NO_PATTERN
+    return LEVEL_CRITICAL, GENERIC_TYPO
+
+
+def _is_blocking_typo(word: str, candidate: TypoCandidate) -> bool:
+    """
+    Check whether a generic typo candidate blocks the command.
 
-    return "safe", ""
+    Args:
+        word: Typed command word
+        candidate: Known command one edit away from it
+
+    Returns:
+        True for a typo of a builtin, except a letter put in front of it
+        (jenv, xenv: a different tool rather than a slip) or a standard
+        utility that is not installed (at is not a typo of cat)
+    """
+    if candidate.name.lower() not in _BLOCKING_TYPO_NAMES:
+        return False
+    if word.lower() in STANDARD_UTILITIES:
+        return False
+    return not (candidate.edit == EDIT_EXTRA and
+                word[1:].lower() == candidate.name.lower())
 
 
-def get_pattern_info(pattern_name: str) -> Dict[str, str]:
+def generic_typo_depends_on_path(command: str) -> bool:
+    """
+    Check whether a command's generic typo verdict can change with $PATH.
+
+    A word one edit from a builtin is blocked as a typo unless it is
+    installed, so its verdict changes when it is installed or removed.
+    Other words are never blocked as generic typos.
+
+    Args:
+        command: User-entered command string
+
+    Returns:
+        True if the first word would be blocked were it not on $PATH
+    """
+    global _builtin_typo_index
+    words = command.split()
+    word = words[0] if words else command
+    if _builtin_typo_index is None:
+        _builtin_typo_index = TypoIndex(COMMON_COMMANDS, known=SHELL_WORDS)
+    return any(_is_blocking_typo(word, candidate)
+               for candidate in _builtin_typo_index.candidates(word))
+
+
+# Typo index of the builtins alone (see generic_typo_depends_on_path)
+_builtin_typo_index: Optional[TypoIndex] = None
+
+# (PATH index version, typo index) of the last build
+_typo_index: Optional[Tuple[int, TypoIndex]] = None
+
+
+def typo_index() -> TypoIndex:
+    """
+    Get the typo index over builtins and $PATH.
+
+    Built on first use from the PATH index and rebuilt when that index
+    changes (an install or PATH edit), which also empties the
+    generic_typo_candidates cache.
+
+    Returns:
+        TypoIndex of COMMON_COMMANDS followed by the $PATH executables
+    """
+    global _typo_index
+    path_index = get_path_index()
+    version = path_index.version
+    if _typo_index is None or _typo_index[0] != version:
+        _typo_index = (version, TypoIndex(
+            COMMON_COMMANDS + path_index.names(), known=SHELL_WORDS
+        ))
+        generic_typo_candidates.cache_clear()
+    return _typo_index[1]
+
+
+@lru_cache(maxsize=GENERIC_TYPO_CACHE_SIZE)
+def generic_typo_candidates(word: str) -> Tuple[TypoCandidate, ...]:
+    """
+    Get the known commands one edit away from a command word.
+
+    Results are kept in a bounded cache instead of being added to the
+    typo patterns, so checking a command costs the same however many
+    typos a session has seen. Call typo_index() first to drop results
+    computed before $PATH changed.
+
+    Args:
+        word: First word of a command
+
+    Returns:
+        TypoCandidate tuple, empty if the word is no typo
+    """
+    return tuple(typo_index().candidates(word))
+
+
+def generic_typo_suggestion(word: str) -> Optional[TypoSuggestion]:
+    """
+    Get the generic typo suggestion for a command word.
+
+    Args:
+        word: First word of a command
+
+    Returns:
+        TypoSuggestion with the best-ranked command, or None if the word
+        is no typo
+    """
+    is_typo, correct_cmd, message = check_generic_typo(word)
+    if not is_typo:
+        return None
+    return TypoSuggestion(correct_cmd, message)
+
+
+def get_pattern_info(pattern: Union[str, int]) -> Mapping:
     """
     Retrieve pattern information for display.
 
     Args:
-        pattern_name: Name of the matched pattern
+        pattern: Name or ID of the matched pattern (generic typos only by
+            name, which includes the typed word)
 
     Returns:
-        Dictionary with pattern details (category, severity, art_file, etc.)
+        Pattern details (category, severity, art_file, etc.; correct and
+        message for typos)
+
+    Raises:
+        KeyError: If there is no such pattern
     """
-    if pattern_name.startswith("typo_"):
-        typo_name = pattern_name.replace("typo_", "")
-        return TYPO_PATTERNS[typo_name]
-    else:
-        return DANGEROUS_PATTERNS[pattern_name]
+    found = pattern if isinstance(pattern, int) \
+        else PATTERN_TABLE.id_of(pattern)
+    if 0 <= found < len(PATTERN_TABLE):
+        return PATTERN_TABLE[found]
+
+    if isinstance(pattern, str) and pattern.startswith(GENERIC_TYPO_PREFIX):
+        suggestion = generic_typo_suggestion(
+            pattern[len(GENERIC_TYPO_PREFIX):]
+        )
+        if suggestion is not None:
+            return suggestion._asdict()
+    raise KeyError(pattern)
 
 
 def check_system_directory(command: str) -> Tuple[str, str, str]:
@@ -557,7 +1868,6 @@ def check_system_directory(command: str) -> Tuple[str, str, str]:
 
     Performance: Must complete within 50ms
     """
-    from src.command_parser import CommandParser
     from src.path_resolver import PathResolver
 
     # Special paths that should be handled by dangerous pattern check
@@ -600,46 +1910,18 @@ def check_system_directory(command: str) -> Tuple[str, str, str]:
         return "safe", "", ""
 
     # Check each path against protected directories
+    index = _protected_index(platform)
     for path in paths:
         try:
             # Resolve path to absolute normalized form
             resolved_path = resolver.resolve_path(path)
 
-            # Check critical directories first (highest priority)
-            for protected_dir in PROTECTED_DIRECTORIES[platform]["critical"]:
-                # Normalize protected directory for comparison
-                normalized_protected = resolver.normalize_for_comparison(
-                    protected_dir
-                )
-
-                # Ensure both paths end with separator for accurate comparison
-                check_path = resolved_path
-                check_protected = normalized_protected
-                if not check_protected.endswith(('\\', '/')):
-                    import os
-                    check_protected += os.sep
-
-                # Check if resolved path starts with protected directory
-                if check_path.startswith(check_protected) or \
-                   check_path == normalized_protected:
-                    return "critical", "system_critical", resolved_path
-
-            # Check caution directories
-            for protected_dir in PROTECTED_DIRECTORIES[platform]["caution"]:
-                normalized_protected = resolver.normalize_for_comparison(
-                    protected_dir
-                )
-
-                # Ensure both paths end with separator for accurate comparison
-                check_path = resolved_path
-                check_protected = normalized_protected
-                if not check_protected.endswith(('\\', '/')):
-                    import os
-                    check_protected += os.sep
-
-                if check_path.startswith(check_protected) or \
-                   check_path == normalized_protected:
-                    return "caution", "system_caution", resolved_path
+            # Critical directories take precedence over caution ones
+            level = index.lookup(resolved_path)
+            if level == "critical":
+                return "critical", "system_critical", resolved_path
+            if level == "caution":
+                return "caution", "system_caution", resolved_path
 
         except (ValueError, PermissionError, OSError):
             # If path resolution fails, err on side of caution (fail-safe)
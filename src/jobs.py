@@ -0,0 +1,243 @@
+"""
+Background jobs for MairuCLI.
+
+`command &` runs a screened command in the background, as in a shell:
+the prompt comes back at once, so the next command is checked while the
+first one runs, and several jobs can run in parallel. Jobs are asyncio
+subprocesses (asyncio.create_subprocess_shell) driven by one event loop
+in a daemon thread, and their output is forwarded as it arrives, like
+foreground output (see shell_executor).
+
+The prompt itself stays on the main thread, where input() line editing
+and Ctrl+C work; jobs get their own process group so Ctrl+C at the
+prompt does not reach them. `jobs`, `fg` and `wait` (src/builtins/
+job_control.py) look jobs up here.
+"""
+
+import asyncio
+import atexit
+import locale
+import os
+import signal
+import sys
+import threading
+from typing import Dict, List, Optional, TextIO
+
+from src.shell_executor import CHUNK_SIZE, OutputForwarder
+from src.shell_lexer import parse_command
+
+# Job states (as shown by `jobs`)
+RUNNING = "Running"
+DONE = "Done"
+
+
+def background_command(command: str) -> str:
+    """
+    Get the command to run in the background, if it ends with `&`.
+
+    Args:
+        command: Command line
+
+    Returns:
+        Command without the trailing `&`, or "" if it is not a
+        background command
+    """
+    stripped = command.rstrip()
+    if not stripped.endswith("&") or stripped.endswith("&&"):
+        return ""
+    segments = parse_command(stripped).segments
+    if not segments or segments[-1].operator != "&":
+        return ""
+    return stripped[:-1].rstrip()
+
+
+class Job:
+    """One background command."""
+
+    def __init__(self, job_id: int, command: str, process):
+        """
+        Initialize the job.
+
+        Args:
+            job_id: Job number (%1, %2...)
+            command: Command line
+            process: asyncio.subprocess.Process running it
+        """
+        self.id = job_id
+        self.command = command
+        self.process = process
+        self.returncode: Optional[int] = None
+        self.not_found = False
+        # Set once the command exited and all its output was forwarded
+        self.finished = threading.Event()
+
+    @property
+    def state(self) -> str:
+        """RUNNING or DONE."""
+        return DONE if self.finished.is_set() else RUNNING
+
+    def describe(self) -> str:
+        """Get the `jobs` line of the job, e.g. "[1]  Running  make"."""
+        state = self.state
+        if state == DONE and self.returncode:
+            state = f"Exit {self.returncode}"
+        return f"[{self.id}]  {state:<10} {self.command}"
+
+
+class JobTable:
+    """Background jobs of the session, numbered from 1."""
+
+    def __init__(self):
+        """Initialize the table (the event loop starts with the first job)."""
+        self._jobs: Dict[int, Job] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the job event loop, starting its thread on first use."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever,
+                                 name="mairu-jobs", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def start(self, command: str, output: Optional[TextIO] = None,
+              encoding: Optional[str] = None) -> Job:
+        """
+        Start a command in the background.
+
+        Args:
+            command: Command line (run with the system shell)
+            output: Stream for the job's output (default: sys.stdout)
+            encoding: Encoding of the output (default: system encoding)
+
+        Returns:
+            The new Job
+
+        Raises:
+            OSError: If the shell cannot be started
+        """
+        if output is None:
+            output = sys.stdout
+        if encoding is None:
+            encoding = locale.getpreferredencoding()
+        return asyncio.run_coroutine_threadsafe(
+            self._spawn(command, output, encoding), self._event_loop()
+        ).result()
+
+    async def _spawn(self, command: str, output: TextIO,
+                     encoding: str) -> Job:
+        """Start the process and supervise it (runs on the job loop)."""
+        if sys.platform == "win32":
+            import subprocess
+            options = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            options = {"start_new_session": True}
+        process = await asyncio.create_subprocess_shell(
+            command,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **options
+        )
+        job = Job(max(self._jobs, default=0) + 1, command, process)
+        self._jobs[job.id] = job
+        asyncio.ensure_future(self._supervise(job, output, encoding))
+        return job
+
+    async def _supervise(self, job: Job, output: TextIO,
+                         encoding: str) -> None:
+        """Forward a job's output until it exits (runs on the job loop)."""
+        stdout = OutputForwarder(output, encoding)
+        stderr = OutputForwarder(output, encoding, hold_not_found=True)
+        try:
+            await asyncio.gather(_pump(job.process.stdout, stdout),
+                                 _pump(job.process.stderr, stderr))
+            stdout.finish()
+            returncode = await job.process.wait()
+            job.returncode, job.not_found = stderr.result(returncode)
+        finally:
+            job.finished.set()
+
+    def jobs(self) -> List[Job]:
+        """List the jobs in number order."""
+        return [self._jobs[job_id] for job_id in sorted(self._jobs)]
+
+    def get(self, job_id: Optional[int] = None) -> Optional[Job]:
+        """
+        Find a job.
+
+        Args:
+            job_id: Job number (default: the most recent job)
+
+        Returns:
+            Job, or None if there is no such job
+        """
+        if job_id is None:
+            return self._jobs[max(self._jobs)] if self._jobs else None
+        return self._jobs.get(job_id)
+
+    def remove(self, job: Job) -> None:
+        """Forget a finished job."""
+        self._jobs.pop(job.id, None)
+
+    def finished_jobs(self) -> List[Job]:
+        """
+        Take the jobs that finished, removing them from the table.
+
+        Returns:
+            Finished jobs in number order (each is returned once)
+        """
+        finished = [job for job in self.jobs() if job.state == DONE]
+        for job in finished:
+            self.remove(job)
+        return finished
+
+    def send_signal(self, job: Job, signum: int) -> None:
+        """
+        Signal a running job (its whole process group on POSIX).
+
+        Args:
+            job: Job to signal
+            signum: Signal number (Windows always terminates the job)
+        """
+        if job.state == DONE:
+            return
+        try:
+            if sys.platform == "win32":
+                job.process.terminate()
+            else:
+                os.killpg(job.process.pid, signum)
+        except (ProcessLookupError, PermissionError):
+            # Exited in the meantime
+            pass
+
+    def close(self) -> None:
+        """Hang up every running job (when MairuCLI exits)."""
+        hangup = getattr(signal, "SIGHUP", signal.SIGTERM)
+        for job in self.jobs():
+            self.send_signal(job, hangup)
+
+
+async def _pump(stream: asyncio.StreamReader,
+                forwarder: OutputForwarder) -> None:
+    """Copy a subprocess stream to a forwarder until end of file."""
+    while True:
+        chunk = await stream.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        forwarder.feed(chunk)
+
+
+_table: Optional[JobTable] = None
+
+
+def get_job_table() -> JobTable:
+    """Get the session's job table."""
+    global _table
+    if _table is None:
+        _table = JobTable()
+        atexit.register(_table.close)
+    return _table
@@ -5,12 +5,12 @@ This module provides the REPL loop and command processing logic.
 """
 
 import json
-import random
-import subprocess
 import sys
 from pathlib import Path
+from typing import List, Optional
 
 from src.builtins import BuiltinCommands
+from src.content_store import get_content_store
 from src.project_paths import get_warnings_dir
 from src.display import (
     colorize,
@@ -20,7 +20,7 @@ from src.display import (
     show_caution_warning,
     track_safe_command
 )
-from src.interceptor import check_command
+from src.display.render_scheduler import get_render_scheduler
 
 
 def _load_command_not_found_messages():
@@ -33,9 +33,7 @@ def _load_command_not_found_messages():
     """
     try:
         json_path = get_warnings_dir() / "command_not_found.json"
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('messages', [])
+        return get_content_store().section(json_path, 'messages', [])
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Warning: Could not load command_not_found.json: {e}")
         # Fallback to a single default message
@@ -50,27 +48,52 @@ def _load_command_not_found_messages():
 _COMMAND_NOT_FOUND_MESSAGES = _load_command_not_found_messages()
 
 
-def show_command_not_found(cmd_name: str) -> None:
+def show_command_not_found(cmd_name: str, suggestion: str = "") -> None:
     """
     Display a random Halloween-themed 'command not found' message.
 
     Args:
         cmd_name: Name of the command that was not found
+        suggestion: Known command the user probably meant ("" if none)
     """
     if not _COMMAND_NOT_FOUND_MESSAGES:
         print(f"👻 '{cmd_name}' not found!")
-        return
+    else:
+        import random
+
+        variation = random.choice(_COMMAND_NOT_FOUND_MESSAGES)
+        print(f"{variation['emoji']} "
+              f"{variation['message'].format(cmd=cmd_name)}")
+        print(f"   {variation['subtitle']}")
 
-    variation = random.choice(_COMMAND_NOT_FOUND_MESSAGES)
-    print(f"{variation['emoji']} {variation['message'].format(cmd=cmd_name)}")
-    print(f"   {variation['subtitle']}")
+    if suggestion:
+        print(f"   Did you mean {colorize(suggestion, 'green')}?")
 
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Main entry point for MairuCLI.
     Displays welcome banner and starts REPL loop.
+
+    With command-line options (e.g. --check), runs the requested
+    non-interactive mode instead and exits with its status.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
     """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        # argparse and the screening code are only needed for these modes
+        from src.screening import run_cli
+        sys.exit(run_cli(argv))
+
+    # Load patterns before the banner so a broken install fails right away
+    import src.interceptor
+
+    # Index $PATH while the banner plays; lookups wait for it if needed
+    from src.path_index import get_path_index
+    get_path_index().start()
+
     display_welcome_banner()
 
     try:
@@ -90,6 +113,11 @@ def repl_loop() -> None:
     """
     while True:
         try:
+            # Say which background jobs ended since the last prompt
+            report_finished_jobs()
+            # A key pressed to skip an animation only skips that command's
+            get_render_scheduler().reset()
+
             # Display colored prompt
             prompt = colorize("mairu> ", "orange")
             command = input(prompt).strip()
@@ -139,71 +167,176 @@ def process_command(command: str) -> str:
     cmd_name = parts[0]
     args = parts[1:]
 
-    # Layer 1: Check system directory protection (HIGHEST PRIORITY)
-    from src.interceptor import check_system_directory
-    sys_level, sys_type, sys_path = check_system_directory(command)
+    # Run the screening layers (repeated commands reuse cached results)
+    from src.verdict_cache import check_layers_cached
+    checks = check_layers_cached(command)
 
-    if sys_level == "critical":
+    # Layer 1: Check system directory protection (HIGHEST PRIORITY)
+    if checks.sys_level == "critical":
         # Critical system directory - block immediately
         from src.display import show_system_protection_warning
-        show_system_protection_warning("critical", sys_path, command)
+        show_system_protection_warning("critical", checks.sys_path, command)
         # Statistics are already updated by show_system_protection_warning
         return ""
-    elif sys_level == "caution":
+    elif checks.sys_level == "caution":
         # Caution system directory - warn and ask for confirmation
         from src.display import show_system_protection_warning
-        if not show_system_protection_warning("caution", sys_path, command):
+        if not show_system_protection_warning("caution", checks.sys_path,
+                                              command):
             print(colorize("Command cancelled.", "chocolate"))
             return ""
         # User confirmed - continue to next checks
 
     # Layer 2: Check if dangerous or caution command (BEFORE builtin execution)
-    level, pattern_name = check_command(command)
-
-    if level == "critical":
+    if checks.level == "critical":
         # Critical: Block with warning
-        show_warning(pattern_name, command)
+        show_warning(checks.pattern_name, command)
         return ""
-    elif level == "caution":
+    elif checks.level == "caution":
         # Caution: Warn and ask for confirmation
-        if not show_caution_warning(pattern_name, command):
+        if not show_caution_warning(checks.pattern_name, command):
             print(colorize("Command cancelled.", "chocolate"))
             return ""
         # User confirmed - proceed to next checks
 
     # Layer 3: Check for dangerous output redirection (BEFORE builtin execution)
     # This catches commands like: echo data > /dev/sda
-    from src.command_parser import CommandParser
-    from src.interceptor import check_redirection_target
-
-    parser = CommandParser()
-    redirect_target = parser.extract_redirection_target(command)
-
-    if redirect_target:
-        # Check if redirection target is dangerous using centralized function
-        is_dangerous, pattern_name = check_redirection_target(redirect_target)
-        if is_dangerous:
-            # Dangerous redirection detected - block with warning
-            show_warning(pattern_name, command)
+    if checks.redirect_pattern:
+        # Dangerous redirection detected - block with warning
+        show_warning(checks.redirect_pattern, command)
+        return ""
+
+    # Layer 4: `command &` runs in the system shell in the background
+    if command.rstrip().endswith("&"):
+        # Imported here: asyncio is only needed once a job is started
+        from src.jobs import background_command
+        job_command = background_command(command)
+        if job_command:
+            start_background_job(job_command)
+            track_safe_command(cmd_name)
             return ""
 
-    # Layer 4: Check if builtin command
+    # Layer 5: Check if builtin command
     if BuiltinCommands.is_builtin(cmd_name):
         BuiltinCommands.execute_builtin(cmd_name, args)
         # Track safe command usage for achievements
         track_safe_command(cmd_name)
         return ""
 
-    # Layer 5: Execute in system shell (safe or confirmed caution command)
+    # Layer 6: Execute in system shell (safe or confirmed caution command)
     execute_in_system_shell(command)
     # Track safe command usage for achievements
     track_safe_command(cmd_name)
     return ""
 
 
+def report_unresolved_command(command: str,
+                              shell_definitions: bool = False) -> bool:
+    """
+    Report a command whose name resolves to nothing (see command_resolver).
+
+    Args:
+        command: Command to check
+        shell_definitions: True if the command runs in the persistent
+            shell, whose aliases and functions only it knows
+
+    Returns:
+        True if the command was reported as not found (do not run it)
+    """
+    from src.command_resolver import NOT_FOUND, resolve_command
+    resolution = resolve_command(command, shell_definitions)
+    if resolution.kind != NOT_FOUND:
+        return False
+    report_command_not_found(resolution.name)
+    return True
+
+
+def report_command_not_found(cmd_name: str) -> None:
+    """
+    Display the 'command not found' message with a typo suggestion.
+
+    Args:
+        cmd_name: Name of the command that was not found
+    """
+    from src.interceptor import generic_typo_suggestion
+    suggestion = generic_typo_suggestion(cmd_name)
+    show_command_not_found(cmd_name, suggestion.correct if suggestion else "")
+
+
+def confirm_expanded_command(expanded: str, command: str) -> bool:
+    """
+    Screen what a command runs once the persistent shell expands its
+    aliases and functions (see ShellSession.expand_definitions).
+
+    Args:
+        expanded: Command with aliases and functions replaced
+        command: Command as entered (shown in warnings)
+
+    Returns:
+        True if the command may run
+    """
+    if expanded == command:
+        return True
+
+    from src.screening import LAYER_SYSTEM_DIRECTORY, screen_command
+    verdict = screen_command(expanded)
+    if verdict["level"] == "safe":
+        return True
+
+    if verdict["layer"] == LAYER_SYSTEM_DIRECTORY:
+        from src.display import show_system_protection_warning
+        proceed = show_system_protection_warning(verdict["level"],
+                                                 verdict["path"], command)
+    elif verdict["level"] == "critical":
+        show_warning(verdict["pattern"], command)
+        proceed = False
+    else:
+        proceed = show_caution_warning(verdict["pattern"], command)
+
+    if not proceed and verdict["level"] == "caution":
+        print(colorize("Command cancelled.", "chocolate"))
+    return proceed
+
+
+def start_background_job(command: str) -> None:
+    """
+    Start a command in the background (see src/jobs.py).
+
+    The prompt returns at once; the job's output is forwarded as it
+    comes and the job is reported at the first prompt after it ends.
+
+    Args:
+        command: Command to run, without the trailing `&`
+    """
+    if report_unresolved_command(command):
+        return
+
+    from src.jobs import get_job_table
+    try:
+        job = get_job_table().start(command)
+    except OSError as e:
+        print(f"Error executing command: {e}")
+        return
+    print(f"[{job.id}] {job.process.pid}")
+
+
+def report_finished_jobs() -> None:
+    """Report the background jobs that ended since the last prompt."""
+    # Nothing to do (and nothing to import) until a job was started
+    if "src.jobs" not in sys.modules:
+        return
+
+    from src.jobs import get_job_table
+    for job in get_job_table().finished_jobs():
+        if job.not_found:
+            words = job.command.split()
+            report_command_not_found(words[0] if words else job.command)
+        print(job.describe())
+
+
 def execute_in_system_shell(command: str) -> None:
     """
-    Execute command in system shell using subprocess.
+    Execute command in system shell, streaming its output.
 
     Args:
         command: Command to execute
@@ -211,48 +344,37 @@ def execute_in_system_shell(command: str) -> None:
     Note:
         Uses shell=True to support pipes, redirects, and globs.
         This is safe because dangerous commands are already filtered.
+        Output is streamed (see shell_executor), not buffered until exit.
+        Commands whose name resolves to nothing (see command_resolver)
+        are reported as not found without running a shell, unless the
+        persistent shell may define them.
     """
     try:
-        # Detect system encoding (Windows uses cp932, Unix uses utf-8)
-        import locale
-        system_encoding = locale.getpreferredencoding()
-
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            encoding=system_encoding,
-            errors='replace'  # Replace decode errors with �
-        )
-
-        # Print stdout if any
-        if result.stdout:
-            print(result.stdout, end='')
-
-        # Check if command was not found (Windows/Unix)
-        if result.returncode != 0 and result.stderr:
-            stderr_lower = result.stderr.lower()
-            # Windows PowerShell: "用語 'xxx' は、コマンドレット..."
-            # Windows CMD: "'xxx' は、内部コマンドまたは外部コマンド..."
-            # Windows: "'xxx' is not recognized..."
-            # Unix: "command not found"
-            if ('not recognized' in stderr_lower or
-                    'command not found' in stderr_lower or
-                    '内部コマンドまたは外部コマンド' in result.stderr or
-                    '用語' in result.stderr and 'コマンドレット' in result.stderr or
-                    'not found' in stderr_lower):
-                cmd_name = (
-                    command.split()[0] if command.split() else command
-                )
-                show_command_not_found(cmd_name)
-            else:
-                # Other errors - print as is
-                print(result.stderr, end='')
+        # Imported here: subprocess is slow to import and not needed
+        # until the first external command
+        from src.shell_executor import run_streaming
+        from src.shell_session import get_shell_session
+
+        # Output is forwarded while the command runs, in the persistent
+        # shell if MAIRU_PERSISTENT_SHELL is set, else in a new shell
+        session = get_shell_session()
+        if session is not None and not confirm_expanded_command(
+                session.expand_definitions(command), command):
+            return
+
+        # Report unknown commands without starting a shell that can only
+        # fail (the persistent shell decides for itself)
+        if report_unresolved_command(command, session is not None):
+            return
+
+        result = session.run(command) if session else run_streaming(command)
+        if result.not_found:
+            cmd_name = command.split()[0] if command.split() else command
+            report_command_not_found(cmd_name)
 
     except FileNotFoundError:
         cmd_name = command.split()[0] if command.split() else command
-        show_command_not_found(cmd_name)
+        report_command_not_found(cmd_name)
     except Exception as e:
         print(f"Error executing command: {e}")
 
@@ -0,0 +1,245 @@
+"""
+Executable index for the $PATH directories.
+
+Maps every command name on $PATH to the file the shell would run (the
+first match in PATH order), so `which`, typo suggestions and
+command-not-found detection answer from a dictionary instead of probing
+the filesystem per lookup.
+
+The index is built once, in a background thread at startup, and kept
+fresh by comparing directory modification times: adding or removing a
+file changes its directory's mtime, so at most every REFRESH_INTERVAL
+seconds a lookup stats the PATH directories and rescans only those that
+changed (or all of them if PATH itself changed).
+
+Directory mtimes miss some changes: `chmod +x` on a file already there,
+or a symlink whose target appears later. A lookup that misses therefore
+probes the PATH directories for that one name before answering, and a
+hit found this way has its directory rescanned at the next check.
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Minimum seconds between two freshness checks of the PATH directories
+REFRESH_INTERVAL = 2.0
+
+_WINDOWS = sys.platform == "win32"
+
+
+def _executable_extensions() -> frozenset:
+    """Get the lowercase extensions Windows runs without typing them."""
+    return frozenset(
+        extension.lower()
+        for extension in os.environ.get(
+            "PATHEXT", ".COM;.EXE;.BAT;.CMD"
+        ).split(os.pathsep)
+        if extension
+    )
+
+
+def scan_directory(directory: str) -> Dict[str, str]:
+    """
+    List the executables in one directory.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        Dictionary of command name -> full path, sorted by name. On
+        Windows, names are lowercase without their PATHEXT extension.
+
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    found = {}
+    extensions = _executable_extensions() if _WINDOWS else ()
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if _WINDOWS:
+                stem, extension = os.path.splitext(entry.name)
+                if extension.lower() in extensions:
+                    found.setdefault(stem.lower(), entry.path)
+            elif entry.is_file() and os.access(entry.path, os.X_OK):
+                found[entry.name] = entry.path
+    return dict(sorted(found.items()))
+
+
+class PathIndex:
+    """Command name -> executable path for $PATH, refreshed by mtime."""
+
+    def __init__(self, path: Optional[str] = None,
+                 refresh_interval: float = REFRESH_INTERVAL):
+        """
+        Initialize the index (nothing is scanned yet).
+
+        Args:
+            path: Search path (default: the PATH environment variable,
+                read at every refresh)
+            refresh_interval: Minimum seconds between freshness checks
+        """
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._checked = 0.0
+
+        # Indexed search path and, per directory, (mtime, listing)
+        self._search_path: Optional[str] = None
+        self._directories: Dict[str, Tuple[Optional[int], Dict[str, str]]] = {}
+        # Merged view: first match in PATH order wins
+        self._executables: Dict[str, str] = {}
+        self._names: Tuple[str, ...] = ()
+        self._version = 0
+
+    def start(self) -> None:
+        """Build the index in a background thread (lookups wait for it)."""
+        with self._lock:
+            if self._thread is not None or self._ready.is_set():
+                return
+            self._thread = threading.Thread(
+                target=self.refresh, name="mairu-path-index", daemon=True
+            )
+        self._thread.start()
+
+    def _current(self) -> None:
+        """Make sure the index is built and recently checked."""
+        if not self._ready.is_set():
+            if self._thread is not None:
+                self._ready.wait()
+            else:
+                self.refresh()
+        elif time.monotonic() - self._checked >= self.refresh_interval:
+            self.refresh()
+
+    def refresh(self) -> bool:
+        """
+        Rescan the PATH directories that changed since the last check.
+
+        Returns:
+            True if the index changed
+        """
+        with self._lock:
+            self._checked = time.monotonic()
+            search_path = self.path if self.path is not None \
+                else os.environ.get("PATH", "")
+            directories = list(dict.fromkeys(
+                directory for directory in search_path.split(os.pathsep)
+                if directory
+            ))
+
+            changed = search_path != self._search_path
+            listings = {}
+            for directory in directories:
+                try:
+                    mtime: Optional[int] = os.stat(directory).st_mtime_ns
+                except OSError:
+                    # Missing directories are common in PATH
+                    mtime = None
+                previous = self._directories.get(directory)
+                if previous is not None and previous[0] == mtime:
+                    listings[directory] = previous
+                    continue
+                try:
+                    listing = scan_directory(directory) if mtime else {}
+                except OSError:
+                    listing = {}
+                listings[directory] = (mtime, listing)
+                changed = True
+
+            if changed:
+                executables: Dict[str, str] = {}
+                for directory in directories:
+                    for name, full_path in listings[directory][1].items():
+                        executables.setdefault(name, full_path)
+                self._executables = executables
+                self._names = tuple(executables)
+                self._version += 1
+
+            self._search_path = search_path
+            self._directories = listings
+
+        self._ready.set()
+        return changed
+
+    @property
+    def version(self) -> int:
+        """Number that changes whenever the set of executables changes."""
+        self._current()
+        return self._version
+
+    def __len__(self) -> int:
+        """Get the number of indexed commands."""
+        self._current()
+        return len(self._executables)
+
+    def lookup(self, name: str) -> Optional[str]:
+        """
+        Find the executable a command name runs.
+
+        Args:
+            name: Command name (on Windows, case-insensitive and with or
+                without its extension)
+
+        Returns:
+            Full path, or None if the name is not on PATH (checked on the
+            filesystem, not only in the index)
+        """
+        self._current()
+        if _WINDOWS:
+            name = name.lower()
+            stem, extension = os.path.splitext(name)
+            if extension in _executable_extensions():
+                name = stem
+        found = self._executables.get(name)
+        if found is None:
+            found = self._probe(name)
+        return found
+
+    def _probe(self, name: str) -> Optional[str]:
+        """
+        Look for a name in the PATH directories directly (index misses).
+
+        Args:
+            name: Command name (normalized as in lookup)
+
+        Returns:
+            Full path, or None if no directory has it
+        """
+        if not name or os.sep in name or (os.altsep and os.altsep in name):
+            return None
+        suffixes = sorted(_executable_extensions()) if _WINDOWS else ("",)
+        for directory in list(self._directories):
+            for suffix in suffixes:
+                candidate = os.path.join(directory, name + suffix)
+                if os.path.isfile(candidate) and \
+                        (_WINDOWS or os.access(candidate, os.X_OK)):
+                    # The index missed it: rescan that directory next time
+                    with self._lock:
+                        self._directories.pop(directory, None)
+                        self._checked = 0.0
+                    return candidate
+        return None
+
+    def names(self) -> List[str]:
+        """
+        List the indexed command names.
+
+        Returns:
+            Names directory by directory in PATH order (sorted within a
+            directory), each once
+        """
+        self._current()
+        return list(self._names)
+
+
+_index = PathIndex()
+
+
+def get_path_index() -> PathIndex:
+    """Get the shared index of the PATH environment variable."""
+    return _index
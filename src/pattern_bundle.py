@@ -0,0 +1,250 @@
+"""
+Cached pattern bundle for MairuCLI.
+
+Loading the pattern catalogs parses several JSON files, validates them
+against their schemas and analyses every regex. The result only changes
+when one of those files changes, so it is stored as a versioned binary
+bundle in the user cache directory and reused on later startups. The
+bundled values are also computed by code (literal extraction, command
+names), so a CRC32 of those modules is part of the bundle key as well.
+
+The bundle is written with marshal (plain dicts, lists, strings and
+frozensets only), so loading it never executes code. hashlib is only
+imported when a source file's mtime or size changed, since importing it
+costs more than reading the bundle.
+"""
+
+import marshal
+import os
+import sys
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.project_paths import get_cache_dir
+
+# Bump when the layout of the cached data changes
+BUNDLE_FORMAT_VERSION = 3
+
+# Set to a non-empty value to always build from the JSON sources
+NO_CACHE_ENV = "MAIRU_NO_CACHE"
+
+# marshal output is only guaranteed to load on the same interpreter version
+_INTERPRETER_TAG = sys.implementation.cache_tag or "python"
+
+# (path, mtime_ns, size) for each source; missing files use -1
+Stamp = Tuple[str, int, int]
+
+
+def code_checksum(modules: Sequence[Path]) -> str:
+    """
+    Get a CRC32 of the modules that compute the bundled data.
+
+    Args:
+        modules: Source files of that code (missing files are skipped)
+
+    Returns:
+        Eight hex digits
+    """
+    crc = 0
+    for module in modules:
+        try:
+            crc = zlib.crc32(Path(module).read_bytes(), crc)
+        except OSError:
+            continue
+    return "%08x" % crc
+
+
+class PatternBundle:
+    """Store pattern data built from source files and reload it while valid."""
+
+    def __init__(self, sources: List[Path], cache_dir: Optional[Path] = None,
+                 key: str = "", code: Sequence[Path] = ()):
+        """
+        Initialize pattern bundle.
+
+        Args:
+            sources: Files the bundled data is built from
+            cache_dir: Directory for the bundle (default: get_cache_dir())
+            key: Extra build settings that invalidate the bundle when changed
+                 (e.g. whether schema validation was available)
+            code: Modules whose code computes the bundled data; editing one
+                  invalidates the bundle
+        """
+        self.sources = [Path(source).resolve() for source in sources]
+        self.cache_dir = Path(cache_dir) if cache_dir else get_cache_dir()
+        self.key = f"{key}\0code={code_checksum(code)}" if code else key
+        self.version = ""
+
+        # One bundle per checkout, so several installs can share a cache dir
+        digest = "%08x" % zlib.crc32(
+            "\n".join(str(source) for source in self.sources).encode("utf-8")
+        )
+        self.path = self.cache_dir / f"patterns-{_INTERPRETER_TAG}-{digest}.bundle"
+
+    def load(self, build: Callable[[], Tuple[Dict, bool]]) -> Dict:
+        """
+        Return bundled data, rebuilding it if any source file changed.
+
+        Source files are compared by mtime and size first; only when those
+        differ are contents hashed, so touching a file does not force a
+        rebuild.
+
+        Args:
+            build: Callable returning (data, cacheable). Data that is not
+                   cacheable (e.g. a file failed validation) is returned but
+                   not written, so its warnings repeat on the next start.
+
+        Returns:
+            Bundled data as produced by build
+        """
+        if os.environ.get(NO_CACHE_ENV):
+            data, _ = build()
+            self.version = self._version(self._hashes())
+            return data
+
+        stamps = self._stamps()
+        cached = self._read()
+        if cached is not None and cached["stamps"] == stamps:
+            self.version = cached["version"]
+            return cached["data"]
+
+        hashes = self._hashes()
+        if cached is not None and cached["hashes"] == hashes:
+            # Files were touched but not changed: refresh stamps only
+            self.version = cached["version"]
+            self._write(stamps, hashes, cached["data"])
+            return cached["data"]
+
+        return self._build(build, stamps, hashes)
+
+    def rebuild(self, build: Callable[[], Tuple[Dict, bool]]) -> Tuple[Dict, bool]:
+        """
+        Build the data and write the bundle regardless of its current state.
+
+        Args:
+            build: Callable returning (data, cacheable)
+
+        Returns:
+            Tuple of (data, written) where written is True if the bundle
+            file was updated
+        """
+        stamps = self._stamps()
+        hashes = self._hashes()
+        data, cacheable = build()
+        self.version = self._version(hashes)
+        written = cacheable and self._write(stamps, hashes, data)
+        return data, written
+
+    def invalidate(self) -> None:
+        """Delete the bundle file so the next load rebuilds it."""
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+    def _build(self, build: Callable[[], Tuple[Dict, bool]],
+               stamps: List[Stamp], hashes: List[str]) -> Dict:
+        """Build data from sources and write it if cacheable."""
+        data, cacheable = build()
+        self.version = self._version(hashes)
+        if cacheable:
+            self._write(stamps, hashes, data)
+        return data
+
+    def _stamps(self) -> List[Stamp]:
+        """Get (path, mtime_ns, size) for every source file."""
+        stamps = []
+        for source in self.sources:
+            try:
+                stat = source.stat()
+                stamps.append((str(source), stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamps.append((str(source), -1, -1))
+        return stamps
+
+    def _hashes(self) -> List[str]:
+        """Get the sha256 of every source file ('' if missing)."""
+        import hashlib
+
+        hashes = []
+        for source in self.sources:
+            try:
+                hashes.append(hashlib.sha256(source.read_bytes()).hexdigest())
+            except OSError:
+                hashes.append("")
+        return hashes
+
+    def _version(self, hashes: List[str]) -> str:
+        """Derive a short version id from the bundle settings and contents."""
+        import hashlib
+
+        digest = hashlib.sha256()
+        digest.update(f"{BUNDLE_FORMAT_VERSION}\0{self.key}".encode("utf-8"))
+        for source, content_hash in zip(self.sources, hashes):
+            digest.update(f"\0{source.name}\0{content_hash}".encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    def _read(self) -> Optional[Dict]:
+        """
+        Read the bundle file.
+
+        Returns:
+            Bundle contents, or None if missing, corrupt or built with
+            different settings
+        """
+        try:
+            with open(self.path, "rb") as f:
+                bundle = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if not isinstance(bundle, dict):
+            return None
+        if bundle.get("format") != BUNDLE_FORMAT_VERSION:
+            return None
+        if bundle.get("key") != self.key:
+            return None
+        if not all(field in bundle for field in
+                   ("stamps", "hashes", "version", "data")):
+            return None
+        return bundle
+
+    def _write(self, stamps: List[Stamp], hashes: List[str], data: Dict) -> bool:
+        """
+        Atomically write the bundle file.
+
+        The cache is only an optimisation, so failures (read-only home,
+        full disk) are ignored and the next start simply rebuilds.
+
+        Returns:
+            True if the bundle was written
+        """
+        bundle = {
+            "format": BUNDLE_FORMAT_VERSION,
+            "key": self.key,
+            "stamps": stamps,
+            "hashes": hashes,
+            "version": self.version,
+            "data": data,
+        }
+
+        # Imported here: tempfile is slow to import and only needed on rebuild
+        import tempfile
+
+        try:
+            payload = marshal.dumps(bundle)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(self.cache_dir), prefix=".patterns-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, ValueError):
+            return False
+        return True
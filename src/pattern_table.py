@@ -0,0 +1,162 @@
+"""
+Pattern table for MairuCLI.
+
+Every pattern gets an integer ID: its position in priority order
+(dangerous, then caution, then typo patterns). Matching works on IDs
+only; the reported name, level and catalog metadata (art file, message,
+risk...) are looked up by ID when a warning is actually shown.
+
+Compiled patterns are stored as read-only PatternRecord objects with
+__slots__ instead of catalog dictionaries mutated in place. Records still
+support mapping access (record["risk"], record.get("message")), so code
+written for the catalog dictionaries keeps working. A record built from
+the pattern bundle compiles its regex on first use: most patterns are
+never needed by a session, and compiling them all delayed the prompt.
+"""
+
+import re
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterator, Optional, Tuple
+
+# Verdict levels as small integers (index into LEVEL_NAMES)
+LEVEL_SAFE = 0
+LEVEL_CAUTION = 1
+LEVEL_CRITICAL = 2
+LEVEL_NAMES = ("safe", "caution", "critical")
+LEVEL_CODES = {name: code for code, name in enumerate(LEVEL_NAMES)}
+
+# Pattern ID of a command that matched nothing
+NO_PATTERN = -1
+
+# Verdicts report typo patterns with this prefix (typo_sl)
+TYPO_PREFIX = "typo_"
+
+# Flags every catalog pattern is compiled with
+PATTERN_FLAGS = re.IGNORECASE
+
+# Record fields computed by PatternCompiler rather than read from a catalog
+_DERIVED_FIELDS = ("compiled", "literals", "commands")
+
+
+class PatternRecord(Mapping):
+    """One compiled pattern: regex, prefilter data and catalog metadata."""
+
+    __slots__ = ("name", "pattern", "_compiled", "literals", "commands",
+                 "_metadata")
+
+    def __init__(self, name: str, compiled: Optional[re.Pattern],
+                 literals: Optional[FrozenSet[str]],
+                 commands: Tuple[str, ...], metadata: Dict[str, Any]):
+        """
+        Initialize the record.
+
+        Args:
+            name: Catalog name of the pattern
+            compiled: Compiled regex, or None to compile it on first use
+                (only for patterns already known to compile)
+            literals: Literals every match contains (None if unknown)
+            commands: Commands the pattern applies to ((): any command)
+            metadata: Catalog entry (pattern, category, art_file...);
+                wrapped read-only, not copied
+        """
+        init = object.__setattr__
+        init(self, "name", name)
+        init(self, "pattern", metadata["pattern"])
+        init(self, "_compiled", compiled)
+        init(self, "literals", literals)
+        init(self, "commands", commands)
+        init(self, "_metadata", MappingProxyType(metadata))
+
+    @property
+    def compiled(self) -> re.Pattern:
+        """Get the compiled regex, compiling it on first use."""
+        compiled = self._compiled
+        if compiled is None:
+            compiled = re.compile(self.pattern, PATTERN_FLAGS)
+            object.__setattr__(self, "_compiled", compiled)
+        return compiled
+
+    def __setattr__(self, name: str, value) -> None:
+        """Reject changes (records are shared by every lookup)."""
+        raise AttributeError("PatternRecord is read-only")
+
+    def __getitem__(self, key: str):
+        """Get a derived field or a catalog field."""
+        if key in _DERIVED_FIELDS:
+            return getattr(self, key)
+        return self._metadata[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over catalog field names, then derived field names."""
+        for key in self._metadata:
+            if key not in _DERIVED_FIELDS:
+                yield key
+        yield from _DERIVED_FIELDS
+
+    def __len__(self) -> int:
+        """Get the number of fields."""
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Show the name and source of the pattern."""
+        return f"PatternRecord({self.name!r}, {self.pattern!r})"
+
+
+class PatternTable:
+    """Read-only table of all patterns, indexed by pattern ID."""
+
+    __slots__ = ("records", "names", "levels", "_ids")
+
+    def __init__(self, dangerous: Mapping, caution: Mapping, typo: Mapping):
+        """
+        Number the patterns of all catalogs in priority order.
+
+        Args:
+            dangerous: Compiled dangerous patterns (already in priority order)
+            caution: Compiled caution patterns
+            typo: Compiled typo patterns
+        """
+        records = []
+        names = []
+        levels = []
+        for level, patterns, prefix in (
+            (LEVEL_CRITICAL, dangerous, ""),
+            (LEVEL_CAUTION, caution, ""),
+            (LEVEL_CRITICAL, typo, TYPO_PREFIX),
+        ):
+            for name, data in patterns.items():
+                records.append(data)
+                names.append(f"{prefix}{name}")
+                levels.append(level)
+
+        # Records, reported names and level codes by pattern ID
+        self.records: Tuple[Mapping, ...] = tuple(records)
+        self.names: Tuple[str, ...] = tuple(names)
+        self.levels: bytes = bytes(levels)
+
+        # Reported name -> ID (the first, highest-priority one wins)
+        self._ids: Dict[str, int] = {}
+        for pattern_id, name in enumerate(names):
+            self._ids.setdefault(name, pattern_id)
+
+    def __len__(self) -> int:
+        """Get the number of patterns."""
+        return len(self.records)
+
+    def __getitem__(self, pattern_id: int) -> Mapping:
+        """Get the record of a pattern ID."""
+        return self.records[pattern_id]
+
+    def id_of(self, name: str) -> int:
+        """
+        Get the ID of a reported pattern name.
+
+        Args:
+            name: Pattern name as in verdicts (typo patterns start with
+                TYPO_PREFIX)
+
+        Returns:
+            Pattern ID, or NO_PATTERN if the table has no such pattern
+        """
+        return self._ids.get(name, NO_PATTERN)
@@ -5,6 +5,8 @@ Provides reliable absolute paths to project directories regardless of
 current working directory or execution context.
 """
 
+import os
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -88,6 +90,28 @@ def get_builtins_dir() -> Path:
     return get_data_dir() / "builtins"
 
 
+def get_cache_dir() -> Path:
+    """
+    Get absolute path to the per-user cache directory.
+
+    MAIRU_CACHE_DIR overrides the location. Otherwise the platform cache
+    directory is used (LOCALAPPDATA on Windows, XDG_CACHE_HOME or
+    ~/.cache elsewhere). The directory is not created here.
+
+    Returns:
+        Absolute Path to the MairuCLI cache directory
+    """
+    override = os.environ.get("MAIRU_CACHE_DIR")
+    if override:
+        return Path(override).expanduser().resolve()
+
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "mairu" / "cache"
+
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base).expanduser().resolve() / "mairu"
+
+
 # Cache the project root at module import time
 _PROJECT_ROOT: Optional[Path] = None
 
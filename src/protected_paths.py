@@ -0,0 +1,212 @@
+"""
+Protected directory index for MairuCLI system directory protection.
+
+Protected directory rules are normalized once and stored in a trie of
+path components, so checking a path costs one step per path component no
+matter how many directories are protected. Rules come from
+data/warnings/protected_directories.json and site overlays:
+
+- "/mnt/backup": the directory and everything below it
+- {"glob": "/srv/db/*"}: every match (one path component per glob
+  component) and everything below it; stored under its literal prefix,
+  so it is only tried for paths inside /srv/db
+- {"regex": "^/data/[0-9]+(/|$)"}: paths the regex matches from the start
+"""
+
+import os
+import re
+from fnmatch import translate
+from typing import Dict, Iterable, List, Optional, Union
+
+from src.path_resolver import PathResolver
+
+# Protection levels (a critical rule wins over any caution rule that also
+# matches the path)
+LEVEL_CRITICAL = "critical"
+LEVEL_CAUTION = "caution"
+
+_PRECEDENCE = {"": 0, LEVEL_CAUTION: 1, LEVEL_CRITICAL: 2}
+
+# Characters that make a glob component a wildcard
+_GLOB_CHARS = frozenset("*?[")
+
+Rule = Union[str, Dict[str, str]]
+
+
+def split_components(path: str) -> List[str]:
+    """
+    Split a normalized path into components.
+
+    Trailing separators are ignored, so the root directory is a single
+    empty component and "/etc" is ["", "etc"].
+
+    Args:
+        path: Normalized absolute path
+
+    Returns:
+        List of path components
+    """
+    return path.rstrip(os.sep).split(os.sep)
+
+
+def _new_node() -> Dict:
+    """Create an empty trie node."""
+    return {"children": {}, "level": "", "globs": []}
+
+
+class ProtectedPathIndex:
+    """Trie of protected directory rules, keyed by path component."""
+
+    def __init__(self, critical: Iterable[Rule] = (),
+                 caution: Iterable[Rule] = (),
+                 resolver: Optional[PathResolver] = None):
+        """
+        Initialize the index.
+
+        Args:
+            critical: Rules for directories that must never be modified
+            caution: Rules for directories that need confirmation
+            resolver: PathResolver used to normalize directories
+        """
+        self.resolver = resolver or PathResolver()
+        self._root: Dict = _new_node()
+        self._size = 0
+        self._regexes: Dict[str, List[str]] = {
+            LEVEL_CRITICAL: [], LEVEL_CAUTION: []
+        }
+        self._compiled: Dict[str, Optional[re.Pattern]] = {}
+
+        for rule in critical:
+            self.add(rule, LEVEL_CRITICAL)
+        for rule in caution:
+            self.add(rule, LEVEL_CAUTION)
+
+    def __len__(self) -> int:
+        """Get the number of protection rules."""
+        return self._size
+
+    def add(self, rule: Rule, level: str) -> None:
+        """
+        Protect the paths a rule matches and everything below them.
+
+        Args:
+            rule: Directory path, {"glob": pattern} or {"regex": pattern}
+            level: LEVEL_CRITICAL or LEVEL_CAUTION
+
+        Raises:
+            ValueError: If the rule is not one of the supported forms
+        """
+        if isinstance(rule, str):
+            self._add_directory(rule, level)
+        elif isinstance(rule, dict) and "glob" in rule:
+            self._add_glob(rule["glob"], level)
+        elif isinstance(rule, dict) and "regex" in rule:
+            self._regexes[level].append(rule["regex"])
+            self._compiled.pop(level, None)
+            self._size += 1
+        else:
+            raise ValueError(f"Invalid protected directory rule: {rule!r}")
+
+    def _node(self, components: List[str]) -> Dict:
+        """Get (creating as needed) the trie node for a component path."""
+        node = self._root
+        for component in components:
+            node = node["children"].setdefault(component, _new_node())
+        return node
+
+    def _add_directory(self, directory: str, level: str) -> None:
+        """Protect a directory (normalized here, once)."""
+        normalized = self.resolver.normalize_for_comparison(directory)
+        node = self._node(split_components(normalized))
+
+        if not node["level"]:
+            self._size += 1
+        if _PRECEDENCE[level] > _PRECEDENCE[node["level"]]:
+            node["level"] = level
+
+    def _add_glob(self, pattern: str, level: str) -> None:
+        """Protect glob matches, stored under the glob's literal prefix."""
+        normalized = self.resolver.normalize_for_comparison(pattern)
+        components = split_components(normalized)
+
+        literal = 0
+        while literal < len(components) and \
+                _GLOB_CHARS.isdisjoint(components[literal]):
+            literal += 1
+        if literal == len(components):
+            # No wildcards: a plain directory
+            self._add_directory(pattern, level)
+            return
+
+        matchers = [re.compile(translate(component))
+                    for component in components[literal:]]
+        self._node(components[:literal])["globs"].append((matchers, level))
+        self._size += 1
+
+    def _regex(self, level: str) -> Optional[re.Pattern]:
+        """Get the combined regex rules for a level (compiled on first use)."""
+        if level not in self._compiled:
+            sources = self._regexes[level]
+            flags = 0 if self.resolver.case_sensitive else re.IGNORECASE
+            self._compiled[level] = re.compile(
+                "|".join(f"(?:{source})" for source in sources), flags
+            ) if sources else None
+        return self._compiled[level]
+
+    def lookup(self, resolved_path: str) -> str:
+        """
+        Get the protection level of a path.
+
+        Args:
+            resolved_path: Path from PathResolver.resolve_path
+
+        Returns:
+            LEVEL_CRITICAL if a critical rule matches the path (or a
+            directory containing it), else LEVEL_CAUTION if a caution rule
+            does, else ""
+        """
+        level = ""
+        components = split_components(resolved_path)
+
+        node = self._root
+        depth = 0
+        while True:
+            # Globs stored here match the components after this node
+            for matchers, glob_level in node["globs"]:
+                if _PRECEDENCE[glob_level] > _PRECEDENCE[level] and \
+                        self._glob_matches(matchers, components, depth):
+                    if glob_level == LEVEL_CRITICAL:
+                        return LEVEL_CRITICAL
+                    level = glob_level
+
+            if depth == len(components):
+                break
+            node = node["children"].get(components[depth])
+            if node is None:
+                break
+            depth += 1
+
+            if node["level"] == LEVEL_CRITICAL:
+                return LEVEL_CRITICAL
+            if node["level"]:
+                level = node["level"]
+
+        critical = self._regex(LEVEL_CRITICAL)
+        if critical is not None and critical.match(resolved_path):
+            return LEVEL_CRITICAL
+        if not level:
+            caution = self._regex(LEVEL_CAUTION)
+            if caution is not None and caution.match(resolved_path):
+                level = LEVEL_CAUTION
+        return level
+
+    @staticmethod
+    def _glob_matches(matchers: List[re.Pattern], components: List[str],
+                      start: int) -> bool:
+        """Check the glob components against the path from `start` on."""
+        if len(components) - start < len(matchers):
+            return False
+        return all(
+            matcher.match(component)
+            for matcher, component in zip(matchers, components[start:])
+        )
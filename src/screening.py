@@ -0,0 +1,448 @@
+"""
+Non-interactive command screening for MairuCLI.
+
+Runs commands through the same checks as the REPL (system directory
+protection, dangerous/caution patterns, redirection targets) without
+rendering warnings, sleeping or prompting, and reports one JSON verdict
+per command. Used by `python -m src.main --check` to screen CI logs and
+shell history archives.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import (
+    Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+)
+
+# Layers that can produce a verdict, in the order the REPL checks them
+LAYER_SYSTEM_DIRECTORY = "system_directory"
+LAYER_PATTERN = "pattern"
+LAYER_REDIRECTION = "redirection"
+
+# Commands sent to each worker at a time (amortizes inter-process overhead)
+WORKER_CHUNK_SIZE = 256
+
+# Target size of one input file shard. Many small shards keep all workers
+# busy to the end and bound how much finished output waits to be merged.
+SHARD_BYTES = 1 << 20
+
+# Exit codes for --check
+EXIT_OK = 0
+EXIT_CRITICAL_FOUND = 1
+EXIT_USAGE_ERROR = 2
+
+
+def _verdict(command: str, level: str, layer: str = "",
+             pattern: str = "", path: str = "") -> Dict[str, str]:
+    """Build a verdict dictionary (field order is the JSON output order)."""
+    return {
+        "command": command,
+        "level": level,
+        "layer": layer,
+        "pattern": pattern,
+        "path": path,
+    }
+
+
+class CommandChecks(NamedTuple):
+    """Raw results of every screening layer for one command."""
+
+    sys_level: str
+    sys_path: str
+    level: str
+    pattern_name: str
+    redirect_target: str
+    redirect_pattern: str
+
+
+def check_layers(command: str) -> CommandChecks:
+    """
+    Run all screening layers on a command without acting on the results.
+
+    Unlike the REPL, every layer runs even when an earlier one is
+    critical, so the result can be cached and replayed in order.
+
+    Args:
+        command: Command string
+
+    Returns:
+        CommandChecks; redirect_pattern is empty unless the redirection
+        target is dangerous
+    """
+    from src.interceptor import (
+        check_command,
+        check_redirection_target,
+        check_system_directory
+    )
+    from src.shell_lexer import parse_command
+
+    # Layer 1: System directory protection
+    sys_level, _, sys_path = check_system_directory(command)
+
+    # Layer 2: Dangerous and caution patterns
+    level, pattern_name = check_command(command)
+
+    # Layer 3: Dangerous redirection targets (the first dangerous one in a
+    # chain, else the first target)
+    targets = parse_command(command).output_targets
+    redirect_target = targets[0] if targets else ""
+    redirect_pattern = ""
+    for target in targets:
+        is_dangerous, name = check_redirection_target(target)
+        if is_dangerous:
+            redirect_target, redirect_pattern = target, name
+            break
+
+    return CommandChecks(sys_level, sys_path, level, pattern_name,
+                         redirect_target, redirect_pattern)
+
+
+def screen_command(command: str) -> Dict[str, str]:
+    """
+    Screen one command the way process_command does, without side effects.
+
+    A critical result from any layer wins, because the REPL blocks it even
+    after the user confirms an earlier caution. Otherwise the first
+    caution is reported.
+
+    Args:
+        command: Command string
+
+    Returns:
+        Verdict with command, level ("critical", "caution" or "safe"),
+        layer that decided it, pattern name and targeted path
+    """
+    return _verdict_from_checks(command, check_layers(command))
+
+
+def _verdict_from_checks(command: str,
+                         checks: CommandChecks) -> Dict[str, str]:
+    """Build the verdict for a command from its layer results."""
+    if checks.sys_level == "critical":
+        return _verdict(command, "critical", LAYER_SYSTEM_DIRECTORY,
+                        path=checks.sys_path)
+    if checks.level == "critical":
+        return _verdict(command, "critical", LAYER_PATTERN,
+                        checks.pattern_name)
+    if checks.redirect_pattern:
+        return _verdict(command, "critical", LAYER_REDIRECTION,
+                        checks.redirect_pattern, checks.redirect_target)
+
+    if checks.sys_level == "caution":
+        return _verdict(command, "caution", LAYER_SYSTEM_DIRECTORY,
+                        path=checks.sys_path)
+    if checks.level == "caution":
+        return _verdict(command, "caution", LAYER_PATTERN,
+                        checks.pattern_name)
+    return _verdict(command, "safe")
+
+
+def _load_patterns(report: Optional[TextIO] = None) -> None:
+    """
+    Import the pattern catalogs with loader warnings sent to stderr.
+
+    Also used as the worker initializer, so platforms that spawn workers
+    instead of forking load the patterns once per worker, not per command.
+
+    Args:
+        report: Stream for loader warnings (default: stderr)
+    """
+    import contextlib
+
+    # Loader warnings must not end up in the JSON output
+    with contextlib.redirect_stdout(report or sys.stderr):
+        import src.interceptor
+
+    # Compiled here so forked workers share them instead of each compiling
+    src.interceptor.compile_all_patterns()
+
+
+def _screen_numbered(item: Tuple[int, str]) -> Dict:
+    """Screen a (line number, command) pair (picklable for worker pools)."""
+    from src.verdict_store import check_layers_stored
+
+    line_number, command = item
+    verdict = {"line": line_number}
+    verdict.update(_verdict_from_checks(command, check_layers_stored(command)))
+    return verdict
+
+
+def screen_lines(lines: Iterable[str], workers: int = 1) -> Iterator[Dict]:
+    """
+    Screen commands, one per line, yielding verdicts in input order.
+
+    Blank lines are skipped (as in the REPL) but still counted, so each
+    verdict's "line" field points at its line in the input.
+
+    Args:
+        lines: Input lines (trailing newlines are fine)
+        workers: Number of processes; 1 screens in this process
+
+    Yields:
+        Verdict dictionaries with a 1-based "line" field
+    """
+    stripped = ((number, line.strip()) for number, line in enumerate(lines, 1))
+    items = (item for item in stripped if item[1])
+
+    if workers <= 1:
+        yield from map(_screen_numbered, items)
+        return
+
+    with _create_pool(workers) as pool:
+        yield from pool.imap(_screen_numbered, items, WORKER_CHUNK_SIZE)
+
+
+def _create_pool(workers: int):
+    """
+    Create a worker pool that shares the loaded patterns.
+
+    Patterns are loaded in this process first and the heap is frozen
+    (gc.freeze) while workers fork, so they share the compiled patterns
+    copy-on-write instead of each touching (and copying) them on their
+    first garbage collection. On platforms that spawn workers the
+    initializer loads the patterns once per worker.
+
+    Args:
+        workers: Number of processes
+
+    Returns:
+        multiprocessing.Pool
+    """
+    import gc
+    import multiprocessing
+
+    _load_patterns()
+    gc.freeze()
+    try:
+        return multiprocessing.Pool(workers, initializer=_load_patterns)
+    finally:
+        # Workers keep their frozen copy; this process collects as usual
+        gc.unfreeze()
+
+
+def shard_file(path: str, shards: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into byte ranges that start and end on line boundaries.
+
+    Args:
+        path: File to split
+        shards: Desired number of ranges
+
+    Returns:
+        List of (start, end) byte offsets covering the whole file in
+        order; fewer than requested if the file has too few lines
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+
+    boundaries = [0]
+    with open(path, 'rb') as f:
+        for index in range(1, shards):
+            target = size * index // shards
+            if target <= boundaries[-1]:
+                continue
+            # Move to the start of the line that contains byte `target`
+            # (or `target` itself if a line starts there)
+            f.seek(target - 1)
+            f.readline()
+            boundary = f.tell()
+            if boundaries[-1] < boundary < size:
+                boundaries.append(boundary)
+    boundaries.append(size)
+
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def _flush_store() -> None:
+    """Write this process's buffered verdicts to the persistent store."""
+    from src.verdict_store import get_verdict_store
+
+    store = get_verdict_store()
+    if store is not None:
+        store.flush()
+
+
+def _screen_shard(shard: Tuple[str, int, int]) -> Tuple[int, List[Dict]]:
+    """
+    Screen the lines of one file shard (runs in a worker).
+
+    Args:
+        shard: (path, start, end) from shard_file
+
+    Returns:
+        Tuple of (lines in the shard, verdicts numbered from 1 within it)
+    """
+    path, start, end = shard
+    verdicts = []
+    line_count = 0
+
+    with open(path, 'rb') as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            raw = f.readline()
+            if not raw:
+                break
+            position += len(raw)
+            line_count += 1
+            command = raw.decode('utf-8', errors='replace').strip()
+            if command:
+                verdicts.append(_screen_numbered((line_count, command)))
+
+    # Pool workers are terminated without running exit handlers
+    _flush_store()
+    return line_count, verdicts
+
+
+def screen_file(path: str, workers: int = 1) -> Iterator[Dict]:
+    """
+    Screen a command file, sharding it by byte range across workers.
+
+    Each worker reads its own ranges straight from the file, so input is
+    never sent through the parent. Results are merged back in file order
+    and renumbered to global line numbers.
+
+    Args:
+        path: File with one command per line
+        workers: Number of processes
+
+    Yields:
+        Verdict dictionaries in input order, as screen_lines does
+    """
+    if workers <= 1:
+        # Lines end at "\n" only, as in the shards (a lone "\r" is part of
+        # the line), so every worker count gives the same verdicts
+        with open(path, 'r', encoding='utf-8', errors='replace',
+                  newline='\n') as f:
+            yield from screen_lines(f)
+        return
+
+    size = os.path.getsize(path)
+    shards = max(workers, -(-size // SHARD_BYTES))
+    tasks = [(path, start, end) for start, end in shard_file(path, shards)]
+
+    line_offset = 0
+    with _create_pool(workers) as pool:
+        for line_count, verdicts in pool.imap(_screen_shard, tasks):
+            for verdict in verdicts:
+                verdict["line"] += line_offset
+                yield verdict
+            line_offset += line_count
+
+
+def run_check(source: str, workers: int = 1,
+              output: Optional[TextIO] = None,
+              report: Optional[TextIO] = None) -> int:
+    """
+    Screen a file (or stdin) and write JSON verdict lines.
+
+    Args:
+        source: Path to a file with one command per line, or "-" for stdin
+        workers: Number of processes
+        output: Stream for JSON lines (default: stdout)
+        report: Stream for the throughput summary (default: stderr)
+
+    Returns:
+        EXIT_CRITICAL_FOUND if any command is critical, EXIT_OK otherwise,
+        EXIT_USAGE_ERROR if the input cannot be read
+    """
+    output = output or sys.stdout
+    report = report or sys.stderr
+
+    _load_patterns(report)
+
+    if source == "-":
+        stream = open(sys.stdin.fileno(), 'r', encoding='utf-8',
+                      errors='replace', newline='\n', closefd=False)
+        verdicts = screen_lines(stream, workers)
+    else:
+        try:
+            with open(source, 'rb'):
+                pass
+        except OSError as e:
+            print(f"Error: Cannot read {source}: {e}", file=report)
+            return EXIT_USAGE_ERROR
+        stream = None
+        verdicts = screen_file(source, workers)
+
+    counts = {"critical": 0, "caution": 0, "safe": 0}
+    start = time.perf_counter()
+
+    try:
+        for verdict in verdicts:
+            counts[verdict["level"]] += 1
+            output.write(json.dumps(verdict) + "\n")
+        output.flush()
+    except BrokenPipeError:
+        # Output closed early (e.g. piped into `head`)
+        return EXIT_OK
+    finally:
+        if stream is not None:
+            stream.close()
+
+    elapsed = time.perf_counter() - start
+    total = sum(counts.values())
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(
+        f"Screened {total} commands in {elapsed:.2f}s "
+        f"({rate:,.0f} commands/sec, {workers} worker"
+        f"{'s' if workers != 1 else ''}): "
+        f"{counts['critical']} critical, {counts['caution']} caution, "
+        f"{counts['safe']} safe",
+        file=report
+    )
+
+    return EXIT_CRITICAL_FOUND if counts["critical"] else EXIT_OK
+
+
+def _worker_count(value: str) -> int:
+    """Parse --workers (0 means one per CPU)."""
+    import argparse
+
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid worker count: {value!r}")
+    if workers < 0:
+        raise argparse.ArgumentTypeError("worker count must be 0 or more")
+    return workers or (os.cpu_count() or 1)
+
+
+def run_cli(argv: List[str]) -> int:
+    """
+    Handle MairuCLI command-line options.
+
+    Args:
+        argv: Arguments after the program name
+
+    Returns:
+        Process exit code
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src.main",
+        description="MairuCLI - a Halloween-themed shell that catches "
+                    "dangerous commands. Without options, starts the "
+                    "interactive shell.",
+        epilog="--check exits with 1 if any command is critical, "
+               "0 otherwise.",
+    )
+    parser.add_argument(
+        "--check", nargs="?", const="-", metavar="FILE",
+        help="screen commands (one per line) from FILE or stdin and print "
+             "one JSON verdict per line, without warnings or prompts"
+    )
+    parser.add_argument(
+        "--workers", type=_worker_count, default=1, metavar="N",
+        help="processes to screen with (default: 1, 0: one per CPU)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.check is None:
+        parser.error("--workers can only be used with --check")
+
+    return run_check(args.check, args.workers)
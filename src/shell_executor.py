@@ -0,0 +1,219 @@
+"""
+Streaming system shell executor for MairuCLI.
+
+Runs a command in the system shell and forwards its stdout and stderr
+while it runs, chunk by chunk, instead of capturing everything and
+printing it after the command exits. `tail -f`, builds and `find /`
+show output as it is produced, and memory stays flat however much a
+command prints: each stream is read CHUNK_SIZE bytes at a time and
+decoded incrementally (a multibyte character split between two chunks
+is completed by the next one).
+
+Only the first line of stderr is held back: if it looks like the
+shell's "command not found" message and the command fails, the caller
+shows MairuCLI's own message instead.
+"""
+
+import codecs
+import locale
+import subprocess
+import sys
+import threading
+from typing import NamedTuple, Optional, TextIO
+
+# Bytes read from a pipe at a time (the most buffered per stream)
+CHUNK_SIZE = 64 * 1024
+
+# Most stderr bytes held back to find the end of its first line
+NOT_FOUND_SNIFF_BYTES = 4096
+
+# Seconds a command gets to exit after Ctrl+C before it is killed
+INTERRUPT_GRACE = 0.25
+
+
+class ShellResult(NamedTuple):
+    """Outcome of a command run in the system shell."""
+
+    returncode: int
+    not_found: bool  # The shell reported the command does not exist
+
+
+def is_command_not_found(stderr: str) -> bool:
+    """
+    Check whether shell error output says the command does not exist.
+
+    Args:
+        stderr: Error output of the shell
+
+    Returns:
+        True for "command not found" messages of cmd.exe, PowerShell and
+        POSIX shells
+    """
+    stderr_lower = stderr.lower()
+    # Windows PowerShell: "用語 'xxx' は、コマンドレット..."
+    # Windows CMD: "'xxx' は、内部コマンドまたは外部コマンド..."
+    # Windows: "'xxx' is not recognized..."
+    # Unix: "command not found"
+    return ('not recognized' in stderr_lower or
+            'command not found' in stderr_lower or
+            '内部コマンドまたは外部コマンド' in stderr or
+            '用語' in stderr and 'コマンドレット' in stderr or
+            'not found' in stderr_lower)
+
+
+def _write(output: TextIO, text: str) -> None:
+    """Write text and flush it so it shows up right away."""
+    output.write(text)
+    output.flush()
+
+
+class OutputForwarder:
+    """Decode output chunk by chunk and write it to a text stream."""
+
+    def __init__(self, output: TextIO, encoding: str,
+                 hold_not_found: bool = False):
+        """
+        Initialize the forwarder.
+
+        Args:
+            output: Stream to write decoded text to
+            encoding: Encoding of the child's output
+            hold_not_found: Hold back the first line if it looks like a
+                "command not found" message
+        """
+        self.output = output
+        self._decoder = codecs.getincrementaldecoder(encoding)(
+            errors="replace"
+        )
+        # Bytes of the first line while it is still being sniffed
+        self._head: Optional[bytes] = b"" if hold_not_found else None
+        self.held = ""
+
+    def _release_head(self, final: bool) -> bytes:
+        """Classify the first line; return the bytes after it."""
+        head = self._head
+        self._head = None
+        end = head.find(b"\n") + 1 or len(head)
+        first_line = self._decoder.decode(head[:end], final=final)
+        if is_command_not_found(first_line):
+            self.held = first_line
+        elif first_line:
+            _write(self.output, first_line)
+        return head[end:]
+
+    def feed(self, data: bytes) -> None:
+        """Forward a chunk of output."""
+        if self._head is not None:
+            self._head += data
+            if b"\n" not in self._head and \
+                    len(self._head) < NOT_FOUND_SNIFF_BYTES:
+                return
+            data = self._release_head(final=False)
+
+        text = self._decoder.decode(data)
+        if text:
+            _write(self.output, text)
+
+    def finish(self) -> str:
+        """
+        Forward what is left at the end of the output.
+
+        Returns:
+            The held-back first line, or "" if nothing was held back
+        """
+        data = self._release_head(final=True) if self._head is not None \
+            else b""
+        text = self._decoder.decode(data, final=True)
+        if text:
+            _write(self.output, text)
+        return self.held
+
+    def result(self, returncode: int) -> ShellResult:
+        """
+        Finish the output and classify the command.
+
+        A held-back first line means "command not found" if the command
+        failed; otherwise it is printed after all.
+
+        Args:
+            returncode: Exit code of the command
+
+        Returns:
+            ShellResult
+        """
+        first_line = self.finish()
+        not_found = bool(first_line) and returncode != 0
+        if first_line and not not_found:
+            _write(self.output, first_line)
+        return ShellResult(returncode, not_found)
+
+
+def _forward(pipe, forwarder: OutputForwarder) -> None:
+    """Copy a pipe to a forwarder chunk by chunk until end of file."""
+    while True:
+        chunk = pipe.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        forwarder.feed(chunk)
+
+
+def run_streaming(command: str, output: Optional[TextIO] = None,
+                  encoding: Optional[str] = None) -> ShellResult:
+    """
+    Run a command in the system shell, forwarding its output as it comes.
+
+    Args:
+        command: Command line (shell=True: pipes, redirects and globs work)
+        output: Stream for stdout and stderr (default: sys.stdout)
+        encoding: Encoding of the output (default: the system encoding,
+            cp932 on Japanese Windows, utf-8 on Unix)
+
+    Returns:
+        ShellResult
+
+    Raises:
+        KeyboardInterrupt: If interrupted (the command is stopped first)
+    """
+    if output is None:
+        output = sys.stdout
+    if encoding is None:
+        encoding = locale.getpreferredencoding()
+
+    process = subprocess.Popen(
+        command,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0
+    )
+
+    # stderr is read in a thread so neither pipe can fill up and block
+    # the command while the other one is read
+    stdout = OutputForwarder(output, encoding)
+    stderr = OutputForwarder(output, encoding, hold_not_found=True)
+    stderr_reader = threading.Thread(
+        target=_forward, args=(process.stderr, stderr), daemon=True
+    )
+    stderr_reader.start()
+
+    try:
+        _forward(process.stdout, stdout)
+        stdout.finish()
+        stderr_reader.join()
+        returncode = process.wait()
+    except KeyboardInterrupt:
+        # Ctrl+C reaches the command too; give it a moment to exit
+        try:
+            process.wait(timeout=INTERRUPT_GRACE)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        stderr_reader.join(timeout=INTERRUPT_GRACE)
+        raise
+    finally:
+        process.stdout.close()
+        # A background job of the command may still hold stderr open
+        if not stderr_reader.is_alive():
+            process.stderr.close()
+
+    return stderr.result(returncode)
@@ -0,0 +1,257 @@
+"""
+Shell command lexer for MairuCLI.
+
+Splits a command line into a small syntax tree in one left-to-right
+pass: segments (simple commands) separated by chain operators, each with
+its argv (quotes removed) and redirections, plus heredoc markers. Every
+interception layer reads the same cached tree instead of re-tokenizing
+the command.
+
+The lexer is deliberately forgiving: unterminated quotes run to the end
+of the line and unknown syntax becomes plain words, so a malformed
+command is still checked rather than skipped.
+"""
+
+import re
+import sys
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+# POSIX shells treat backslash as an escape; cmd.exe/PowerShell paths
+# use it as the separator
+POSIX_SHELL = sys.platform != "win32"
+
+# Chain operators that end a segment
+PIPE_OPERATORS = frozenset({"|", "|&"})
+CHAIN_OPERATORS = frozenset({"&&", "||", ";", ";;", "&", "\n", "(", ")"})
+
+# Redirection operators that write to their target
+OUTPUT_REDIRECTS = frozenset({">", ">>", ">|", "&>", "&>>", "<>"})
+
+# Parsed commands kept (commands repeat a lot in interactive use)
+PARSE_CACHE_SIZE = 1024
+
+_REDIRECT = r"(?P<fd>[0-9]+)?(?P<redirect>&>>|&>|>>|>\||>&|>|<<<|<<-|<<|<>|<&|<)"
+_OPERATOR = r"(?P<op>\|\||&&|;;|\|&|[|;&()\n])"
+
+_POSIX_TOKEN = re.compile(
+    r"(?P<space>[ \t\r]+)"
+    r"|" + _REDIRECT +
+    r"|" + _OPERATOR +
+    r"|'(?P<single>[^']*)'?"
+    r'|"(?P<double>(?:[^"\\]|\\.)*)"?'
+    r"|\\(?P<escape>.?)"
+    r"|(?P<plain>[^\s'\"\\|;&()<>]+)",
+    re.DOTALL
+)
+
+_WINDOWS_TOKEN = re.compile(
+    r"(?P<space>[ \t\r]+)"
+    r"|" + _REDIRECT +
+    r"|" + _OPERATOR +
+    r"|'(?P<single>[^']*)'?"
+    r'|"(?P<double>[^"]*)"?'
+    r"|(?P<plain>[^\s'\"|;&()<>]+)",
+    re.DOTALL
+)
+
+# Backslash escapes that are special inside double quotes (POSIX)
+_DOUBLE_QUOTE_ESCAPE = re.compile(r'\\([$`"\\\n])')
+
+
+class Redirect(NamedTuple):
+    """One redirection, e.g. 2>> /var/log/app.log."""
+
+    fd: str
+    op: str
+    target: str
+
+    @property
+    def writes_file(self) -> bool:
+        """Whether the redirection writes to a file (not an fd or heredoc)."""
+        if self.op == ">&":
+            # >&2 duplicates a descriptor; >&file is bash for &>file
+            return bool(self.target) and not (
+                self.target.isdigit() or self.target == "-"
+            )
+        return self.op in OUTPUT_REDIRECTS and bool(self.target)
+
+
+class Segment(NamedTuple):
+    """A simple command: argv, its redirections and what follows it."""
+
+    argv: Tuple[str, ...]
+    redirects: Tuple[Redirect, ...]
+    operator: str
+    text: str
+
+
+class ParsedCommand(NamedTuple):
+    """Syntax tree of one command line."""
+
+    segments: Tuple[Segment, ...]
+    heredocs: Tuple[str, ...]
+    unterminated_quote: bool
+
+    @property
+    def pipelines(self) -> Tuple[Tuple[Segment, ...], ...]:
+        """Group segments into pipelines (split at non-pipe operators)."""
+        pipelines = []
+        current = []
+        for segment in self.segments:
+            current.append(segment)
+            if segment.operator not in PIPE_OPERATORS:
+                pipelines.append(tuple(current))
+                current = []
+        if current:
+            pipelines.append(tuple(current))
+        return tuple(pipelines)
+
+    @property
+    def output_targets(self) -> Tuple[str, ...]:
+        """Files written by output redirections, in command order."""
+        return tuple(
+            redirect.target
+            for segment in self.segments
+            for redirect in segment.redirects
+            if redirect.writes_file
+        )
+
+
+class _SegmentBuilder:
+    """Collect the tokens of one segment."""
+
+    def __init__(self):
+        self.argv = []
+        self.redirects = []
+        self.start: Optional[int] = None
+        self.end = 0
+
+    def mark(self, start: int, end: int) -> None:
+        """Extend the source range of the segment."""
+        if self.start is None:
+            self.start = start
+        self.end = end
+
+    def build(self, command: str, operator: str) -> Optional[Segment]:
+        """Create the Segment, or None if nothing was collected."""
+        if self.start is None:
+            return None
+        return Segment(tuple(self.argv), tuple(self.redirects), operator,
+                       command[self.start:self.end])
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_command(command: str, posix: bool = POSIX_SHELL) -> ParsedCommand:
+    """
+    Parse a command line into segments, redirections and heredoc markers.
+
+    Runs in one pass over the command. Results are cached and immutable,
+    so every layer can share them.
+
+    Args:
+        command: Command line
+        posix: Treat backslash as an escape character (default: not on
+            Windows)
+
+    Returns:
+        ParsedCommand
+    """
+    token_re = _POSIX_TOKEN if posix else _WINDOWS_TOKEN
+    segments = []
+    heredocs = []
+    unterminated = False
+
+    builder = _SegmentBuilder()
+    word: Optional[list] = None     # Pieces of the word being built
+    pending: Optional[list] = None  # [fd, op] waiting for its target
+    position = 0
+
+    def finish_word() -> None:
+        nonlocal word, pending
+        if word is None:
+            return
+        text = "".join(word)
+        word = None
+        if pending is not None:
+            fd, op = pending
+            pending = None
+            if op in ("<<", "<<-"):
+                heredocs.append(text)
+            builder.redirects.append(Redirect(fd, op, text))
+        else:
+            builder.argv.append(text)
+
+    def finish_segment(operator: str) -> None:
+        nonlocal builder, pending
+        finish_word()
+        if pending is not None:
+            # Redirection without a target (e.g. "echo test >")
+            builder.redirects.append(Redirect(pending[0], pending[1], ""))
+            pending = None
+        segment = builder.build(command, operator)
+        if segment is not None:
+            segments.append(segment)
+        builder = _SegmentBuilder()
+
+    length = len(command)
+    while position < length:
+        match = token_re.match(command, position)
+        if match is None:
+            # Only reachable for a lone special character; keep it literal
+            match_end = position + 1
+            builder.mark(position, match_end)
+            word = (word or []) + [command[position]]
+            position = match_end
+            continue
+
+        kind = match.lastgroup
+        start, end = match.span()
+        position = end
+
+        if kind == "space":
+            finish_word()
+            continue
+
+        if kind == "op":
+            finish_segment(match.group("op"))
+            continue
+
+        if kind == "redirect":
+            fd = match.group("fd") or ""
+            if word is not None and fd:
+                # "a2>f" is the word a2 followed by >f
+                word.append(fd)
+                fd = ""
+            finish_word()
+            builder.mark(start, end)
+            if pending is not None:
+                builder.redirects.append(Redirect(pending[0], pending[1], ""))
+            pending = [fd, match.group("redirect")]
+            continue
+
+        builder.mark(start, end)
+        if word is None:
+            word = []
+
+        if kind == "single":
+            word.append(match.group("single"))
+            # The closing quote is optional in the pattern
+            unterminated |= match.end("single") == end
+        elif kind == "double":
+            text = match.group("double")
+            if posix:
+                text = _DOUBLE_QUOTE_ESCAPE.sub(r"\1", text)
+            word.append(text)
+            unterminated |= match.end("double") == end
+        elif kind == "escape":
+            escaped = match.group("escape")
+            # Backslash-newline is a line continuation
+            word.append("" if escaped == "\n" else escaped)
+        else:
+            word.append(match.group("plain"))
+
+    finish_segment("")
+
+    return ParsedCommand(tuple(segments), tuple(heredocs), unterminated)
+
@@ -0,0 +1,500 @@
+"""
+Persistent shell session for MairuCLI.
+
+Optional backend for external commands, enabled with
+MAIRU_PERSISTENT_SHELL=1: instead of starting /bin/sh for every command,
+one interactive shell is kept running on a pseudo-terminal and is sent
+commands over a pipe. Short commands skip shell startup, and shell state
+survives between commands (variables, functions, `set` options, sourced
+files).
+
+Every command is sent as one frame:
+
+    cd -- '<cwd>'; export CHANGED='value'; unset REMOVED
+    { command eval '<command>'
+    } </dev/tty
+    printf '\\037MAIRU<token>:%d\\n' "$?"
+
+The first line replays MairuCLI's own `cd` and `export` builtins, which
+change this process rather than the shell. `command eval` keeps a syntax
+error in the command from making the shell drop the rest of the frame.
+The command reads from the terminal, not from the command pipe, and its
+output is forwarded until the sentinel line, which carries the exit
+status and is never shown.
+
+Aliases and functions defined at the prompt (`command alias x=rm`,
+`f() { ...; }`, or in a file run with `.`/`source`) are recorded, and
+expand_definitions rewrites a command that uses them into what the shell
+will run, so it can be screened: `x -rf /` is checked as `rm -rf /`.
+
+POSIX only (the pty module); elsewhere every command gets its own shell.
+"""
+
+import atexit
+import os
+import re
+import secrets
+import select
+import shlex
+import signal
+import sys
+import time
+from typing import Dict, Optional, TextIO
+
+try:
+    import termios
+except ImportError:
+    # Windows: no pseudo-terminals, the persistent shell is unavailable
+    termios = None
+
+from src.shell_executor import CHUNK_SIZE, OutputForwarder, ShellResult
+from src.shell_lexer import parse_command
+
+# Environment variable that enables the persistent shell
+PERSISTENT_SHELL_ENV = "MAIRU_PERSISTENT_SHELL"
+
+# Shell kept running (the same one subprocess uses for shell=True)
+SHELL = "/bin/sh"
+
+# Seconds the shell gets to start, and to finish a command after Ctrl+C
+START_TIMEOUT = 5.0
+INTERRUPT_GRACE = 1.0
+
+# Environment variable names the shell can export
+_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Function definition: name() body, function name body
+_FUNCTION = re.compile(
+    r"\s*(?:function\s+([A-Za-z_][\w.-]*)\s*(?:\(\s*\))?"
+    r"|([A-Za-z_][\w.-]*)\s*\(\s*\))\s*(\S.*)",
+    re.DOTALL
+)
+
+# Positional parameters in a function body ("$@", $*, ${1}...)
+_ALL_ARGUMENTS = re.compile(r'"?\$(?:[@*]|\{[@*]\})"?')
+_ARGUMENT = re.compile(r"\$(?:([1-9])|\{([1-9])\})")
+
+# Alias bodies may use other aliases; expansion stops after this many rounds
+MAX_EXPANSIONS = 3
+
+
+class ShellSession:
+    """One long-lived shell on a pseudo-terminal."""
+
+    def __init__(self, shell: str = SHELL):
+        """
+        Initialize the session (the shell starts on first use).
+
+        Args:
+            shell: Path of a POSIX shell
+        """
+        self.shell = shell
+        self.pid: Optional[int] = None
+        self._master: Optional[int] = None    # Pseudo-terminal
+        self._commands: Optional[int] = None  # Write end of command pipe
+        self._exported: Dict[str, str] = {}   # Environment the shell has
+        self.aliases: Dict[str, str] = {}     # Name -> replacement text
+        self.functions: Dict[str, str] = {}   # Name -> body
+
+        token = secrets.token_hex(8)
+        self._marker = f"\x1fMAIRU{token}:".encode("ascii")
+        self._sentinel = re.compile(re.escape(self._marker) + rb"(-?\d+)\r?\n")
+        self._report = f"printf '\\037MAIRU{token}:%d\\n' \"$?\"\n"
+
+    @property
+    def alive(self) -> bool:
+        """Whether the shell is running."""
+        if self.pid is not None and \
+                os.waitpid(self.pid, os.WNOHANG)[0] == self.pid:
+            # Ended between commands (killed from outside)
+            self.pid = None
+            self._close_fds()
+        return self.pid is not None
+
+    def start(self) -> None:
+        """
+        Start the shell and wait until it reads commands.
+
+        Raises:
+            OSError: If the shell cannot be started
+        """
+        read_end, write_end = os.pipe()
+        pid, master = os.forkpty()
+        if pid == 0:
+            # Child: the pty is the controlling terminal and stdout/stderr;
+            # commands come from the pipe
+            try:
+                os.dup2(read_end, 0)
+                os.close(read_end)
+                os.close(write_end)
+                # Keep "\n" line ends (output is not always a terminal)
+                attributes = termios.tcgetattr(1)
+                attributes[1] &= ~termios.ONLCR
+                termios.tcsetattr(1, termios.TCSANOW, attributes)
+                os.execv(self.shell, [self.shell, "-i"])
+            finally:
+                os._exit(127)
+
+        os.close(read_end)
+        self.pid, self._master, self._commands = pid, master, write_end
+        self._exported = dict(os.environ)
+        self.aliases.clear()
+        self.functions.clear()
+
+        # No prompts; Ctrl+C stops the command, not the rest of the frame
+        # (an interactive shell drops its pending input when interrupted);
+        # skip whatever the shell prints on startup
+        self._send("PS1=''; PS2=''; trap : INT\n" + self._report)
+        discarded = OutputForwarder(_Discard(), "utf-8")
+        if self._read(discarded, deadline=time.monotonic() + START_TIMEOUT) \
+                is None:
+            self.close()
+            raise OSError(f"{self.shell} did not start")
+
+    def close(self) -> None:
+        """Stop the shell (it is started again on the next command)."""
+        if self.pid is None:
+            return
+        try:
+            os.kill(self.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        self._reap()
+
+    def _close_fds(self) -> None:
+        """Close the command pipe and the terminal."""
+        for fd in (self._commands, self._master):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._master = self._commands = None
+
+    def _reap(self) -> int:
+        """Wait for the exited shell and forget it."""
+        pid, self.pid = self.pid, None
+        self._close_fds()
+        try:
+            _, status = os.waitpid(pid, 0)
+        except ChildProcessError:
+            return -1
+        return os.waitstatus_to_exitcode(status)
+
+    def _send(self, text: str) -> None:
+        """Write text to the shell's command pipe."""
+        data = text.encode(sys.getfilesystemencoding(), "surrogateescape")
+        while data:
+            written = os.write(self._commands, data)
+            data = data[written:]
+
+    def _frame(self, command: str) -> str:
+        """Build the frame that runs a command (see the module docstring)."""
+        setup = [f"cd -- {shlex.quote(os.getcwd())}"]
+        environment = dict(os.environ)
+        for name, value in environment.items():
+            if self._exported.get(name) != value and _NAME.fullmatch(name):
+                setup.append(f"export {name}={shlex.quote(value)}")
+        for name in self._exported.keys() - environment.keys():
+            if _NAME.fullmatch(name):
+                setup.append(f"unset {name}")
+        self._exported = environment
+
+        return ("; ".join(setup) + "\n"
+                f"{{ command eval {shlex.quote(command)}\n}} </dev/tty\n"
+                + self._report)
+
+    def _read(self, forwarder: OutputForwarder,
+              deadline: Optional[float] = None,
+              stdin: Optional[int] = None) -> Optional[int]:
+        """
+        Forward terminal output until the sentinel line.
+
+        Args:
+            forwarder: Where the output goes
+            deadline: time.monotonic() to give up at (default: never)
+            stdin: File descriptor whose input is passed to the command
+
+        Returns:
+            Exit status of the command (of the shell if it exited), or
+            None at the deadline
+        """
+        pending = b""
+        while True:
+            timeout = None if deadline is None else \
+                max(0.0, deadline - time.monotonic())
+            watched = [self._master] if stdin is None \
+                else [self._master, stdin]
+            ready, _, _ = select.select(watched, [], [], timeout)
+            if not ready:
+                forwarder.feed(pending)
+                return None
+
+            if stdin is not None and stdin in ready:
+                data = os.read(stdin, CHUNK_SIZE)
+                if data:
+                    os.write(self._master, data)
+                else:
+                    stdin = None
+            if self._master not in ready:
+                continue
+
+            try:
+                data = os.read(self._master, CHUNK_SIZE)
+            except OSError:
+                # Linux reports a closed terminal as EIO
+                data = b""
+            if not data:
+                # The command ended the shell (exit, exec...)
+                forwarder.feed(pending)
+                return self._reap()
+
+            pending += data
+            match = self._sentinel.search(pending)
+            if match:
+                forwarder.feed(pending[:match.start()])
+                return int(match.group(1))
+
+            # Hold back what may be the start of the sentinel
+            cut = pending.rfind(b"\x1f")
+            if cut != -1 and len(pending) - cut <= len(self._marker) + 16 \
+                    and self._marker.startswith(
+                        pending[cut:cut + len(self._marker)]):
+                forwarder.feed(pending[:cut])
+                pending = pending[cut:]
+            else:
+                forwarder.feed(pending)
+                pending = b""
+
+    def record_definitions(self, command: str) -> None:
+        """
+        Record the aliases and functions a command defines or removes.
+
+        Files run with `.` or `source` are read for definitions too.
+
+        Args:
+            command: Command line sent to the shell
+        """
+        match = _FUNCTION.match(command)
+        if match:
+            self.functions[match.group(1) or match.group(2)] = match.group(3)
+            return
+
+        for segment in parse_command(command).segments:
+            argv = list(segment.argv)
+            while argv and argv[0] in ("command", "builtin"):
+                argv.pop(0)
+            if not argv:
+                continue
+            name, args = argv[0], argv[1:]
+            if name == "alias":
+                for word in args:
+                    alias, equals, value = word.partition("=")
+                    if equals:
+                        self.aliases[alias] = value
+            elif name == "unalias":
+                if "-a" in args:
+                    self.aliases.clear()
+                for alias in args:
+                    self.aliases.pop(alias, None)
+            elif name == "unset" and "-f" in args:
+                for function in args:
+                    self.functions.pop(function, None)
+            elif name in (".", "source") and args:
+                try:
+                    with open(os.path.expanduser(args[0]), "r",
+                              encoding="utf-8", errors="replace") as f:
+                        lines = f.read().splitlines()
+                except OSError:
+                    continue
+                for line in lines:
+                    self.record_definitions(line)
+
+    def expand_definitions(self, command: str) -> str:
+        """
+        Replace the recorded aliases and functions a command uses.
+
+        Args:
+            command: Command line
+
+        Returns:
+            The command with each simple command that starts with an alias
+            or function rewritten to what it runs (simple commands joined
+            by ";"), or the command itself if it uses none
+        """
+        if not self.aliases and not self.functions:
+            return command
+
+        expanded = command
+        for _ in range(MAX_EXPANSIONS):
+            parts = []
+            changed = False
+            for segment in parse_command(expanded).segments:
+                argv = segment.argv
+                if argv and argv[0] in self.aliases:
+                    parts.append(" ".join((self.aliases[argv[0]],) + argv[1:]))
+                    changed = True
+                elif argv and argv[0] in self.functions:
+                    parts.append(_call(self.functions[argv[0]], argv[1:]))
+                    changed = True
+                else:
+                    parts.append(segment.text)
+            if not changed:
+                break
+            expanded = " ; ".join(parts)
+        return expanded
+
+    def _resize(self) -> None:
+        """Give the shell's terminal the size of MairuCLI's terminal."""
+        import fcntl
+        import shutil
+        import struct
+
+        columns, lines = shutil.get_terminal_size()
+        fcntl.ioctl(self._master, termios.TIOCSWINSZ,
+                    struct.pack("HHHH", lines, columns, 0, 0))
+
+    def run(self, command: str, output: Optional[TextIO] = None,
+            encoding: Optional[str] = None) -> ShellResult:
+        """
+        Run a command in the shell, forwarding its output as it comes.
+
+        When MairuCLI runs in a terminal, the terminal is put in raw mode
+        for the command, so keystrokes (including Ctrl+C) go to it.
+
+        Args:
+            command: Command line
+            output: Stream for the output (default: sys.stdout)
+            encoding: Encoding of the output (default: system encoding)
+
+        Returns:
+            ShellResult
+
+        Raises:
+            OSError: If the shell cannot be started
+            KeyboardInterrupt: If interrupted (the command is interrupted
+                too)
+        """
+        if output is None:
+            output = sys.stdout
+        if encoding is None:
+            import locale
+            encoding = locale.getpreferredencoding()
+        if not self.alive:
+            self.start()
+
+        self._send(self._frame(command))
+        forwarder = OutputForwarder(output, encoding, hold_not_found=True)
+
+        stdin = None
+        saved_mode = None
+        if output is sys.stdout and sys.stdin.isatty():
+            stdin = sys.stdin.fileno()
+            saved_mode = _enter_raw_mode(stdin)
+            self._resize()
+
+        try:
+            returncode = self._read(forwarder, stdin=stdin)
+        except KeyboardInterrupt:
+            # Pass Ctrl+C on to the command and let it finish
+            if self.alive:
+                os.write(self._master, b"\x03")
+                if self._read(forwarder,
+                              time.monotonic() + INTERRUPT_GRACE) is None:
+                    self.close()
+            forwarder.finish()
+            raise
+        finally:
+            if saved_mode is not None:
+                termios.tcsetattr(stdin, termios.TCSADRAIN, saved_mode)
+
+        self.record_definitions(command)
+        result = forwarder.result(returncode)
+        if stdin is not None and returncode == 128 + signal.SIGINT:
+            # Ctrl+C was typed into the command; end the "^C" line
+            output.write("\n")
+        return result
+
+
+def _call(body: str, args: tuple) -> str:
+    """
+    Get the text a function body runs with the given arguments.
+
+    Args:
+        body: Function body
+        args: Arguments of the call
+
+    Returns:
+        Body with "$@", $* and $1...$9 replaced by the arguments
+    """
+    joined = " ".join(args)
+    body = _ALL_ARGUMENTS.sub(lambda match: joined, body)
+    return _ARGUMENT.sub(
+        lambda match: args[int(match.group(1) or match.group(2)) - 1]
+        if int(match.group(1) or match.group(2)) <= len(args) else "",
+        body
+    )
+
+
+def _enter_raw_mode(fd: int) -> list:
+    """
+    Pass every keystroke of a terminal through, keeping output intact.
+
+    Args:
+        fd: Terminal file descriptor
+
+    Returns:
+        Previous terminal attributes (for termios.tcsetattr)
+    """
+    import tty
+
+    saved = termios.tcgetattr(fd)
+    tty.setraw(fd, termios.TCSANOW)
+    attributes = termios.tcgetattr(fd)
+    # setraw also stops translating "\n" to "\r\n" on output
+    attributes[1] |= termios.OPOST | termios.ONLCR
+    termios.tcsetattr(fd, termios.TCSANOW, attributes)
+    return saved
+
+
+class _Discard:
+    """Text stream that drops everything."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+_session: Optional[ShellSession] = None
+
+
+def persistent_shell_enabled() -> bool:
+    """Check whether the persistent shell is enabled and supported."""
+    return os.environ.get(PERSISTENT_SHELL_ENV, "") not in ("", "0") and \
+        hasattr(os, "forkpty") and termios is not None
+
+
+def get_shell_session() -> Optional[ShellSession]:
+    """
+    Get the shared shell session, starting it on first use.
+
+    Returns:
+        ShellSession, or None if the persistent shell is disabled or could
+        not be started (commands then get a shell each)
+    """
+    global _session
+    if not persistent_shell_enabled():
+        return None
+    if _session is None:
+        session = ShellSession()
+        try:
+            session.start()
+        except OSError as e:
+            print(f"Warning: Could not start persistent shell: {e}")
+            os.environ[PERSISTENT_SHELL_ENV] = "0"
+            return None
+        atexit.register(session.close)
+        _session = session
+    return _session
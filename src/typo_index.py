@@ -0,0 +1,203 @@
+"""
+Typo suggestion index for MairuCLI.
+
+A SymSpell-style deletion dictionary over the known command names
+(MairuCLI builtins plus every executable in src.path_index): each name
+is stored under itself and under every string one deletion away from
+it. A typed word is looked up under the same variants, so finding every
+name one edit away (a wrong, missing or extra letter, or two swapped
+neighbours) takes one dictionary probe per character, however many
+commands are installed.
+
+A word that is itself a known command or a shell builtin is never a typo.
+"""
+
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+# Shell builtins and keywords: valid first words that are not files on
+# $PATH (and must never be "corrected" to a similar executable)
+SHELL_WORDS = frozenset({
+    # POSIX shells
+    ".", "alias", "bg", "break", "case", "cd", "command", "continue",
+    "declare", "do", "done", "echo", "elif", "else", "esac", "eval", "exec",
+    "exit", "export", "false", "fc", "fg", "fi", "for", "function",
+    "getopts", "hash", "if", "in", "jobs", "kill", "let", "local", "printf",
+    "pwd", "read", "readonly", "return", "select", "set", "shift", "source",
+    "test", "then", "time", "times", "trap", "true", "type", "typeset",
+    "ulimit", "umask", "unalias", "unset", "until", "wait", "while",
+    # cmd.exe
+    "assoc", "call", "chdir", "cls", "color", "copy", "date", "del", "dir",
+    "endlocal", "erase", "ftype", "goto", "md", "mkdir", "mklink", "move",
+    "path", "pause", "popd", "prompt", "pushd", "rd", "rem", "ren",
+    "rename", "rmdir", "setlocal", "start", "title", "ver", "verify", "vol",
+})
+
+# POSIX utilities: a name from this list is a command the user meant,
+# even where it is not installed (at, bc, ed), so it is never blocked as
+# a typo of a similar builtin; the shell reports it missing instead
+STANDARD_UTILITIES = frozenset({
+    "admin", "alias", "ar", "asa", "at", "awk", "basename", "batch", "bc",
+    "bg", "c99", "cal", "cat", "cd", "cflow", "chgrp", "chmod", "chown",
+    "cksum", "cmp", "comm", "command", "compress", "cp", "crontab",
+    "csplit", "ctags", "cut", "cxref", "date", "dd", "delta", "df", "diff",
+    "dirname", "du", "echo", "ed", "env", "ex", "expand", "expr", "false",
+    "fc", "fg", "file", "find", "fold", "fort77", "fuser", "gencat", "get",
+    "getconf", "getopts", "grep", "hash", "head", "iconv", "id", "ipcrm",
+    "ipcs", "jobs", "join", "kill", "lex", "link", "ln", "locale",
+    "localedef", "logger", "logname", "lp", "ls", "m4", "mailx", "make",
+    "man", "mesg", "mkdir", "mkfifo", "more", "mv", "newgrp", "nice", "nl",
+    "nm", "nohup", "od", "paste", "patch", "pathchk", "pax", "pr", "printf",
+    "prs", "ps", "pwd", "qalter", "qdel", "qhold", "qmove", "qmsg",
+    "qrerun", "qrls", "qselect", "qsig", "qstat", "qsub", "read", "renice",
+    "rm", "rmdel", "rmdir", "sact", "sccs", "sed", "sh", "sleep", "sort",
+    "split", "strings", "strip", "stty", "tabs", "tail", "talk", "tee",
+    "test", "time", "touch", "tput", "tr", "true", "tsort", "tty", "type",
+    "ulimit", "umask", "unalias", "uname", "uncompress", "unexpand",
+    "unget", "uniq", "unlink", "uucp", "uudecode", "uuencode", "uustat",
+    "uux", "val", "vi", "wait", "wc", "what", "who", "write", "xargs",
+    "yacc", "zcat",
+})
+
+# Names shorter than this are never suggested (a single edit turns "ls"
+# or "cd" into too many other words)
+MIN_SUGGESTION_LENGTH = 3
+
+# Kinds of edit between a typed word and a suggestion, in the order
+# suggestions are preferred when nothing else tells them apart
+EDIT_MISSING_LAST = "missing_last"
+EDIT_WRONG = "wrong"
+EDIT_SWAPPED = "swapped"
+EDIT_MISSING = "missing"
+EDIT_EXTRA = "extra"
+EDIT_PREFERENCE = {
+    edit: order for order, edit in enumerate(
+        (EDIT_MISSING_LAST, EDIT_WRONG, EDIT_SWAPPED, EDIT_MISSING, EDIT_EXTRA)
+    )
+}
+
+# Characters a command word may contain to be checked for typos (paths,
+# assignments and expansions are never typos)
+_WORD_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_+-."
+)
+
+
+class TypoCandidate(NamedTuple):
+    """A known command one edit away from a typed word."""
+
+    name: str
+    edit: str   # EDIT_* constant
+    rank: int   # Position in the index (builtins before $PATH)
+
+
+def _deletions(word: str) -> List[str]:
+    """Get the word and every string one deletion away from it."""
+    return [word] + [word[:i] + word[i + 1:] for i in range(len(word))]
+
+
+def edit_kind(word: str, name: str) -> str:
+    """
+    Classify a single edit turning a typed word into a command name.
+
+    Args:
+        word: Typed word
+        name: Command name
+
+    Returns:
+        EDIT_* constant, or "" if the two are not exactly one edit apart
+    """
+    if len(word) + 1 == len(name):
+        if name.startswith(word):
+            return EDIT_MISSING_LAST
+        return EDIT_MISSING if word in _deletions(name) else ""
+    if len(word) == len(name) + 1:
+        return EDIT_EXTRA if name in _deletions(word) else ""
+    if len(word) != len(name):
+        return ""
+
+    diffs = [i for i, (a, b) in enumerate(zip(word, name)) if a != b]
+    if len(diffs) == 1:
+        return EDIT_WRONG
+    if len(diffs) == 2 and diffs[1] == diffs[0] + 1 and \
+            word[diffs[0]] == name[diffs[1]] and \
+            word[diffs[1]] == name[diffs[0]]:
+        return EDIT_SWAPPED
+    return ""
+
+
+class TypoIndex:
+    """Deletion dictionary of command names for one-edit typo lookups."""
+
+    def __init__(self, commands: Iterable[str], known: Iterable[str] = (),
+                 fold_case: bool = sys.platform == "win32"):
+        """
+        Initialize the index (the dictionary is built on first lookup).
+
+        Args:
+            commands: Command names that may be suggested, most preferred
+                first (duplicates are ignored)
+            known: More valid words that are never typos nor suggested
+            fold_case: Compare words case-insensitively (Windows)
+        """
+        self.fold_case = fold_case
+        # Command name -> preference rank
+        self._ranks: Dict[str, int] = {}
+        for name in commands:
+            if fold_case:
+                name = name.lower()
+            self._ranks.setdefault(name, len(self._ranks))
+        self._known = frozenset(
+            word.lower() if fold_case else word for word in known
+        ) | self._ranks.keys()
+        # Deletion variant -> names it was derived from
+        self._deletes: Optional[Dict[str, List[str]]] = None
+
+    def __len__(self) -> int:
+        """Get the number of command names."""
+        return len(self._ranks)
+
+    def __contains__(self, word: str) -> bool:
+        """Check whether a word is a known command."""
+        return (word.lower() if self.fold_case else word) in self._known
+
+    def _build(self) -> Dict[str, List[str]]:
+        """Store every suggestable name under its deletion variants."""
+        deletes: Dict[str, List[str]] = {}
+        for name in self._ranks:
+            if len(name) < MIN_SUGGESTION_LENGTH:
+                continue
+            for variant in set(_deletions(name)):
+                deletes.setdefault(variant, []).append(name)
+        return deletes
+
+    def candidates(self, word: str) -> List[TypoCandidate]:
+        """
+        Find the command names one edit away from a typed word.
+
+        Args:
+            word: First word of a command
+
+        Returns:
+            TypoCandidate list in index order; empty if the word is a
+            known command, too short, or not a plain command word
+        """
+        if self.fold_case:
+            word = word.lower()
+        if len(word) < 2 or word in self._known or \
+                not _WORD_CHARS.issuperset(word):
+            return []
+
+        if self._deletes is None:
+            self._deletes = self._build()
+
+        found = {}
+        for variant in _deletions(word):
+            for name in self._deletes.get(variant, ()):
+                if name not in found:
+                    edit = edit_kind(word, name)
+                    if edit:
+                        found[name] = TypoCandidate(
+                            name, edit, self._ranks[name]
+                        )
+        return sorted(found.values(), key=lambda candidate: candidate.rank)
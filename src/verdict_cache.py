@@ -0,0 +1,146 @@
+"""
+Verdict cache for MairuCLI.
+
+Remembers the screening results of recent commands so repeated commands
+(`ls`, `git status`, `make`) skip the system-directory check, pattern
+scan, redirection check and path resolution. Entries are keyed by the
+command text, the current working directory (relative paths resolve
+against it) and the pattern version, so `cd`, a catalog change or an
+install on $PATH never replays a stale verdict.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, TypeVar
+
+# Default number of cached commands (least recently used are evicted)
+DEFAULT_MAX_ENTRIES = 1024
+
+# Commands containing these are expanded from the environment ($VAR, ~,
+# %VAR%) during path resolution, so their verdict can change without the
+# command text or cwd changing. They are always checked fresh.
+UNCACHEABLE_CHARS = frozenset("$~%")
+
+T = TypeVar("T")
+
+
+def _pattern_version() -> Hashable:
+    """Get the version of everything check_command matches against."""
+    from src.interceptor import PATTERN_BUNDLE_VERSION
+    from src.path_index import get_path_index
+
+    # Typo verdicts depend on which commands are installed
+    return PATTERN_BUNDLE_VERSION, get_path_index().version
+
+
+class VerdictCache:
+    """LRU cache of per-command screening results."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached commands (0 disables)
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of cached commands."""
+        return len(self._entries)
+
+    def _key(self, command: str) -> Optional[Hashable]:
+        """Get the cache key for a command, or None if it can't be cached."""
+        if self.max_entries <= 0 or not UNCACHEABLE_CHARS.isdisjoint(command):
+            return None
+        try:
+            cwd = os.getcwd()
+        except OSError:
+            # Working directory was deleted; relative paths are unresolvable
+            return None
+        return command, cwd, _pattern_version()
+
+    def get(self, command: str, compute: Callable[[str], T]) -> T:
+        """
+        Get the cached result for a command, computing it on a miss.
+
+        Args:
+            command: Command string
+            compute: Function that screens the command
+
+        Returns:
+            Result of compute(command), possibly from an earlier call
+        """
+        key = self._key(command)
+        if key is None:
+            self.bypassed += 1
+            return compute(command)
+
+        try:
+            result = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = compute(command)
+        self._entries[key] = result
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Forget all cached results and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.bypassed = 0
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, bypassed, entries, max_entries
+            and hit_rate (0.0-1.0 over cacheable lookups)
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Shared by the REPL
+_cache = VerdictCache()
+
+
+def get_verdict_cache() -> VerdictCache:
+    """Get the REPL's verdict cache."""
+    return _cache
+
+
+def check_layers_cached(command: str):
+    """
+    Run src.screening.check_layers through the REPL's verdict cache.
+
+    Misses fall back to the persistent verdict store before screening.
+
+    Args:
+        command: Command string
+
+    Returns:
+        CommandChecks for the command
+    """
+    from src.verdict_store import check_layers_stored
+
+    return _cache.get(command, check_layers_stored)
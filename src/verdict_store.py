@@ -0,0 +1,387 @@
+"""
+Persistent verdict store for MairuCLI.
+
+Keeps the screening results of path-independent commands in a small
+SQLite database in the user cache directory, so new sessions and batch
+screening runs start warm. Results depend on the pattern data and on the
+checking code, so entries are keyed by a checks version (pattern bundle
+version plus a checksum of the screening modules) and by platform;
+entries from other versions are never read and age out of the store.
+
+Only commands whose paths are all absolute (and that use no environment
+expansion) are stored: anything else depends on the working directory
+or environment of the session that screened it. Commands whose typo
+verdict depends on what is installed on $PATH are not stored either.
+"""
+
+import os
+import sys
+import time
+import zlib
+from typing import Dict, Optional
+
+from src.project_paths import get_cache_dir
+
+STORE_FILENAME = "verdicts.sqlite3"
+
+# Maximum stored commands; the least recently used are evicted beyond it
+MAX_ENTRIES = 100_000
+
+# Fraction of MAX_ENTRIES kept after an eviction (avoids evicting on
+# every flush once the store is full)
+EVICT_TO = 0.9
+
+# Buffered writes are flushed in batches of this size (and at exit)
+FLUSH_EVERY = 256
+
+# How long to wait for another process holding the database lock
+BUSY_TIMEOUT_MS = 1000
+
+# Modules whose code decides a verdict (their checksum is part of the key)
+_CHECK_MODULES = (
+    "interceptor.py",
+    "command_parser.py",
+    "path_resolver.py",
+    "protected_paths.py",
+    "shell_lexer.py",
+    "pattern_table.py",
+    "typo_index.py",
+    "screening.py",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    version TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    command TEXT NOT NULL,
+    checks TEXT NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (version, platform, command)
+);
+CREATE INDEX IF NOT EXISTS verdicts_last_used ON verdicts (last_used);
+"""
+
+# Separates CommandChecks fields in the checks column
+_FIELD_SEPARATOR = "\x1f"
+
+
+def checks_version() -> str:
+    """
+    Get the version of the pattern data and checking code.
+
+    Returns:
+        PATTERN_BUNDLE_VERSION plus a CRC32 of the screening modules
+    """
+    from src.interceptor import PATTERN_BUNDLE_VERSION
+
+    source_dir = os.path.dirname(os.path.abspath(__file__))
+    crc = 0
+    for name in _CHECK_MODULES:
+        try:
+            with open(os.path.join(source_dir, name), 'rb') as f:
+                crc = zlib.crc32(f.read(), crc)
+        except OSError:
+            continue
+    return f"{PATTERN_BUNDLE_VERSION}-{crc:08x}"
+
+
+def is_path_independent(command: str) -> bool:
+    """
+    Check whether a command's verdict is the same in every session.
+
+    Args:
+        command: Command string
+
+    Returns:
+        True if the command expands nothing from the environment and all
+        of its paths are absolute
+    """
+    from src.command_parser import CommandParser
+    from src.verdict_cache import UNCACHEABLE_CHARS
+
+    if not UNCACHEABLE_CHARS.isdisjoint(command):
+        return False
+    try:
+        paths = CommandParser().extract_all_paths(command)
+    except Exception:
+        return False
+    return all(os.path.isabs(path) for path in paths)
+
+
+class VerdictStore:
+    """SQLite-backed store of CommandChecks for path-independent commands."""
+
+    def __init__(self, path: str, version: str,
+                 max_entries: int = MAX_ENTRIES):
+        """
+        Initialize the store (the database is opened on first use).
+
+        Args:
+            path: Database file
+            version: Checks version entries are stored under
+            max_entries: Maximum stored commands
+        """
+        self.path = path
+        self.version = version
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._inherited = None
+        self._pid = None
+        self._failed = False
+        self._pending: Dict[str, str] = {}
+        self._touched: set = set()
+
+    def _connect(self):
+        """Get the database connection, or None if it is unusable."""
+        if self._pid != os.getpid():
+            # Connections must not be used across fork. The inherited one
+            # is kept (not closed) so the parent's locks are left alone.
+            self._inherited = self._connection
+            self._connection = None
+            self._pending.clear()
+            self._touched.clear()
+        if self._connection is not None or self._failed:
+            return self._connection
+
+        # Imported here: sqlite3 is slow to import and only needed once
+        # a command misses the in-memory verdict cache
+        import sqlite3
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=BUSY_TIMEOUT_MS / 1000
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error):
+            # The store is only a cache; run without it
+            self._failed = True
+            return None
+
+        self._connection = connection
+        self._pid = os.getpid()
+        return connection
+
+    def get(self, command: str):
+        """
+        Look up stored checks for a command.
+
+        Args:
+            command: Command string
+
+        Returns:
+            CommandChecks, or None if the command is not stored
+        """
+        import sqlite3
+        from src.screening import CommandChecks
+
+        connection = self._connect()
+        if connection is None:
+            return None
+
+        row = self._pending.get(command)
+        if row is None:
+            try:
+                found = connection.execute(
+                    "SELECT checks FROM verdicts "
+                    "WHERE version = ? AND platform = ? AND command = ?",
+                    (self.version, sys.platform, command)
+                ).fetchone()
+            except sqlite3.Error:
+                found = None
+            if found is None:
+                self.misses += 1
+                return None
+            row = found[0]
+            self._touch(command)
+
+        self.hits += 1
+        return CommandChecks(*row.split(_FIELD_SEPARATOR))
+
+    def put(self, command: str, checks) -> None:
+        """
+        Store the checks for a command (written on the next flush).
+
+        Args:
+            command: Command string
+            checks: CommandChecks from check_layers
+        """
+        if self._connect() is None:
+            return
+        self._pending[command] = _FIELD_SEPARATOR.join(checks)
+        if len(self._pending) >= FLUSH_EVERY:
+            self.flush()
+
+    def _touch(self, command: str) -> None:
+        """Mark a stored command as used (saved on the next flush)."""
+        self._touched.add(command)
+        if len(self._touched) >= FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered entries and evict the least recently used."""
+        import sqlite3
+
+        connection = self._connection
+        if connection is None or self._pid != os.getpid() or \
+                not (self._pending or self._touched):
+            return
+
+        now = int(time.time())
+        key = (self.version, sys.platform)
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?, ?)",
+                    [key + (command, checks, now)
+                     for command, checks in self._pending.items()]
+                )
+                connection.executemany(
+                    "UPDATE verdicts SET last_used = ? "
+                    "WHERE version = ? AND platform = ? AND command = ?",
+                    [(now,) + key + (command,) for command in self._touched]
+                )
+                self._evict(connection)
+        except sqlite3.Error:
+            # Busy or read-only database: drop this batch, it is a cache
+            pass
+        self._pending.clear()
+        self._touched.clear()
+
+    def _evict(self, connection) -> None:
+        """Delete the least recently used entries beyond max_entries."""
+        count = connection.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+        if count <= self.max_entries:
+            return
+        excess = count - int(self.max_entries * EVICT_TO)
+        connection.execute(
+            "DELETE FROM verdicts WHERE rowid IN ("
+            "SELECT rowid FROM verdicts ORDER BY last_used LIMIT ?)",
+            (excess,)
+        )
+
+    def clear(self) -> None:
+        """Delete every stored entry (all versions) and reset counters."""
+        import sqlite3
+
+        self._pending.clear()
+        self._touched.clear()
+        self.hits = self.misses = 0
+        connection = self._connect()
+        if connection is None:
+            return
+        try:
+            with connection:
+                connection.execute("DELETE FROM verdicts")
+            connection.execute("VACUUM")
+        except sqlite3.Error as e:
+            print(f"Warning: Could not clear verdict store {self.path}: {e}")
+
+    def get_stats(self) -> Dict[str, object]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with path, entries (current version), total_entries
+            (all versions), max_entries, size_bytes, hits and misses
+        """
+        import sqlite3
+
+        self.flush()
+        stats = {
+            "path": self.path,
+            "entries": 0,
+            "total_entries": 0,
+            "max_entries": self.max_entries,
+            "size_bytes": 0,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+        connection = self._connect()
+        if connection is None:
+            return stats
+        try:
+            stats["total_entries"] = connection.execute(
+                "SELECT COUNT(*) FROM verdicts"
+            ).fetchone()[0]
+            stats["entries"] = connection.execute(
+                "SELECT COUNT(*) FROM verdicts "
+                "WHERE version = ? AND platform = ?",
+                (self.version, sys.platform)
+            ).fetchone()[0]
+        except sqlite3.Error:
+            pass
+        for suffix in ("", "-wal"):
+            try:
+                stats["size_bytes"] += os.path.getsize(self.path + suffix)
+            except OSError:
+                pass
+        return stats
+
+    def close(self) -> None:
+        """Flush buffered entries and close the database."""
+        self.flush()
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+
+_store: Optional[VerdictStore] = None
+
+
+def get_verdict_store() -> Optional[VerdictStore]:
+    """
+    Get the shared verdict store.
+
+    Returns:
+        VerdictStore in the cache directory, or None if caching is
+        disabled with MAIRU_NO_CACHE
+    """
+    global _store
+    from src.pattern_bundle import NO_CACHE_ENV
+
+    if os.environ.get(NO_CACHE_ENV):
+        return None
+    if _store is None:
+        import atexit
+
+        _store = VerdictStore(
+            str(get_cache_dir() / STORE_FILENAME), checks_version()
+        )
+        atexit.register(_store.close)
+    return _store
+
+
+def check_layers_stored(command: str):
+    """
+    Run src.screening.check_layers through the persistent store.
+
+    Args:
+        command: Command string
+
+    Returns:
+        CommandChecks for the command
+    """
+    from src.interceptor import generic_typo_depends_on_path
+    from src.screening import check_layers
+
+    store = get_verdict_store()
+    if store is None:
+        return check_layers(command)
+
+    # Only path-independent commands are ever stored, and that depends on
+    # the command text alone, so a stored entry needs no further checks.
+    # Commands whose typo verdict depends on what is installed on $PATH
+    # (blocked typos, and near-misses of builtins that are installed) are
+    # never stored, whatever their verdict.
+    checks = store.get(command)
+    if checks is None:
+        checks = check_layers(command)
+        if is_path_independent(command) and \
+                not generic_typo_depends_on_path(command):
+            store.put(command, checks)
+    return checks
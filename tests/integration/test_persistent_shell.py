@@ -0,0 +1,86 @@
+"""
+Integration tests for commands run in the persistent shell.
+
+With MAIRU_PERSISTENT_SHELL=1, functions and aliases defined in one
+command are available to the next. MairuCLI cannot see them, so their
+names must reach the shell instead of being reported as not found.
+"""
+
+import os
+
+import pytest
+
+import src.main as main
+import src.shell_session as shell_session
+from src.main import process_command
+from src.shell_session import PERSISTENT_SHELL_ENV
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "forkpty") or not os.path.exists(shell_session.SHELL),
+    reason="needs pseudo-terminals and /bin/sh"
+)
+
+
+@pytest.fixture
+def persistent_shell(monkeypatch):
+    """Enable the persistent shell; stop it after the test."""
+    monkeypatch.setenv(PERSISTENT_SHELL_ENV, "1")
+    monkeypatch.setattr(shell_session, "_session", None)
+    monkeypatch.setattr(main, "_COMMAND_NOT_FOUND_MESSAGES", [])
+    yield
+    if shell_session._session is not None:
+        shell_session._session.close()
+
+
+class TestPersistentShellDefinitions:
+    """Test session-defined names run instead of being 'not found'."""
+
+    def test_function_defined_in_session(self, persistent_shell, capfd):
+        """Test a shell function runs in a later command."""
+        process_command("myfn() { echo FROM_FN; }")
+        process_command("myfn")
+
+        output = capfd.readouterr().out
+        assert "FROM_FN" in output
+        assert "myfn" not in output.replace("myfn()", "")
+
+    def test_alias_defined_in_session(self, persistent_shell, capfd,
+                                      tmp_path):
+        """Test a shell alias (from a sourced file) runs later."""
+        # `alias` itself is a MairuCLI builtin
+        aliases = tmp_path / "aliases.sh"
+        aliases.write_text("alias boo='echo FROM_ALIAS'\n")
+        process_command(f". {aliases}")
+        process_command("boo")
+
+        assert "FROM_ALIAS" in capfd.readouterr().out
+
+    def test_alias_is_screened_as_what_it_runs(self, persistent_shell,
+                                               monkeypatch):
+        """Test an alias cannot rename a blocked command."""
+        warnings = []
+        monkeypatch.setattr(main, "show_warning",
+                            lambda pattern, command: warnings.append(pattern))
+
+        process_command("command alias x=DROP")
+        process_command("x DATABASE prod")
+
+        assert warnings == ["drop_database"]
+
+    def test_function_is_screened_with_its_arguments(self, persistent_shell,
+                                                     monkeypatch):
+        """Test a function call is checked as its body."""
+        warnings = []
+        monkeypatch.setattr(main, "show_warning",
+                            lambda pattern, command: warnings.append(pattern))
+
+        process_command('runit() { DROP "$@"; }')
+        process_command("runit DATABASE prod")
+
+        assert warnings == ["drop_database"]
+
+    def test_missing_command_still_reported(self, persistent_shell, capfd):
+        """Test the shell's exit status 127 still reports a missing name."""
+        process_command("definitely-missing-command")
+
+        assert "definitely-missing-command" in capfd.readouterr().out
@@ -2,7 +2,6 @@
 
 import sys
 import os
-from unittest.mock import patch
 from io import StringIO
 
 # Add project root to path
@@ -73,9 +72,8 @@ class TestRepeatWarning:
         dangerous_cmd = "rm -rf /"
         pattern_name = "rm_dangerous"
 
-        # Capture output
-        with patch('src.display.warning_components.time.sleep'):
-            show_warning(pattern_name, dangerous_cmd)
+        # Capture output (not a terminal: rendered without delays)
+        show_warning(pattern_name, dangerous_cmd)
 
         captured = capsys.readouterr()
         # Should show some warning output
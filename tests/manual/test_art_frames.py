@@ -0,0 +1,64 @@
+"""
+ASCII art frame cache benchmark.
+
+Compares rendering every warning's art the old way (read the file, then
+colorize it line by line) with the cached frames of
+AsciiRenderer.render_art, for all art files in data/ascii_art/.
+
+Usage:
+    python tests/manual/test_art_frames.py
+"""
+
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.display.ascii_renderer import AsciiRenderer
+from src.project_paths import get_ascii_art_dir
+
+
+ROUNDS = 200
+
+
+def main():
+    """Run the ASCII art frame cache benchmark."""
+    files = sorted(path.name for path in get_ascii_art_dir().glob("*.txt"))
+    renderer = AsciiRenderer()
+
+    print("=" * 70)
+    print("ASCII Art Frame Cache Benchmark")
+    print("=" * 70)
+    print()
+    print(f"{len(files)} art files x {ROUNDS} warnings each")
+    print()
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for name in files:
+            art = renderer.load_art(name)
+            "\n".join(renderer.colorize(line, "red")
+                      for line in art.split("\n"))
+    uncached = (time.perf_counter() - start) / (ROUNDS * len(files))
+
+    renderer.render_art(files[0], "red")  # Warm up
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for name in files:
+            renderer.render_art(name, "red")
+    cached = (time.perf_counter() - start) / (ROUNDS * len(files))
+
+    print(f"{'Rendering':<28} {'Per warning (us)':>17}")
+    print("-" * 70)
+    print(f"{'Read and colorize':<28} {uncached * 1e6:>17.1f}")
+    print(f"{'Cached frame':<28} {cached * 1e6:>17.1f}")
+    print()
+    print(f"Speedup: {uncached / cached:.1f}x")
+    print("=" * 70)
+    return 0 if cached < uncached else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Background jobs benchmark.
+
+Runs slow commands one after another in the foreground, then as
+background jobs (`command &`), and measures how long the prompt is
+blocked and how long all commands take. Background jobs give the prompt
+back at once and overlap.
+
+Usage:
+    python tests/manual/test_background_jobs.py
+"""
+
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.jobs import JobTable
+from src.shell_executor import run_streaming
+
+
+JOBS = 4
+COMMAND = "sleep 0.5; echo done"
+
+
+class NullOutput:
+    """Output that discards everything."""
+
+    def write(self, text):
+        pass
+
+    def flush(self):
+        pass
+
+
+def main():
+    """Run the background jobs benchmark."""
+    if sys.platform == "win32":
+        print("This benchmark uses POSIX shell commands")
+        return 0
+
+    print("=" * 70)
+    print("Background Jobs Benchmark")
+    print("=" * 70)
+    print()
+    print(f"{JOBS} x '{COMMAND}'")
+    print()
+
+    start = time.perf_counter()
+    for _ in range(JOBS):
+        run_streaming(COMMAND, output=NullOutput(), encoding="utf-8")
+    foreground = time.perf_counter() - start
+
+    table = JobTable()
+    start = time.perf_counter()
+    started = []
+    prompt_blocked = 0.0
+    for _ in range(JOBS):
+        begin = time.perf_counter()
+        started.append(table.start(COMMAND, output=NullOutput(),
+                                   encoding="utf-8"))
+        prompt_blocked = max(prompt_blocked, time.perf_counter() - begin)
+    for job in started:
+        job.finished.wait()
+    background = time.perf_counter() - start
+
+    print(f"{'Mode':<14} {'Prompt blocked (ms)':>20} {'All done (ms)':>15}")
+    print("-" * 70)
+    print(f"{'Foreground':<14} {foreground / JOBS * 1000:>20.0f} "
+          f"{foreground * 1000:>15.0f}")
+    print(f"{'Background':<14} {prompt_blocked * 1000:>20.1f} "
+          f"{background * 1000:>15.0f}")
+    print()
+    print(f"Speedup: {foreground / background:.1f}x")
+    print("=" * 70)
+    return 0 if background < foreground else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
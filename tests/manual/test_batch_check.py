@@ -0,0 +1,75 @@
+"""
+Batch command check benchmark.
+
+Measures checking a shell history of a few thousand commands one at a
+time with check_command against a single check_commands call, and
+verifies both give the same verdicts.
+
+Usage:
+    python tests/manual/test_batch_check.py
+"""
+
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.interceptor import check_command, check_commands
+
+
+HISTORY_SIZES = [100, 1000, 5000]
+ROUNDS = 5
+
+# History-like mix: mostly safe, some dangerous, a few typos
+COMMANDS = [
+    "ls -la", "cd ..", "git status", "git commit -m 'fix tests'",
+    "cat README.md | grep install", "python -m pytest -q", "make build",
+    "rm -rf /", "chmod 777 /etc/passwd", "sudo rm -rf /*",
+    "dd if=/dev/zero of=/dev/sda", "git push --force", "sl", "gti status",
+    "docker ps -a", "echo hello > /tmp/out", "npm install", "vim notes.txt",
+]
+
+
+def best_time(func) -> float:
+    """Best of ROUNDS runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    """Run the batch check benchmark."""
+    print("=" * 70)
+    print("Batch Command Check Benchmark")
+    print("=" * 70)
+    print()
+    print(f"{'Commands':>10} {'Loop (ms)':>10} {'Batch (ms)':>11} "
+          f"{'Speedup':>8}")
+    print("-" * 70)
+
+    for size in HISTORY_SIZES:
+        # Distinct strings so per-command caches do not hide the work
+        history = [f"{COMMANDS[i % len(COMMANDS)]} #{i}" for i in range(size)]
+
+        verdicts = check_commands(history)
+        for position, command in enumerate(history):
+            assert verdicts.verdict(position) == check_command(command)
+
+        loop_ms = best_time(lambda: [check_command(c) for c in history])
+        batch_ms = best_time(lambda: check_commands(history))
+
+        print(f"{size:>10} {loop_ms:>10.1f} {batch_ms:>11.1f} "
+              f"{loop_ms / batch_ms:>7.1f}x")
+
+    print()
+    print("=" * 70)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
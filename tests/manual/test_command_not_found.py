@@ -0,0 +1,72 @@
+"""
+Command-not-found benchmark.
+
+Compares discovering a missing command by running it in the system
+shell (what execute_in_system_shell did before: fork a shell, let it
+search $PATH, then read its stderr) with resolving the command word
+before execution (builtins, shell words and the PATH index; no process
+is started).
+
+Usage:
+    python tests/manual/test_command_not_found.py
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.command_resolver import NOT_FOUND, resolve_command
+from src.path_index import get_path_index
+
+
+ITERATIONS = 50
+COMMANDS = ["definitely-missing", "qwertyuiop --help", "notacommand x y"]
+
+
+def per_command(check) -> float:
+    """Average time per command in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for command in COMMANDS:
+            check(command)
+    elapsed = time.perf_counter() - start
+    return elapsed / (ITERATIONS * len(COMMANDS)) * 1000
+
+
+def run_in_shell(command: str) -> bool:
+    """Discover a missing command by running it."""
+    result = subprocess.run(command, shell=True, capture_output=True,
+                            text=True)
+    return result.returncode != 0 and "not found" in result.stderr.lower()
+
+
+def main():
+    """Run the command-not-found benchmark."""
+    print("=" * 70)
+    print("Command-Not-Found Benchmark")
+    print("=" * 70)
+    print()
+
+    get_path_index().refresh()
+    for command in COMMANDS:
+        assert resolve_command(command).kind == NOT_FOUND, command
+
+    shell = per_command(run_in_shell)
+    resolved = per_command(resolve_command)
+
+    print(f"{'Method':<32} {'Per command (ms)':>17}")
+    print("-" * 70)
+    print(f"{'Run in system shell':<32} {shell:>17.3f}")
+    print(f"{'Resolve before execution':<32} {resolved:>17.3f}")
+    print()
+    print(f"Speedup: {shell / resolved:.0f}x")
+    print("=" * 70)
+    return 0 if resolved < shell else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
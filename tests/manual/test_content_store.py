@@ -0,0 +1,87 @@
+"""
+Content store benchmark.
+
+Simulates a session that shows `help` and a warning for every dangerous
+pattern, and counts the JSON files parsed and the time spent parsing.
+Without sharing, every reader parses for itself (simulated by clearing
+the store before each read); with the content store each file is parsed
+once.
+
+Usage:
+    python tests/manual/test_content_store.py
+"""
+
+import json
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import src.content_store as content_store
+from src.builtins.mairu_commands import HelpGenerator
+from src.content_store import get_content_store
+from src.display.content_loader import ContentLoader
+
+
+def session(shared: bool):
+    """Run the simulated session; get (files parsed, seconds parsing)."""
+    store = get_content_store()
+    store.clear()
+    parsed = []
+    load = json.load
+
+    def timed_load(f):
+        start = time.perf_counter()
+        data = load(f)
+        parsed.append(time.perf_counter() - start)
+        return data
+
+    content_store.json.load = timed_load
+    try:
+        def read(action):
+            if not shared:
+                store.clear()
+            return action()
+
+        help_generator = HelpGenerator()
+        read(help_generator.generate_dangerous_commands_help)
+        read(help_generator.generate_caution_commands_help)
+        read(help_generator.generate_builtin_commands_help)
+
+        loader = ContentLoader()
+        catalog = read(loader.load_catalog)
+        for content in catalog.get("warnings", {}).values():
+            # A new loader per warning: its variation cache starts empty
+            loader = ContentLoader()
+            read(loader.load_catalog)
+            read(lambda: loader.get_variations(content.get("variation_set", ""),
+                                               content.get("category")))
+    finally:
+        content_store.json.load = load
+    return len(parsed), sum(parsed)
+
+
+def main():
+    """Run the content store benchmark."""
+    print("=" * 70)
+    print("Content Store Benchmark")
+    print("=" * 70)
+    print()
+
+    unshared = session(shared=False)
+    shared = session(shared=True)
+
+    print(f"{'Readers':<22} {'Files parsed':>13} {'Parsing (ms)':>13}")
+    print("-" * 70)
+    print(f"{'Each parses its own':<22} {unshared[0]:>13} "
+          f"{unshared[1] * 1000:>13.2f}")
+    print(f"{'Shared content store':<22} {shared[0]:>13} "
+          f"{shared[1] * 1000:>13.2f}")
+    print("=" * 70)
+    return 0 if shared[0] < unshared[0] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
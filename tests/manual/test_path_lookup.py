@@ -0,0 +1,89 @@
+"""
+PATH lookup benchmark.
+
+Compares finding commands by probing every $PATH directory (what `which`
+did before, one stat per directory per lookup) with the PATH index
+(a dictionary lookup plus, at most every REFRESH_INTERVAL seconds, one
+stat per directory). Also times the initial index build, which runs in
+a background thread while the welcome banner plays.
+
+Usage:
+    python tests/manual/test_path_lookup.py
+"""
+
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.path_index import PathIndex
+
+
+ITERATIONS = 2000
+
+# Found early, found late, and missing (the worst case: every directory)
+NAMES = ["ls", "python3", "git", "mkdi", "no-such-command"]
+
+
+def probe(name: str, directories: list) -> str:
+    """Find a command by checking every PATH directory."""
+    for directory in directories:
+        candidate = os.path.join(directory, name)
+        if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            return candidate
+    return ""
+
+
+def per_lookup(lookup) -> float:
+    """Average time per lookup in microseconds."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for name in NAMES:
+            lookup(name)
+    elapsed = time.perf_counter() - start
+    return elapsed / (ITERATIONS * len(NAMES)) * 1_000_000
+
+
+def main():
+    """Run the PATH lookup benchmark."""
+    print("=" * 70)
+    print("PATH Lookup Benchmark")
+    print("=" * 70)
+    print()
+
+    directories = [d for d in os.environ.get("PATH", "").split(os.pathsep)
+                   if d]
+    index = PathIndex()
+
+    start = time.perf_counter()
+    index.refresh()
+    build = (time.perf_counter() - start) * 1000
+    print(f"PATH directories: {len(directories)}")
+    print(f"Indexed commands: {len(index)}")
+    print(f"Initial build:    {build:.1f} ms (background thread)")
+    print()
+
+    for name in NAMES:
+        expected = probe(name, directories) or None
+        assert index.lookup(name) == expected, name
+
+    probing = per_lookup(lambda name: probe(name, directories))
+    indexed = per_lookup(index.lookup)
+    index.refresh_interval = 0
+    refreshing = per_lookup(index.lookup)
+
+    print(f"{'Method':<32} {'Lookup (us)':>12}")
+    print("-" * 70)
+    print(f"{'Probe every directory':<32} {probing:>12.2f}")
+    print(f"{'PATH index':<32} {indexed:>12.2f}")
+    print(f"{'PATH index, mtime check each':<32} {refreshing:>12.2f}")
+    print()
+    print(f"Speedup: {probing / indexed:.0f}x")
+    print("=" * 70)
+    return 0 if indexed < probing else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
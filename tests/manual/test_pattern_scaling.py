@@ -0,0 +1,153 @@
+"""
+Pattern catalog scaling benchmark.
+
+Measures how the cost of checking one command grows as the pattern
+catalog goes from the shipped 14 dangerous patterns to 1,000+ site rules.
+Compares the single-scan PatternMatcher with the sequential per-pattern
+loop that check_command used before, and reports how many patterns the
+literal prefilter leaves to evaluate per command.
+
+Usage:
+    python tests/manual/test_pattern_scaling.py
+"""
+
+import os
+import random
+import string
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.interceptor import (
+    DANGEROUS_PATTERNS,
+    CAUTION_PATTERNS,
+    TYPO_PATTERNS,
+    PatternCompiler,
+    PatternMatcher
+)
+
+
+CATALOG_SIZES = [14, 50, 100, 250, 500, 1000, 2000]
+ITERATIONS = 200
+
+# Mostly safe commands, like a real session
+COMMANDS = [
+    "ls -la",
+    "git status",
+    "make -j8 all",
+    "python script.py --flag value",
+    "cat /tmp/some/long/path/file.txt | grep foo",
+    "docker compose up -d",
+    "cd .. && ls",
+    "rm -rf /",
+    "chmod 777 file.txt",
+]
+
+
+def build_catalog(size: int) -> dict:
+    """
+    Build a dangerous catalog of the given size.
+
+    The shipped patterns come first; the rest are synthetic site rules
+    shaped like real ones (tool name, flag, target path).
+
+    Args:
+        size: Total number of dangerous patterns
+
+    Returns:
+        Dictionary of pattern data ready for PatternCompiler
+    """
+    rng = random.Random(size)
+    catalog = {
+        name: {"pattern": data["pattern"]}
+        for name, data in list(DANGEROUS_PATTERNS.items())[:size]
+    }
+
+    index = 0
+    while len(catalog) < size:
+        tool = ''.join(rng.choice(string.ascii_lowercase) for _ in range(6))
+        catalog[f"site_rule_{index}"] = {
+            "pattern": rf"{tool}\s+--(purge|wipe)\s+/srv/data{index}"
+        }
+        index += 1
+
+    return PatternCompiler().compile_patterns(catalog)
+
+
+def sequential_match(entries: list, command: str) -> tuple:
+    """Check patterns one by one (previous check_command behaviour)."""
+    for level, name, compiled in entries:
+        if compiled.search(command):
+            return level, name
+    return "safe", ""
+
+
+def time_per_command(func, iterations: int = ITERATIONS) -> float:
+    """
+    Measure average time per command in microseconds.
+
+    Args:
+        func: Callable taking one command string
+        iterations: Number of passes over COMMANDS
+
+    Returns:
+        Average microseconds per command
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for command in COMMANDS:
+            func(command)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(COMMANDS)) * 1_000_000
+
+
+def main():
+    """Run the scaling benchmark."""
+    print("=" * 70)
+    print("Pattern Catalog Scaling Benchmark")
+    print("=" * 70)
+    print()
+    print(f"Caution patterns: {len(CAUTION_PATTERNS)}, "
+          f"typo patterns: {len(TYPO_PATTERNS)} (added to every catalog)")
+    print(f"Commands per pass: {len(COMMANDS)}, passes: {ITERATIONS}")
+    print()
+    print(f"{'Patterns':>9} {'Build (ms)':>11} {'Sequential (us)':>16} "
+          f"{'Matcher (us)':>13} {'Speedup':>8} {'Candidates':>11}")
+    print("-" * 70)
+
+    for size in CATALOG_SIZES:
+        dangerous = build_catalog(size)
+
+        start = time.perf_counter()
+        matcher = PatternMatcher(dangerous, CAUTION_PATTERNS, TYPO_PATTERNS)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        entries = [
+            (level, name, record['compiled'])
+            for (level, name), record in zip(matcher.patterns(),
+                                             matcher.table.records)
+        ]
+        for command in COMMANDS:
+            assert matcher.match(command) == sequential_match(entries, command)
+
+        sequential_us = time_per_command(
+            lambda command: sequential_match(entries, command)
+        )
+        matcher_us = time_per_command(matcher.match)
+        candidates = sum(
+            len(matcher.candidates(command)) for command in COMMANDS
+        ) / len(COMMANDS)
+
+        print(f"{len(matcher):>9} {build_ms:>11.1f} {sequential_us:>16.1f} "
+              f"{matcher_us:>13.1f} {sequential_us / matcher_us:>7.1f}x "
+              f"{candidates:>11.1f}")
+
+    print()
+    print("=" * 70)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
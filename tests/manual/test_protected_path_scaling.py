@@ -0,0 +1,119 @@
+"""
+Protected directory scaling benchmark.
+
+Measures how the cost of looking up one resolved path grows as the
+protected directory list goes from the shipped defaults to thousands of
+site-specific mount points. Compares the ProtectedPathIndex trie with the
+linear loop check_system_directory used before (which also re-normalized
+every protected directory on each lookup).
+
+Usage:
+    python tests/manual/test_protected_path_scaling.py
+"""
+
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.path_resolver import PathResolver
+from src.protected_paths import ProtectedPathIndex
+
+
+DIRECTORY_COUNTS = [15, 100, 500, 1000, 5000]
+ITERATIONS = 200
+
+DEFAULT_CRITICAL = ["/bin", "/sbin", "/boot", "/etc", "/lib", "/lib64",
+                    "/proc", "/sys", "/root", "/dev"]
+DEFAULT_CAUTION = ["/usr/bin", "/usr/sbin", "/usr/lib", "/var/log", "/usr"]
+
+# Resolved paths like check_system_directory sees them
+PATHS = [
+    "/home/user/project/build",
+    "/tmp/scratch.txt",
+    "/etc/hosts",
+    "/usr/local/bin/tool",
+    "/srv/db/shard42/data",
+    "/mnt/backup/2024/archive.tar",
+]
+
+
+def linear_lookup(resolver: PathResolver, critical: list, caution: list,
+                  path: str) -> str:
+    """Check every directory in turn (previous check_system_directory loop)."""
+    for level, directories in (("critical", critical), ("caution", caution)):
+        for directory in directories:
+            normalized = resolver.normalize_for_comparison(directory)
+            prefix = normalized if normalized.endswith(os.sep) \
+                else normalized + os.sep
+            if path.startswith(prefix) or path == normalized:
+                return level
+    return ""
+
+
+def time_per_path(func, iterations: int = ITERATIONS) -> float:
+    """
+    Measure average time per lookup in microseconds.
+
+    Args:
+        func: Callable taking one resolved path
+        iterations: Number of passes over PATHS
+
+    Returns:
+        Average microseconds per lookup
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for path in PATHS:
+            func(path)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(PATHS)) * 1_000_000
+
+
+def main():
+    """Run the scaling benchmark."""
+    if sys.platform == "win32":
+        print("This benchmark uses POSIX paths; run it on Linux or macOS.")
+        return 0
+
+    print("=" * 70)
+    print("Protected Directory Scaling Benchmark")
+    print("=" * 70)
+    print()
+    print(f"{'Directories':>12} {'Build (ms)':>11} {'Linear (us)':>12} "
+          f"{'Trie (us)':>10} {'Speedup':>8}")
+    print("-" * 70)
+
+    resolver = PathResolver()
+    for count in DIRECTORY_COUNTS:
+        site = [f"/srv/db/shard{i}" for i in range(count - 15)]
+        critical = DEFAULT_CRITICAL + site
+        caution = DEFAULT_CAUTION
+
+        start = time.perf_counter()
+        index = ProtectedPathIndex(critical, caution, resolver)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        for path in PATHS:
+            assert index.lookup(path) == \
+                linear_lookup(resolver, critical, caution, path)
+
+        iterations = max(1, ITERATIONS * 15 // count)
+        linear_us = time_per_path(
+            lambda path: linear_lookup(resolver, critical, caution, path),
+            iterations
+        )
+        trie_us = time_per_path(index.lookup)
+
+        print(f"{len(index):>12} {build_ms:>11.1f} {linear_us:>12.1f} "
+              f"{trie_us:>10.2f} {linear_us / trie_us:>7.0f}x")
+
+    print()
+    print("=" * 70)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Sharded screening scaling benchmark.
+
+Generates a synthetic shell history (mostly safe commands with some
+dangerous and caution ones mixed in), screens it with 1, 2, 4, ... worker
+processes up to the CPU count, and reports commands/sec, speedup and
+parallel efficiency. Also checks that every run produces exactly the
+same verdicts as the single-process run.
+
+Usage:
+    python tests/manual/test_screening_scaling.py [COMMANDS]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.screening import screen_file
+
+
+DEFAULT_COMMANDS = 100_000
+
+# Roughly what a developer's history looks like
+SAFE_COMMANDS = [
+    "ls -la", "git status", "git diff", "make -j8", "cd src && ls",
+    "cat /tmp/build.log | grep error", "docker ps", "npm install",
+    "python app.py --port 8080", "echo done > /tmp/out.txt",
+    "vim notes.md", "grep -rn TODO src/", "ssh deploy@host uptime",
+]
+RISKY_COMMANDS = [
+    "rm -rf /", "chmod 777 /srv/app", "git push -f origin main",
+    "dd if=/dev/zero of=/dev/sda", "sudo rm -rf /var/log/*", "sl",
+]
+RISKY_RATIO = 0.05
+
+
+def worker_counts() -> list:
+    """Get 1, 2, 4, ... up to the CPU count (always including it)."""
+    cpus = os.cpu_count() or 1
+    counts = []
+    workers = 1
+    while workers < cpus:
+        counts.append(workers)
+        workers *= 2
+    counts.append(cpus)
+    return counts
+
+
+def write_corpus(path: str, commands: int) -> None:
+    """
+    Write a synthetic command history.
+
+    Args:
+        path: Output file
+        commands: Number of lines
+    """
+    rng = random.Random(commands)
+    with open(path, 'w', encoding='utf-8') as f:
+        for _ in range(commands):
+            pool = RISKY_COMMANDS if rng.random() < RISKY_RATIO else SAFE_COMMANDS
+            f.write(rng.choice(pool) + "\n")
+
+
+def main():
+    """Run the scaling benchmark."""
+    commands = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COMMANDS
+
+    print("=" * 60)
+    print("Sharded Screening Scaling Benchmark")
+    print("=" * 60)
+    print()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        corpus = os.path.join(tmpdir, "history.txt")
+        write_corpus(corpus, commands)
+        size_mb = os.path.getsize(corpus) / (1 << 20)
+        print(f"Corpus: {commands:,} commands ({size_mb:.1f} MB), "
+              f"CPUs: {os.cpu_count()}")
+        print()
+        print(f"{'Workers':>8} {'Seconds':>9} {'Commands/sec':>14} "
+              f"{'Speedup':>8} {'Efficiency':>11}")
+        print("-" * 60)
+
+        baseline_rate = None
+        baseline_verdicts = None
+        for workers in worker_counts():
+            start = time.perf_counter()
+            verdicts = list(screen_file(corpus, workers))
+            elapsed = time.perf_counter() - start
+
+            if baseline_verdicts is None:
+                baseline_verdicts = verdicts
+            elif verdicts != baseline_verdicts:
+                print(f"❌ {workers} workers produced different verdicts")
+                return 1
+
+            rate = len(verdicts) / elapsed
+            baseline_rate = baseline_rate or rate
+            speedup = rate / baseline_rate
+            print(f"{workers:>8} {elapsed:>9.2f} {rate:>14,.0f} "
+                  f"{speedup:>7.2f}x {speedup / workers:>10.0%}")
+
+    print()
+    print("✅ All worker counts produced identical verdicts")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Persistent shell benchmark.
+
+Compares the latency of short commands run in a new /bin/sh each time
+(the default executor) with running them in the persistent shell
+session (MAIRU_PERSISTENT_SHELL=1), where only the command itself runs.
+
+Usage:
+    python tests/manual/test_shell_session.py
+"""
+
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.shell_executor import run_streaming
+from src.shell_session import ShellSession
+
+
+ITERATIONS = 200
+COMMANDS = ["true", "echo hello", "x=1; echo $((x + 1))", "ls / > /dev/null"]
+
+
+class NullOutput:
+    """Output that discards everything."""
+
+    def write(self, text):
+        pass
+
+    def flush(self):
+        pass
+
+
+def per_command(run) -> float:
+    """Average time per command in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for command in COMMANDS:
+            run(command, output=NullOutput(), encoding="utf-8")
+    elapsed = time.perf_counter() - start
+    return elapsed / (ITERATIONS * len(COMMANDS)) * 1000
+
+
+def main():
+    """Run the persistent shell benchmark."""
+    if not hasattr(os, "forkpty"):
+        print("Persistent shell needs pseudo-terminals (Linux/macOS)")
+        return 0
+
+    print("=" * 70)
+    print("Persistent Shell Benchmark")
+    print("=" * 70)
+    print()
+
+    session = ShellSession()
+    start = time.perf_counter()
+    session.start()
+    print(f"Session startup: {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"(once per MairuCLI run)")
+    print()
+
+    fresh = per_command(run_streaming)
+    persistent = per_command(session.run)
+    session.close()
+
+    print(f"{'Executor':<28} {'Per command (ms)':>17}")
+    print("-" * 70)
+    print(f"{'New shell per command':<28} {fresh:>17.3f}")
+    print(f"{'Persistent shell':<28} {persistent:>17.3f}")
+    print()
+    print(f"Speedup: {fresh / persistent:.1f}x")
+    print("=" * 70)
+    return 0 if persistent < fresh else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Startup time benchmark.
+
+Measures how long MairuCLI takes from process start to the first
+"mairu>" prompt, against a bare Python interpreter, and lists the
+slowest imports reported by `python -X importtime`. Run it twice:
+the first run also builds the pattern bundle and .pyc files.
+
+Usage:
+    python tests/manual/test_startup_time.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Project root (MairuCLI is started from there)
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..')
+)
+
+RUNS = 15
+TARGET_MS = 50
+PROMPT = b"mairu> "
+TOP_IMPORTS = 12
+
+# Measure a normal install: without cached bytecode every module is
+# recompiled on each start, which hides the cost of the code itself
+CHILD_ENV = {
+    key: value for key, value in os.environ.items()
+    if key != "PYTHONDONTWRITEBYTECODE"
+}
+
+
+def time_to_prompt() -> float:
+    """
+    Start MairuCLI and wait for the first prompt.
+
+    Returns:
+        Milliseconds from process start to the prompt appearing
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.main"],
+        cwd=PROJECT_ROOT,
+        env=CHILD_ENV,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+
+    output = b""
+    while PROMPT not in output:
+        chunk = os.read(process.stdout.fileno(), 4096)
+        if not chunk:
+            break
+        output += chunk
+    elapsed = (time.perf_counter() - start) * 1000
+
+    # Closing stdin makes the REPL exit on EOF
+    process.communicate(input=b"")
+    if PROMPT not in output:
+        raise RuntimeError("MairuCLI exited before showing a prompt")
+    return elapsed
+
+
+def time_bare_interpreter() -> float:
+    """Measure `python -c pass` in milliseconds (the floor)."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], env=CHILD_ENV, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def slowest_imports() -> list:
+    """
+    Run `python -X importtime` on src.main.
+
+    Returns:
+        List of (cumulative_us, module) for the slowest imports
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        cwd=PROJECT_ROOT,
+        env=CHILD_ENV,
+        capture_output=True,
+        text=True,
+    )
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        imports.append((int(cumulative), module.rstrip()))
+
+    imports.sort(reverse=True)
+    return imports[:TOP_IMPORTS]
+
+
+def main():
+    """Run the startup benchmark."""
+    print("=" * 60)
+    print("MairuCLI Startup Time Benchmark")
+    print("=" * 60)
+    print()
+
+    bundle = "disabled" if os.environ.get("MAIRU_NO_CACHE") else "enabled"
+    print(f"Runs: {RUNS}, pattern bundle: {bundle}")
+    print()
+
+    first = time_to_prompt()
+    prompts = [time_to_prompt() for _ in range(RUNS)]
+    bare = [time_bare_interpreter() for _ in range(RUNS)]
+
+    median = statistics.median(prompts)
+    print(f"First run (may build caches): {first:7.1f} ms")
+    print(f"Time to first prompt:         {median:7.1f} ms "
+          f"(min {min(prompts):.1f}, max {max(prompts):.1f})")
+    print(f"Bare interpreter:             {statistics.median(bare):7.1f} ms")
+    print()
+
+    print("Slowest imports (cumulative, -X importtime):")
+    for cumulative, module in slowest_imports():
+        print(f"  {cumulative / 1000:7.1f} ms  {module}")
+    print()
+
+    if median <= TARGET_MS:
+        print(f"✅ Under {TARGET_MS} ms target")
+        return 0
+
+    print(f"❌ Over {TARGET_MS} ms target")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Streaming output benchmark.
+
+Runs commands printing increasing amounts of output and compares the
+peak Python memory of capturing the output (what execute_in_system_shell
+did before: subprocess.run(capture_output=True), then print) with the
+streaming executor. Captured output grows with the command; streamed
+output stays at a few chunks however much is printed. Also measures how
+long the first line of a slow command takes to appear.
+
+Usage:
+    python tests/manual/test_streaming_output.py
+"""
+
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.shell_executor import run_streaming
+
+
+SIZES_MB = [10, 100, 1000]
+CAPTURE_LIMIT_MB = 100  # Larger captures would need gigabytes of memory
+
+
+class NullOutput:
+    """Output that discards everything (like a fast terminal)."""
+
+    def write(self, text):
+        pass
+
+    def flush(self):
+        pass
+
+
+class FirstWrite:
+    """Output that remembers when it was first written to."""
+
+    def __init__(self):
+        self.when = None
+
+    def write(self, text):
+        if self.when is None and text:
+            self.when = time.perf_counter()
+
+    def flush(self):
+        pass
+
+
+def peak_mb(run) -> float:
+    """Peak memory allocated by Python while running, in megabytes."""
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1_000_000
+
+
+def main():
+    """Run the streaming output benchmark."""
+    print("=" * 70)
+    print("Streaming Output Benchmark")
+    print("=" * 70)
+    print()
+    print(f"{'Output (MB)':>12} {'Captured peak (MB)':>19} "
+          f"{'Streamed peak (MB)':>19}")
+    print("-" * 70)
+
+    streamed_peaks = []
+    for size in SIZES_MB:
+        command = f"head -c {size * 1_000_000} /dev/zero | tr '\\0' a"
+
+        if size <= CAPTURE_LIMIT_MB:
+            def capture():
+                result = subprocess.run(command, shell=True,
+                                        capture_output=True, text=True)
+                NullOutput().write(result.stdout)
+            captured = f"{peak_mb(capture):>19.1f}"
+        else:
+            captured = f"{'(skipped)':>19}"
+
+        streamed = peak_mb(lambda: run_streaming(command, output=NullOutput(),
+                                                 encoding="utf-8"))
+        streamed_peaks.append(streamed)
+        print(f"{size:>12} {captured} {streamed:>19.1f}")
+
+    output = FirstWrite()
+    start = time.perf_counter()
+    run_streaming("echo first; sleep 1; echo done", output=output,
+                  encoding="utf-8")
+    total = time.perf_counter() - start
+    print()
+    print(f"'echo first; sleep 1': first output after "
+          f"{(output.when - start) * 1000:.0f} ms of {total * 1000:.0f} ms")
+
+    flat = max(streamed_peaks) < 5
+    print()
+    print(f"Streamed memory {'stays flat' if flat else 'GROWS'} "
+          f"with output size")
+    print("=" * 70)
+    return 0 if flat else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Typo index scaling benchmark.
+
+Measures generic typo lookups as the set of known commands grows from
+the builtins to thousands of $PATH executables. Compares TypoIndex with
+the linear loops check_generic_typo used before (which only knew a
+missing last letter and one wrong letter).
+
+Usage:
+    python tests/manual/test_typo_index_scaling.py
+"""
+
+import os
+import random
+import string
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.interceptor import COMMON_COMMANDS
+from src.path_index import get_path_index
+from src.typo_index import TypoIndex
+
+
+COMMAND_COUNTS = [25, 500, 2000, 5000]
+ITERATIONS = 200
+
+# Typed words: typos of builtins, a swap, and words that are no typo
+WORDS = ["mkdi", "gerp", "pytohn", "dokcer", "xyzzyq", "histroy", "whomai"]
+
+
+def linear_lookup(commands: list, word: str) -> str:
+    """Previous check_generic_typo loops."""
+    for correct in commands:
+        if len(correct) > 2 and word == correct[:-1]:
+            return correct
+    for correct in commands:
+        if len(word) == len(correct) and len(word) > 2:
+            if sum(1 for a, b in zip(word, correct) if a != b) == 1:
+                return correct
+    return ""
+
+
+def time_per_word(func, iterations: int = ITERATIONS) -> float:
+    """Average microseconds per lookup."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for word in WORDS:
+            func(word)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(WORDS)) * 1_000_000
+
+
+def main():
+    """Run the scaling benchmark."""
+    print("=" * 70)
+    print("Typo Index Scaling Benchmark")
+    print("=" * 70)
+    print()
+
+    installed = get_path_index().names()
+    print(f"Executables on this $PATH: {len(installed)}")
+    print()
+    print(f"{'Commands':>9} {'Build (ms)':>11} {'Linear (us)':>12} "
+          f"{'Index (us)':>11} {'Speedup':>8}")
+    print("-" * 70)
+
+    rng = random.Random(0)
+    for count in COMMAND_COUNTS:
+        commands = list(COMMON_COMMANDS) + installed[:count]
+        while len(commands) < count:
+            commands.append(''.join(
+                rng.choice(string.ascii_lowercase)
+                for _ in range(rng.randint(3, 12))
+            ))
+        commands = commands[:max(count, len(COMMON_COMMANDS))]
+
+        start = time.perf_counter()
+        index = TypoIndex(commands)
+        index.candidates("warmup-word")
+        build_ms = (time.perf_counter() - start) * 1000
+
+        linear_us = time_per_word(lambda word: linear_lookup(commands, word))
+        index_us = time_per_word(index.candidates)
+
+        print(f"{len(index):>9} {build_ms:>11.1f} {linear_us:>12.1f} "
+              f"{index_us:>11.1f} {linear_us / index_us:>7.1f}x")
+
+    print()
+    print("=" * 70)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
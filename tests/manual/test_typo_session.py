@@ -0,0 +1,109 @@
+"""
+Long-session generic typo benchmark.
+
+Feeds 100,000 distinct typo commands (every generic typo word
+check_generic_typo knows, with distinct arguments) through check_command
+and measures the cost of checking a fixed set of commands as the session
+goes on. Generic typo suggestions live in a bounded cache, so the pattern
+catalogs never grow and the cost should stay flat. Before, every typo
+word was added to TYPO_PATTERNS and re-searched for every later command.
+
+Usage:
+    python tests/manual/test_typo_session.py
+"""
+
+import os
+import string
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.interceptor import (
+    COMMON_COMMANDS,
+    GENERIC_TYPO_PREFIX,
+    TYPO_PATTERNS,
+    check_command,
+    generic_typo_candidates
+)
+
+
+SESSION_TYPOS = 100_000
+CHECKPOINTS = 10
+ROUNDS = 200
+
+# Commands checked at every checkpoint (safe ones run every layer)
+PROBES = ["ls -la", "git status", "echo hello", "rm -rf /", "mkdi build",
+          "python3 app.py", "cat notes.txt"]
+
+
+def typo_words() -> list:
+    """List every word reported as a generic typo."""
+    words = set()
+    for command in COMMON_COMMANDS:
+        candidates = [command[:-1]]
+        for position in range(len(command)):
+            for char in string.ascii_lowercase + string.digits:
+                candidates.append(
+                    command[:position] + char + command[position + 1:]
+                )
+        for word in candidates:
+            if check_command(word)[1].startswith(GENERIC_TYPO_PREFIX):
+                words.add(word)
+    return sorted(words)
+
+
+def probe_time() -> float:
+    """Best average time per probe command in microseconds."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for command in PROBES:
+            check_command(command)
+        best = min(best, time.perf_counter() - start)
+    return best / len(PROBES) * 1_000_000
+
+
+def main():
+    """Run the long-session benchmark."""
+    print("=" * 70)
+    print("Long-Session Generic Typo Benchmark")
+    print("=" * 70)
+    print()
+
+    words = typo_words()
+    generic_typo_candidates.cache_clear()
+    typo_patterns = len(TYPO_PATTERNS)
+    print(f"Distinct generic typo words: {len(words)}")
+    print()
+    print(f"{'Typos seen':>11} {'Check (us)':>11} {'Cached words':>13} "
+          f"{'Typo patterns':>14}")
+    print("-" * 70)
+
+    baseline = probe_time()
+    print(f"{0:>11} {baseline:>11.1f} "
+          f"{generic_typo_candidates.cache_info().currsize:>13} "
+          f"{len(TYPO_PATTERNS):>14}")
+
+    step = SESSION_TYPOS // CHECKPOINTS
+    latest = baseline
+    for checkpoint in range(1, CHECKPOINTS + 1):
+        for number in range((checkpoint - 1) * step, checkpoint * step):
+            command = f"{words[number % len(words)]} file{number}"
+            assert check_command(command)[0] == "critical", command
+        latest = probe_time()
+        print(f"{checkpoint * step:>11} {latest:>11.1f} "
+              f"{generic_typo_candidates.cache_info().currsize:>13} "
+              f"{len(TYPO_PATTERNS):>14}")
+
+    print()
+    flat = latest < baseline * 1.5 and len(TYPO_PATTERNS) == typo_patterns
+    print(f"After {SESSION_TYPOS:,} typos: {latest / baseline:.2f}x the "
+          f"initial cost - {'flat' if flat else 'GROWING'}")
+    print("=" * 70)
+    return 0 if flat else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
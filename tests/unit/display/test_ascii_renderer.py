@@ -2,6 +2,8 @@
 Unit tests for src/display/ascii_renderer.py
 """
 
+import os
+
 import pytest
 from src.display.ascii_renderer import AsciiRenderer
 
@@ -107,3 +109,63 @@ class TestAsciiRenderer:
         assert "\033[0m" in text1
         assert "\033[0m" in text2
         assert "\033[0m" in text3
+
+
+class TestArtFrames:
+    """Test suite for cached, pre-colorized ASCII art frames."""
+
+    def test_frame_is_colorized_art(self, tmp_path):
+        """Test a frame holds each line colorized, joined once."""
+        (tmp_path / "ghost.txt").write_text("boo\n o", encoding="utf-8")
+        renderer = AsciiRenderer(tmp_path)
+
+        lines, frame = renderer.render_art("ghost.txt", "purple")
+
+        assert lines == (renderer.colorize("boo", "purple"),
+                         renderer.colorize(" o", "purple"))
+        assert frame == "\n".join(lines) + "\n"
+
+    def test_repeated_frames_are_not_reread(self, tmp_path, monkeypatch):
+        """Test the file is read once per (file, color)."""
+        (tmp_path / "ghost.txt").write_text("boo", encoding="utf-8")
+        renderer = AsciiRenderer(tmp_path)
+        reads = []
+        load_art = renderer.load_art
+        monkeypatch.setattr(renderer, "load_art",
+                            lambda name: reads.append(name) or load_art(name))
+
+        first = renderer.render_art("ghost.txt", "red")
+        assert renderer.render_art("ghost.txt", "red")[1] is first[1]
+        renderer.render_art("ghost.txt", "green")
+
+        assert reads == ["ghost.txt", "ghost.txt"]
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        """Test a frame is rebuilt when the file's mtime changes."""
+        art = tmp_path / "ghost.txt"
+        art.write_text("old", encoding="utf-8")
+        renderer = AsciiRenderer(tmp_path)
+        renderer.render_art("ghost.txt", "red")
+
+        art.write_text("new", encoding="utf-8")
+        os.utime(art, ns=(0, art.stat().st_mtime_ns + 1_000_000_000))
+
+        assert "new" in renderer.render_art("ghost.txt", "red")[1]
+
+    def test_missing_file_placeholder(self, tmp_path):
+        """Test a missing file renders the placeholder."""
+        renderer = AsciiRenderer(tmp_path)
+
+        _, frame = renderer.render_art("missing.txt", "red")
+
+        assert "[ASCII art not found: missing.txt]" in frame
+
+    def test_display_art_file_writes_frame(self, tmp_path, capsys):
+        """Test the whole frame is written when there are no delays."""
+        (tmp_path / "ghost.txt").write_text("boo\nboo", encoding="utf-8")
+        renderer = AsciiRenderer(tmp_path)
+
+        renderer.display_art_file("ghost.txt", "orange")
+
+        assert capsys.readouterr().out == \
+            renderer.render_art("ghost.txt", "orange")[1]
@@ -0,0 +1,70 @@
+"""
+Unit tests for the lazy display facade in src/display/__init__.py
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import src.display as display
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _modules_after(code: str) -> set:
+    """Run code in a fresh interpreter and return the src.* modules loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c",
+         code + "\nimport sys; print(' '.join(m for m in sys.modules "
+                "if m.startswith('src.')))"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestDisplayFacade:
+    """Test suite for lazy component creation."""
+
+    def test_import_does_not_load_warning_components(self):
+        """Test importing the package defers the warning modules."""
+        modules = _modules_after("import src.display")
+
+        assert "src.display.warning_components" not in modules
+        assert "src.display.educational_breakdown" not in modules
+        assert "src.display.achievements" not in modules
+
+    def test_colorize_only_loads_renderer(self):
+        """Test the prompt path does not pull in warning content."""
+        modules = _modules_after(
+            "from src.display import colorize; colorize('x', 'orange')"
+        )
+
+        assert "src.display.ascii_renderer" in modules
+        assert "src.display.warning_components" not in modules
+        assert "src.display.content_loader" not in modules
+
+    def test_reexported_names_resolve_on_access(self):
+        """Test EMOJI and component classes are still importable."""
+        from src.display import EMOJI, Statistics
+        from src.display.warning_components import EMOJI as SOURCE_EMOJI
+
+        assert EMOJI is SOURCE_EMOJI
+        assert Statistics().get_total_blocks() >= 0
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            display.not_a_component
+
+    def test_components_are_created_once(self):
+        """Test repeated access returns the shared instance."""
+        first = display._component("statistics")
+
+        assert display._component("statistics") is first
+        assert display._component("achievement_tracker").statistics is first
@@ -0,0 +1,131 @@
+"""
+Unit tests for src/display/render_scheduler.py
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+import src.display.render_scheduler as render_scheduler
+from src.display.render_scheduler import RenderScheduler, get_render_scheduler
+
+
+class FakeTerminal:
+    """Stream that claims to be a terminal."""
+
+    def isatty(self):
+        return True
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+@pytest.fixture
+def interactive(monkeypatch):
+    """Record waits instead of waiting; see use_terminal()."""
+    monkeypatch.delenv("MAIRU_TEST_MODE", raising=False)
+    waits = []
+    keys = []
+
+    def wait_for_key(seconds):
+        waits.append(seconds)
+        return bool(keys) and keys.pop(0)
+
+    monkeypatch.setattr(render_scheduler, "_wait_for_key", wait_for_key)
+    return waits, keys
+
+
+def use_terminal(monkeypatch):
+    """
+    Pretend to run in a terminal.
+
+    Called in the test itself: output capture replaces sys.stdout again
+    after fixtures are set up.
+    """
+    monkeypatch.setattr(sys, "stdin", FakeTerminal())
+    monkeypatch.setattr(sys, "stdout", FakeTerminal())
+
+
+class TestRenderScheduler:
+    """Test suite for RenderScheduler."""
+
+    def test_no_delays_when_not_a_terminal(self, monkeypatch, capsys):
+        """Test captured output renders at once."""
+        monkeypatch.delenv("MAIRU_TEST_MODE", raising=False)
+        monkeypatch.setattr(render_scheduler, "_wait_for_key",
+                            lambda seconds: pytest.fail("waited"))
+        scheduler = RenderScheduler()
+
+        assert not scheduler.animated
+        scheduler.print_lines(["one", "two"], delay=1.0)
+        scheduler.pause(5.0)
+
+        assert capsys.readouterr().out == "one\ntwo\n"
+
+    def test_no_delays_in_test_mode(self, interactive, monkeypatch):
+        """Test MAIRU_TEST_MODE turns delays off in a terminal too."""
+        waits, _ = interactive
+        use_terminal(monkeypatch)
+        monkeypatch.setenv("MAIRU_TEST_MODE", "1")
+
+        RenderScheduler().pause(1.0)
+
+        assert waits == []
+
+    def test_delays_in_a_terminal(self, interactive, monkeypatch):
+        """Test delays are waited for in an interactive session."""
+        waits, _ = interactive
+        use_terminal(monkeypatch)
+        scheduler = RenderScheduler()
+
+        assert scheduler.animated
+        scheduler.print_lines(["a", "b"], delay=0.08)
+        scheduler.pause(0.5)
+        scheduler.pause(0)
+
+        assert waits == [0.08, 0.08, 0.5]
+
+    def test_key_skips_to_the_end(self, interactive, monkeypatch):
+        """Test a keypress skips the remaining delays until reset."""
+        waits, keys = interactive
+        use_terminal(monkeypatch)
+        scheduler = RenderScheduler()
+        keys.append(True)
+
+        scheduler.pause(1.0)
+        scheduler.pause(1.0)
+        scheduler.pause(1.0)
+        assert waits == [1.0]
+        assert scheduler.skipping
+
+        scheduler.reset()
+        scheduler.pause(1.0)
+        assert waits == [1.0, 1.0]
+
+    @pytest.mark.skipif(not hasattr(os, "openpty"),
+                        reason="needs pseudo-terminals")
+    def test_wait_for_key_on_a_terminal(self, monkeypatch):
+        """Test a real keypress ends the wait at once and is consumed."""
+        master, slave = os.openpty()
+        terminal = os.fdopen(slave, "r")
+        try:
+            monkeypatch.setattr(sys, "stdin", terminal)
+            assert not render_scheduler._wait_for_key(0.05)
+
+            os.write(master, b"x")
+            began = time.monotonic()
+            assert render_scheduler._wait_for_key(5.0)
+            assert time.monotonic() - began < 1.0
+            assert not render_scheduler._wait_for_key(0.05)
+        finally:
+            terminal.close()
+            os.close(master)
+
+    def test_shared_scheduler(self):
+        """Test every renderer uses the same scheduler."""
+        assert get_render_scheduler() is get_render_scheduler()
@@ -7,6 +7,8 @@ caution commands, and typos.
 
 import os
 import sys
+from collections.abc import Mapping
+
 import pytest
 
 # Add project root to path
@@ -15,7 +17,19 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(
 
 from src.interceptor import (
     check_command,
+    check_command_id,
+    check_commands,
+    check_generic_typo,
+    generic_typo_candidates,
+    generic_typo_depends_on_path,
     get_pattern_info,
+    pattern_id,
+    pattern_name,
+    LEVEL_SAFE,
+    LEVEL_CRITICAL,
+    NO_PATTERN,
+    GENERIC_TYPO,
+    GENERIC_TYPO_CACHE_SIZE,
     DANGEROUS_PATTERNS,
     CAUTION_PATTERNS,
     TYPO_PATTERNS
@@ -415,12 +429,38 @@ class TestCommandInterceptor:
             assert pattern == "", \
                 f"Safe command '{cmd}' should have empty pattern"
 
+    @pytest.mark.parametrize("command,expected", [
+        ('echo "rm -rf /" | sh', "rm_dangerous"),
+        ("printf 'rm -rf /' | bash", "rm_dangerous"),
+        ('bash -c -- "rm -rf /"', "rm_dangerous"),
+        ('docker exec c sh -c "rm -rf /"', "rm_dangerous"),
+        ('kubectl exec p -- sh -c "rm -rf /"', "rm_dangerous"),
+        ('runuser -u x -- sh -c "rm -rf /"', "rm_dangerous"),
+        ('bash <<< "rm -rf /"', "rm_dangerous"),
+        ('sudo -s "rm -rf /"', "rm_dangerous"),
+        ('script -c "rm -rf /"', "rm_dangerous"),
+        ('flock x -c "rm -rf /"', "rm_dangerous"),
+        ('tmux new "rm -rf /"', "rm_dangerous"),
+        ('watch "rm -rf /"', "rm_dangerous"),
+        ('ssh host "rm -rf /"', "rm_dangerous"),
+        ("ssh host 'dd if=/dev/zero of=/dev/sda'", "dd_zero"),
+        ("alias x='rm -rf /'", "rm_dangerous"),
+        ('cmd="dd if=/dev/zero of=/dev/sda"', "dd_zero"),
+        ('echo "* * * * * rm -rf /" | crontab -', "rm_dangerous"),
+        ('python -c "os.system(\'rm -rf /\')"', "rm_dangerous"),
+        ('echo "chmod 777 /etc" | sudo sh', "chmod_777"),
+        ('"rm" -rf /', "rm_dangerous"),
+    ])
+    def test_commands_run_by_other_programs(self, command, expected):
+        """Test command lines handed to a shell or program are checked."""
+        assert check_command(command) == ("critical", expected)
+
     def test_get_pattern_info_dangerous(self):
         """Test retrieving pattern info for dangerous patterns."""
         # Test with a known dangerous pattern
         if "rm_dangerous" in DANGEROUS_PATTERNS:
             info = get_pattern_info("rm_dangerous")
-            assert isinstance(info, dict), "Should return dict"
+            assert isinstance(info, Mapping), "Should return a mapping"
             assert 'pattern' in info, "Should have pattern field"
             assert 'category' in info, "Should have category field"
 
@@ -428,7 +468,7 @@ class TestCommandInterceptor:
         """Test retrieving pattern info for typo patterns."""
         if "sl" in TYPO_PATTERNS:
             info = get_pattern_info("typo_sl")
-            assert isinstance(info, dict), "Should return dict"
+            assert isinstance(info, Mapping), "Should return a mapping"
 
     def test_case_insensitive_matching(self):
         """Test that pattern matching is case-insensitive."""
@@ -520,5 +560,151 @@ class TestCommandInterceptor:
             f"check_command should complete within 50ms, got {avg_time_ms}ms"
 
 
+@pytest.fixture
+def path_names(monkeypatch):
+    """Typo index of the builtins and some $PATH executables."""
+    from src import interceptor
+    from src.path_index import get_path_index
+    from src.typo_index import SHELL_WORDS, TypoIndex
+
+    index = TypoIndex(interceptor.COMMON_COMMANDS +
+                      ["npm", "rvim", "git", "llc", "lli"], known=SHELL_WORDS)
+    monkeypatch.setattr(interceptor, "_typo_index",
+                        (get_path_index().version, index))
+    generic_typo_candidates.cache_clear()
+    yield
+    generic_typo_candidates.cache_clear()
+
+
+class TestGenericTypos:
+    """Test suite for generic typo suggestions."""
+
+    def test_generic_typo_verdict(self):
+        """Test a word missing its last letter is reported with its name."""
+        assert check_command("mkdi build") == ("critical", "typo_generic_mkdi")
+
+        info = get_pattern_info("typo_generic_mkdi")
+        assert info["correct"] == "mkdir"
+        assert "mkdir" in info["message"]
+
+    def test_typo_patterns_do_not_grow(self):
+        """Test generic typos are not added to the pattern catalogs."""
+        before = dict(TYPO_PATTERNS)
+
+        for word in ("mkdi", "gre", "pytho", "tre"):
+            check_command(f"{word} x")
+
+        assert TYPO_PATTERNS == before
+
+    def test_suggestions_are_bounded(self):
+        """Test the typo candidate cache has a fixed size."""
+        assert generic_typo_candidates.cache_info().maxsize == \
+            GENERIC_TYPO_CACHE_SIZE
+
+    def test_verdict_does_not_depend_on_history(self):
+        """Test earlier typos do not change later verdicts."""
+        check_command("mkdi build")
+
+        assert check_command("MKDI build") == ("safe", "")
+        assert check_command("mkdi-tool build") == ("safe", "")
+
+    def test_suggestions_ranked_by_session_usage(self, monkeypatch):
+        """Test the command used most this session is suggested first."""
+        from src import interceptor
+        from src.builtins import shell_utils
+        from src.typo_index import TypoCandidate, EDIT_WRONG
+
+        candidates = (TypoCandidate("python", EDIT_WRONG, 0),
+                      TypoCandidate("python3", EDIT_WRONG, 1))
+        monkeypatch.setattr(interceptor, "generic_typo_candidates",
+                            lambda word: candidates)
+
+        monkeypatch.setattr(shell_utils, "_command_counts", {})
+        assert check_generic_typo("pythons")[1] == "python"
+
+        monkeypatch.setattr(shell_utils, "_command_counts", {"python3": 4})
+        assert check_generic_typo("pythons")[1] == "python3"
+
+    @pytest.mark.parametrize("command,correct", [
+        ("nvm use 18", "npm"),
+        ("rvm use 2", "rvim"),
+        ("gst", "git"),
+        ("ll", "llc"),
+        ("jenv", "env"),
+    ])
+    def test_path_typos_do_not_block(self, path_names, command, correct):
+        """Test near-misses of $PATH names and prefixed tools only hint."""
+        assert check_command(command) == ("safe", "")
+        assert check_generic_typo(command)[1] == correct
+
+    @pytest.mark.parametrize("command", ["at now", "cal 2026", "tee log"])
+    def test_standard_utilities_do_not_block(self, path_names, command):
+        """Test an uninstalled POSIX utility is not a typo of a builtin."""
+        assert check_command(command) == ("safe", "")
+        assert not generic_typo_depends_on_path(command)
+
+    def test_builtin_typos_block(self, path_names):
+        """Test typos of the curated builtins are still blocked."""
+        assert check_command("mkdi build") == ("critical", "typo_generic_mkdi")
+        assert check_command("gerp x") == ("critical", "typo_generic_gerp")
+
+    def test_generic_typo_id(self):
+        """Test generic typos share one pattern ID resolved by name."""
+        assert check_command_id("gre pattern") == (LEVEL_CRITICAL, GENERIC_TYPO)
+        assert pattern_id("typo_generic_gre") == GENERIC_TYPO
+
+
+class TestCheckCommands:
+    """Test suite for batch checking with check_commands."""
+
+    COMMANDS = [
+        "rm -rf /", "ls -la", "sl", "sudo rm -rf /*", "chmod 777 /etc",
+        "git push --force", "dd if=/dev/zero of=/dev/sda", "cat a | grep b",
+        "ls && rm -rf ~", "echo 'rm -rf /'", "RM -RF /", "gti status",
+        "sh -c 'rm -rf /'", "echo c>/proc/sysrq-trigger", "", "   ",
+    ]
+
+    def test_same_verdicts_as_check_command(self):
+        """Test every batch verdict equals the single-command verdict."""
+        verdicts = check_commands(self.COMMANDS)
+
+        assert len(verdicts.levels) == len(self.COMMANDS)
+        for position, command in enumerate(self.COMMANDS):
+            assert verdicts.verdict(position) == check_command(command), \
+                command
+
+    def test_results_are_compact_arrays(self):
+        """Test verdicts come back as level codes and pattern IDs."""
+        verdicts = check_commands(["ls -la", "rm -rf /"])
+
+        assert verdicts.levels.typecode == "b"
+        assert verdicts.pattern_ids.typecode == "i"
+        assert list(verdicts.levels) == [LEVEL_SAFE, LEVEL_CRITICAL]
+        assert verdicts.pattern_ids[0] == NO_PATTERN
+        assert pattern_name(verdicts.pattern_ids[1]) == "rm_dangerous"
+
+    def test_pattern_ids_are_stable(self):
+        """Test pattern IDs and names map back to each other."""
+        assert pattern_name(pattern_id("rm_dangerous")) == "rm_dangerous"
+        assert pattern_id("rm_dangerous") == pattern_id("rm_dangerous")
+        assert pattern_name(NO_PATTERN) == ""
+
+    def test_check_command_id(self):
+        """Test the integer verdict resolves to the check_command verdict."""
+        level, found = check_command_id("rm -rf /")
+
+        assert level == LEVEL_CRITICAL
+        assert pattern_name(found) == "rm_dangerous"
+        assert get_pattern_info(found) is get_pattern_info("rm_dangerous")
+        assert check_command_id("ls -la") == (LEVEL_SAFE, NO_PATTERN)
+
+    def test_empty_batch(self):
+        """Test an empty batch gives empty arrays."""
+        verdicts = check_commands([])
+
+        assert len(verdicts.levels) == 0
+        assert len(verdicts.pattern_ids) == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
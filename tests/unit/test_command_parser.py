@@ -239,3 +239,49 @@ class TestCommandParser:
         """Test safe chained commands."""
         paths = self.parser.extract_all_paths("echo hello; echo world")
         assert len(paths) == 0  # No file paths in echo commands
+
+    def test_extract_paths_through_wrappers(self):
+        """Test paths of commands run by sudo, find -exec and sh -c."""
+        assert "/etc/passwd" in self.parser.extract_all_paths("sudo rm /etc/passwd")
+        assert "/etc/x" in self.parser.extract_all_paths(
+            "find /tmp -name x -exec rm /etc/x +")
+        assert "/etc/hosts" in self.parser.extract_all_paths(
+            'bash -c "echo 1 > /etc/hosts"')
+
+    def test_simple_commands(self):
+        """Test every command a line runs starts a segment argv."""
+        argvs = [segment.argv for segment in
+                 self.parser.simple_commands("sudo rm -f x | eval 'ls /'")]
+
+        assert ("rm", "-f", "x") in argvs
+        assert ("ls", "/") in argvs
+        assert ("echo", "rm -rf /") in [
+            segment.argv
+            for segment in self.parser.simple_commands('echo "rm -rf /"')
+        ]
+
+    def test_command_substitution_in_quotes_and_assignments(self):
+        """Test $(...) bodies are commands even inside double quotes."""
+        for command in ['echo "$(rm -rf /)"', 'x="$(rm -rf /)"',
+                        'echo "a $(ls /) b $(rm -rf /)"',
+                        'echo "$(echo "$(rm -rf /)")"']:
+            argvs = [segment.argv
+                     for segment in self.parser.simple_commands(command)]
+            assert ("rm", "-rf", "/") in argvs, command
+
+    def test_command_lines_in_arguments(self):
+        """Test shell scripts, here-strings and quoted lines are commands."""
+        for command in ['bash -c -- "rm -rf /"',
+                        'docker exec c sh -c "rm -rf /"',
+                        'bash <<< "rm -rf /"',
+                        'ssh host "rm -rf /"',
+                        "alias x='rm -rf /'"]:
+            argvs = [segment.argv
+                     for segment in self.parser.simple_commands(command)]
+            assert ("rm", "-rf", "/") in argvs, command
+
+    def test_nesting_is_bounded(self):
+        """Test nested command lines stop being expanded at MAX_NESTING."""
+        assert self.parser.extract_all_paths("eval rm /a") == ["/a"]
+        assert self.parser.extract_all_paths(
+            "eval " * (CommandParser.MAX_NESTING + 1) + "rm /a") == []
@@ -0,0 +1,154 @@
+"""
+Unit tests for pre-execution command resolution in src/command_resolver.py
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+import src.command_resolver as command_resolver
+from src.command_resolver import (
+    NOT_FOUND,
+    RESOLVED_BUILTIN,
+    RESOLVED_PATH,
+    RESOLVED_SHELL,
+    UNRESOLVED,
+    resolve_command
+)
+from src.path_index import PathIndex
+
+
+@pytest.fixture
+def path_index(tmp_path, monkeypatch):
+    """PATH index of one directory holding an executable named tool."""
+    tool = tmp_path / "tool"
+    tool.write_text("")
+    tool.chmod(0o755)
+    index = PathIndex(str(tmp_path))
+    monkeypatch.setattr(command_resolver, "get_path_index", lambda: index)
+    return tool
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+class TestResolveCommand:
+    """Test suite for resolving command words."""
+
+    def test_path_executable(self, path_index):
+        """Test a command on PATH resolves to its file."""
+        resolution = resolve_command("tool --help")
+
+        assert resolution.kind == RESOLVED_PATH
+        assert resolution.target == str(path_index)
+
+    @pytest.mark.parametrize("command", ["cd /tmp", "dir", "cls", "quit"])
+    def test_builtins_and_aliases(self, path_index, command):
+        """Test MairuCLI builtins and their aliases are never missing."""
+        assert resolve_command(command).kind == RESOLVED_BUILTIN
+
+    @pytest.mark.parametrize("command", ["source env.sh", ". env.sh",
+                                         "unset A", "true", "ulimit -n"])
+    def test_shell_words(self, path_index, command):
+        """Test shell builtins and keywords are never missing."""
+        assert resolve_command(command).kind == RESOLVED_SHELL
+
+    def test_missing_command(self, path_index):
+        """Test an unknown name is reported as not found."""
+        resolution = resolve_command("definitely-missing arg")
+
+        assert resolution.kind == NOT_FOUND
+        assert resolution.name == "definitely-missing"
+
+    def test_stale_index_miss_is_confirmed(self, path_index, tmp_path,
+                                           monkeypatch):
+        """Test a name the index misses is looked up on PATH itself."""
+        installed = tmp_path / "elsewhere" / "fresh"
+        installed.parent.mkdir()
+        installed.write_text("")
+        installed.chmod(0o755)
+        monkeypatch.setenv("PATH", str(installed.parent))
+
+        resolution = resolve_command("fresh arg")
+
+        assert resolution.kind == RESOLVED_PATH
+        assert resolution.target == str(installed)
+
+    def test_missing_command_with_shell_definitions(self, path_index):
+        """Test an unknown name may be an alias or function of the shell."""
+        resolution = resolve_command("myfn arg", shell_definitions=True)
+
+        assert resolution.kind == UNRESOLVED
+        assert resolution.name == "myfn"
+        assert resolve_command("tool", shell_definitions=True).kind == \
+            RESOLVED_PATH
+
+    @pytest.mark.parametrize("command", [
+        "missing | grep x",
+        "missing && tool",
+        "missing > out.txt",
+        "missing &",
+        "$EDITOR notes.txt",
+        "FOO=1 missing",
+        "./missing",
+        "/opt/missing",
+        "'unterminated",
+        "> out.txt",
+        "",
+    ])
+    def test_shell_decides(self, path_index, command):
+        """Test anything the shell itself resolves is left to it."""
+        assert resolve_command(command).kind == UNRESOLVED
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+class TestExecuteInSystemShell:
+    """Test suite for not-found reporting before execution."""
+
+    def test_missing_command_does_not_start_shell(self, path_index,
+                                                  monkeypatch, capsys):
+        """Test a missing command is reported without a subprocess."""
+        import src.main as main
+
+        def fail(*args, **kwargs):
+            raise AssertionError("shell started for a missing command")
+
+        monkeypatch.setattr(subprocess, "run", fail)
+        monkeypatch.setattr(main, "_COMMAND_NOT_FOUND_MESSAGES", [])
+
+        main.execute_in_system_shell("definitely-missing arg")
+
+        assert "definitely-missing" in capsys.readouterr().out
+
+    def test_suggestion_is_shown(self, monkeypatch, capsys):
+        """Test the not-found message suggests a known command."""
+        import src.main as main
+
+        monkeypatch.setattr(main, "_COMMAND_NOT_FOUND_MESSAGES", [])
+        main.show_command_not_found("gti", "git")
+
+        output = capsys.readouterr().out
+        assert "gti" in output
+        assert "Did you mean" in output and "git" in output
+
+    def test_shell_not_found_gets_suggestion(self, monkeypatch, capsys):
+        """Test a name the shell could not find gets the typo hint."""
+        import src.interceptor as interceptor
+        import src.main as main
+        from src.interceptor import TypoSuggestion
+
+        monkeypatch.setattr(main, "_COMMAND_NOT_FOUND_MESSAGES", [])
+        monkeypatch.setattr(interceptor, "generic_typo_suggestion",
+                            lambda word: TypoSuggestion("git", ""))
+        main.report_command_not_found("gst")
+
+        output = capsys.readouterr().out
+        assert "gst" in output and "git" in output
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,114 @@
+"""
+Unit tests for the shared content store in src/content_store.py
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+import src.content_store as content_store
+from src.builtins.mairu_commands import HelpGenerator
+from src.content_store import ContentStore, get_content_store
+from src.display.content_loader import ContentLoader
+from src.interceptor import PatternLoader
+from src.project_paths import get_warnings_dir
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count json.load calls made by the store."""
+    calls = []
+    load = json.load
+    monkeypatch.setattr(content_store.json, "load",
+                        lambda f: calls.append(f.name) or load(f))
+    return calls
+
+
+class TestContentStore:
+    """Test suite for parsing data files once and sharing them."""
+
+    def test_file_parsed_once(self, tmp_path, parses):
+        """Test repeated reads return the same object without parsing."""
+        path = tmp_path / "catalog.json"
+        path.write_text('{"warnings": {"a": 1}, "version": "1"}',
+                        encoding="utf-8")
+        store = ContentStore()
+
+        data = store.load(path)
+        assert store.load(str(path)) is data
+        assert store.section(path, "warnings") is data["warnings"]
+        assert len(parses) == 1
+
+    def test_section_default(self, tmp_path):
+        """Test missing sections give the default."""
+        path = tmp_path / "list.json"
+        path.write_text('[1, 2]', encoding="utf-8")
+        store = ContentStore()
+
+        assert store.section(path, "warnings", {}) == {}
+
+    def test_changed_file_is_parsed_again(self, tmp_path):
+        """Test a file is reread when it changes."""
+        path = tmp_path / "catalog.json"
+        path.write_text('{"v": 1}', encoding="utf-8")
+        store = ContentStore()
+        store.load(path)
+
+        path.write_text('{"v": 22}', encoding="utf-8")
+
+        assert store.load(path) == {"v": 22}
+
+    def test_errors_are_raised_and_not_cached(self, tmp_path):
+        """Test missing and invalid files raise like open/json.load."""
+        path = tmp_path / "broken.json"
+        store = ContentStore()
+
+        with pytest.raises(FileNotFoundError):
+            store.load(path)
+        path.write_text('{"broken": ', encoding="utf-8")
+        with pytest.raises(json.JSONDecodeError):
+            store.load(path)
+
+        path.write_text('{"fixed": true}', encoding="utf-8")
+        assert store.load(path) == {"fixed": True}
+
+
+class TestSharedContent:
+    """Test suite for readers sharing the parsed catalogs."""
+
+    def test_readers_share_warning_catalog(self, monkeypatch, parses):
+        """Test display, help and the interceptor parse the catalog once."""
+        monkeypatch.setattr(content_store, "_store", ContentStore())
+        catalog_path = str(get_warnings_dir() / "warning_catalog.json")
+
+        catalog = ContentLoader().load_catalog()
+        dangerous = HelpGenerator()._load_patterns("warning_catalog.json",
+                                                   "warnings")
+        PatternLoader(validate_schema=False)._load_dangerous_patterns()
+
+        assert dangerous is catalog["warnings"]
+        assert get_content_store().load(catalog_path) is catalog
+        assert parses.count(catalog_path) == 1
+
+    def test_pattern_analysis_leaves_catalog_intact(self, monkeypatch):
+        """Test the interceptor copies shared entries before changing them."""
+        monkeypatch.setattr(content_store, "_store", ContentStore())
+        store = get_content_store()
+        cautions_path = get_warnings_dir() / "caution_catalog.json"
+        before = json.dumps(store.load(cautions_path), sort_keys=True)
+
+        caution = PatternLoader(validate_schema=False)._load_caution_patterns()
+        for data in caution.values():
+            data["literals"] = ["changed"]
+
+        assert json.dumps(store.load(cautions_path), sort_keys=True) == before
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
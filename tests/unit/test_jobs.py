@@ -0,0 +1,174 @@
+"""
+Unit tests for background jobs (src/jobs.py) and the jobs, fg and wait
+builtins (src/builtins/job_control.py)
+"""
+
+import io
+import os
+import sys
+import time
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+import src.jobs as jobs
+from src.builtins import BuiltinCommands
+from src.jobs import DONE, RUNNING, JobTable, background_command
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32",
+                                reason="uses POSIX shell commands")
+
+TIMEOUT = 10.0
+
+
+@pytest.fixture
+def table(monkeypatch):
+    """A job table used by the builtins, its jobs stopped after the test."""
+    table = JobTable()
+    monkeypatch.setattr(jobs, "_table", table)
+    yield table
+    table.close()
+
+
+def start(table, command):
+    """Start a job writing to its own buffer; get (job, output)."""
+    output = io.StringIO()
+    return table.start(command, output=output, encoding="utf-8"), output
+
+
+class TestBackgroundCommand:
+    """Test suite for recognizing `command &`."""
+
+    def test_trailing_ampersand(self):
+        """Test the `&` is removed from background commands."""
+        assert background_command("sleep 5 &") == "sleep 5"
+        assert background_command("make&  ") == "make"
+        assert background_command("a | b &") == "a | b"
+        assert background_command("a & b &") == "a & b"
+
+    def test_not_background(self):
+        """Test other uses of `&` stay foreground commands."""
+        assert background_command("ls") == ""
+        assert background_command("a && b") == ""
+        assert background_command("echo '&'") == ""
+        assert background_command("a & b") == ""
+
+
+class TestJobTable:
+    """Test suite for running commands in the background."""
+
+    def test_output_and_exit_status(self, table):
+        """Test a job's output is forwarded and its status kept."""
+        job, output = start(table, "echo out; echo err >&2; exit 3")
+
+        assert job.finished.wait(TIMEOUT)
+        assert output.getvalue() in ("out\nerr\n", "err\nout\n")
+        assert job.returncode == 3
+        assert job.describe() == "[1]  Exit 3     " + job.command
+
+    def test_start_returns_at_once(self, table):
+        """Test starting a job does not wait for it."""
+        began = time.monotonic()
+        job, _ = start(table, "sleep 2")
+
+        assert time.monotonic() - began < 1.0
+        assert job.state == RUNNING
+        assert "Running" in job.describe()
+
+    def test_jobs_run_in_parallel(self, table):
+        """Test jobs overlap instead of running one after another."""
+        began = time.monotonic()
+        started = [start(table, "sleep 0.5")[0] for _ in range(4)]
+
+        for job in started:
+            assert job.finished.wait(TIMEOUT)
+        assert time.monotonic() - began < 1.5
+        assert [job.id for job in started] == [1, 2, 3, 4]
+
+    def test_command_not_found(self, table):
+        """Test a missing command is classified and its message held."""
+        job, output = start(table, "definitely-missing-mairu-command")
+
+        assert job.finished.wait(TIMEOUT)
+        assert job.not_found
+        assert output.getvalue() == ""
+
+    def test_finished_jobs_reported_once(self, table):
+        """Test finished jobs are taken out of the table."""
+        done, _ = start(table, "true")
+        running, _ = start(table, "sleep 2")
+        assert done.finished.wait(TIMEOUT)
+
+        assert table.finished_jobs() == [done]
+        assert table.finished_jobs() == []
+        assert table.jobs() == [running]
+        assert table.get() is running
+
+    def test_close_stops_jobs(self, table):
+        """Test running jobs are hung up when MairuCLI exits."""
+        job, _ = start(table, "sleep 30")
+
+        table.close()
+
+        assert job.finished.wait(TIMEOUT)
+        assert job.state == DONE
+
+
+class TestJobControlBuiltins:
+    """Test suite for the jobs, fg and wait builtins."""
+
+    def test_registered(self):
+        """Test the job control commands are builtins."""
+        for name in ("jobs", "fg", "wait"):
+            assert BuiltinCommands.is_builtin(name)
+
+    def test_jobs_lists_and_forgets_finished(self, table, capsys):
+        """Test `jobs` lists every job, finished ones only once."""
+        done, _ = start(table, "true")
+        start(table, "sleep 2")
+        assert done.finished.wait(TIMEOUT)
+
+        assert BuiltinCommands.execute_builtin("jobs", [])
+        listed = capsys.readouterr().out
+        assert "[1]  Done       true" in listed
+        assert "[2]  Running    sleep 2" in listed
+
+        BuiltinCommands.execute_builtin("jobs", [])
+        assert "[1]" not in capsys.readouterr().out
+
+    def test_fg_waits_for_job(self, table, capsys):
+        """Test `fg` waits for the job and forgets it."""
+        job, _ = start(table, "sleep 0.3")
+
+        assert BuiltinCommands.execute_builtin("fg", ["%1"])
+
+        assert job.state == DONE
+        assert capsys.readouterr().out == "sleep 0.3\n"
+        assert table.jobs() == []
+
+    def test_wait_for_all_jobs(self, table):
+        """Test `wait` returns once every job finished."""
+        started = [start(table, f"sleep 0.{n}")[0] for n in (1, 2, 3)]
+
+        assert BuiltinCommands.execute_builtin("wait", [])
+
+        assert all(job.state == DONE for job in started)
+        # Reported at the next prompt
+        assert table.finished_jobs() == started
+
+    def test_no_such_job(self, table, capsys):
+        """Test unknown job numbers are reported."""
+        BuiltinCommands.execute_builtin("fg", ["%7"])
+        BuiltinCommands.execute_builtin("wait", ["x"])
+        BuiltinCommands.execute_builtin("fg", [])
+
+        assert capsys.readouterr().out == (
+            "fg: %7: no such job\nwait: x: no such job\nfg: no current job\n"
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,189 @@
+"""
+Unit tests for the $PATH executable index in src/path_index.py
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+from src.path_index import PathIndex, get_path_index
+
+
+def make_executable(path, mode=0o755):
+    """Create an (empty) file with the given mode."""
+    path.write_text("")
+    path.chmod(mode)
+    return path
+
+
+def bump_mtime(directory):
+    """Move a directory's mtime forward (coarse filesystem clocks)."""
+    stat = os.stat(directory)
+    os.utime(directory, ns=(stat.st_atime_ns,
+                            stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def path_dirs(tmp_path):
+    """Two PATH directories, a missing one and an empty entry."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    for directory in (first, second):
+        directory.mkdir()
+    path = os.pathsep.join([str(first), "", str(tmp_path / "missing"),
+                            str(second)])
+    return first, second, path
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+class TestPathIndex:
+    """Test suite for indexing $PATH executables."""
+
+    def test_lists_executables_in_path_order(self, path_dirs):
+        """Test only executable files are listed, directory by directory."""
+        first, second, path = path_dirs
+        make_executable(first / "zeta")
+        make_executable(first / "alpha")
+        make_executable(first / "notes.txt", 0o644)
+        make_executable(second / "beta")
+        (second / "subdir").mkdir()
+
+        assert PathIndex(path).names() == ["alpha", "zeta", "beta"]
+
+    def test_first_directory_wins(self, path_dirs):
+        """Test a name in several directories resolves like the shell."""
+        first, second, path = path_dirs
+        shadowing = make_executable(first / "tool")
+        make_executable(second / "tool")
+
+        index = PathIndex(path)
+
+        assert index.lookup("tool") == str(shadowing)
+        assert index.names() == ["tool"]
+
+    def test_lookup_missing(self, path_dirs):
+        """Test unknown and non-executable names are not found."""
+        first, _, path = path_dirs
+        make_executable(first / "readme", 0o644)
+
+        index = PathIndex(path)
+
+        assert index.lookup("readme") is None
+        assert index.lookup("no-such-command") is None
+        assert len(index) == 0
+
+    def test_refresh_rescans_changed_directories(self, path_dirs):
+        """Test a new executable appears once its directory's mtime moves."""
+        first, second, path = path_dirs
+        make_executable(first / "old")
+        index = PathIndex(path, refresh_interval=0)
+        version = index.version
+
+        new = make_executable(second / "new")
+        bump_mtime(second)
+
+        assert index.lookup("new") == str(new)
+        assert index.version != version
+
+    def test_refresh_keeps_unchanged_directories(self, path_dirs,
+                                                 monkeypatch):
+        """Test nothing is rescanned while no directory changed."""
+        first, _, path = path_dirs
+        make_executable(first / "tool")
+        index = PathIndex(path, refresh_interval=0)
+        version = index.version
+
+        import src.path_index as path_index
+        monkeypatch.setattr(path_index, "scan_directory", None)
+
+        assert index.refresh() is False
+        assert index.version == version
+        assert index.lookup("tool")
+
+    def test_refresh_is_throttled(self, path_dirs):
+        """Test the listing is reused within the refresh interval."""
+        first, _, path = path_dirs
+        index = PathIndex(path, refresh_interval=3600)
+        assert index.names() == []
+
+        make_executable(first / "late")
+        bump_mtime(first)
+
+        assert index.names() == []
+        assert index.refresh() is True
+        assert index.names() == ["late"]
+
+    def test_misses_are_checked_on_disk(self, path_dirs):
+        """Test a fresh install is found before the next refresh."""
+        first, _, path = path_dirs
+        index = PathIndex(path, refresh_interval=3600)
+        assert index.lookup("late") is None
+
+        late = make_executable(first / "late")
+
+        assert index.lookup("late") == str(late)
+        assert index.names() == ["late"]
+
+    def test_changes_without_new_mtime_are_found(self, path_dirs):
+        """Test chmod +x and symlink targets that appear later."""
+        first, second, path = path_dirs
+        tool = make_executable(first / "tool", mode=0o644)
+        os.symlink(second / "target", first / "link")
+        index = PathIndex(path, refresh_interval=0)
+        assert index.lookup("tool") is None
+        assert index.lookup("link") is None
+        mtime = os.stat(first).st_mtime_ns
+
+        tool.chmod(0o755)
+        make_executable(second / "target")
+
+        assert os.stat(first).st_mtime_ns == mtime
+        assert index.lookup("tool") == str(tool)
+        assert index.lookup("link") == str(first / "link")
+
+    def test_path_change_reindexes(self, path_dirs):
+        """Test changing the search path replaces the index."""
+        first, second, _ = path_dirs
+        make_executable(first / "one")
+        make_executable(second / "two")
+        index = PathIndex(str(first), refresh_interval=0)
+        assert index.names() == ["one"]
+
+        index.path = str(second)
+
+        assert index.names() == ["two"]
+
+    def test_background_build(self, path_dirs):
+        """Test lookups wait for the index started in the background."""
+        first, _, path = path_dirs
+        tool = make_executable(first / "tool")
+        index = PathIndex(path)
+
+        index.start()
+        index.start()  # Starting twice is harmless
+
+        assert index.lookup("tool") == str(tool)
+
+    def test_shared_index_follows_environment(self, path_dirs, monkeypatch):
+        """Test the shared index reads the PATH environment variable."""
+        first, _, path = path_dirs
+        tool = make_executable(first / "mairu-path-index-test")
+        monkeypatch.setenv("PATH", path)
+        index = get_path_index()
+        monkeypatch.setattr(index, "refresh_interval", 0)
+
+        assert index.lookup("mairu-path-index-test") == str(tool)
+
+        # Leave the shared index matching the real PATH for other tests
+        monkeypatch.undo()
+        index.refresh()
+        assert index.lookup("mairu-path-index-test") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,258 @@
+"""
+Unit tests for PatternBundle class in src/pattern_bundle.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+from src.pattern_bundle import PatternBundle, NO_CACHE_ENV
+from src.project_paths import get_cache_dir
+from src import interceptor
+
+
+class CountingBuilder:
+    """Build callable that records how often it ran."""
+
+    def __init__(self, source: Path, cacheable: bool = True):
+        self.source = source
+        self.cacheable = cacheable
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"content": self.source.read_text()}, self.cacheable
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Create a single source file."""
+    path = tmp_path / "catalog.json"
+    path.write_text('{"warnings": {}}')
+    return path
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Cache directory that does not exist yet."""
+    return tmp_path / "cache"
+
+
+class TestPatternBundle:
+    """Test suite for PatternBundle class."""
+
+    def test_first_load_builds_and_writes_bundle(self, source, cache_dir):
+        """Test bundle file is created on first load."""
+        bundle = PatternBundle([source], cache_dir=cache_dir)
+        build = CountingBuilder(source)
+
+        data = bundle.load(build)
+
+        assert data == {"content": '{"warnings": {}}'}
+        assert build.calls == 1
+        assert bundle.path.exists()
+        assert bundle.version
+
+    def test_second_load_reads_bundle(self, source, cache_dir):
+        """Test unchanged sources are not rebuilt."""
+        build = CountingBuilder(source)
+        first = PatternBundle([source], cache_dir=cache_dir)
+        first.load(build)
+
+        second = PatternBundle([source], cache_dir=cache_dir)
+        data = second.load(build)
+
+        assert build.calls == 1
+        assert data == {"content": '{"warnings": {}}'}
+        assert second.version == first.version
+
+    def test_changed_source_rebuilds(self, source, cache_dir):
+        """Test editing a source file invalidates the bundle."""
+        build = CountingBuilder(source)
+        first = PatternBundle([source], cache_dir=cache_dir)
+        first.load(build)
+
+        source.write_text('{"warnings": {"new": {}}}')
+        second = PatternBundle([source], cache_dir=cache_dir)
+        data = second.load(build)
+
+        assert build.calls == 2
+        assert data == {"content": '{"warnings": {"new": {}}}'}
+        assert second.version != first.version
+
+    def test_touched_source_is_not_rebuilt(self, source, cache_dir):
+        """Test a new mtime with identical content reuses the bundle."""
+        build = CountingBuilder(source)
+        PatternBundle([source], cache_dir=cache_dir).load(build)
+
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        PatternBundle([source], cache_dir=cache_dir).load(build)
+        PatternBundle([source], cache_dir=cache_dir).load(build)
+
+        assert build.calls == 1
+
+    def test_missing_source_appearing_rebuilds(self, source, cache_dir):
+        """Test a source that did not exist is picked up once created."""
+        overlay = source.parent / "overlay.json"
+        build = CountingBuilder(source)
+        PatternBundle([source, overlay], cache_dir=cache_dir).load(build)
+
+        overlay.write_text("{}")
+        PatternBundle([source, overlay], cache_dir=cache_dir).load(build)
+
+        assert build.calls == 2
+
+    def test_different_key_rebuilds(self, source, cache_dir):
+        """Test changed build settings invalidate the bundle."""
+        build = CountingBuilder(source)
+        PatternBundle([source], cache_dir=cache_dir, key="a").load(build)
+        PatternBundle([source], cache_dir=cache_dir, key="b").load(build)
+
+        assert build.calls == 2
+
+    def test_changed_code_rebuilds(self, source, cache_dir, tmp_path):
+        """Test editing a module that computes the data invalidates it."""
+        module = tmp_path / "analysis.py"
+        module.write_text("LITERALS = 1\n")
+        build = CountingBuilder(source)
+        PatternBundle([source], cache_dir=cache_dir, code=[module]).load(build)
+        PatternBundle([source], cache_dir=cache_dir, code=[module]).load(build)
+        assert build.calls == 1
+
+        module.write_text("LITERALS = 2\n")
+        bundle = PatternBundle([source], cache_dir=cache_dir, code=[module])
+        bundle.load(build)
+
+        assert build.calls == 2
+        assert bundle._read()["key"] == bundle.key
+
+    def test_interceptor_bundle_is_keyed_on_its_code(self):
+        """Test the pattern bundle depends on the analysing modules."""
+        names = {path.name for path in interceptor.bundle_code_modules()}
+
+        assert {"interceptor.py", "command_parser.py",
+                "shell_lexer.py"} <= names
+        assert "code=" in interceptor.PATTERN_BUNDLE.key
+
+    def test_uncacheable_data_is_not_written(self, source, cache_dir):
+        """Test data built from invalid sources is rebuilt every time."""
+        build = CountingBuilder(source, cacheable=False)
+        bundle = PatternBundle([source], cache_dir=cache_dir)
+        bundle.load(build)
+        PatternBundle([source], cache_dir=cache_dir).load(build)
+
+        assert not bundle.path.exists()
+        assert build.calls == 2
+
+    def test_corrupt_bundle_rebuilds(self, source, cache_dir):
+        """Test a damaged bundle file is ignored and replaced."""
+        build = CountingBuilder(source)
+        bundle = PatternBundle([source], cache_dir=cache_dir)
+        bundle.load(build)
+
+        bundle.path.write_bytes(b"\x00garbage")
+        data = PatternBundle([source], cache_dir=cache_dir).load(build)
+
+        assert build.calls == 2
+        assert data == {"content": '{"warnings": {}}'}
+
+    def test_unwritable_cache_dir_still_loads(self, source, tmp_path):
+        """Test a cache dir that cannot be created does not break loading."""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        bundle = PatternBundle([source], cache_dir=blocker / "cache")
+
+        data = bundle.load(CountingBuilder(source))
+
+        assert data == {"content": '{"warnings": {}}'}
+        assert not bundle.path.exists()
+
+    def test_no_cache_env_always_builds(self, source, cache_dir, monkeypatch):
+        """Test MAIRU_NO_CACHE bypasses the bundle."""
+        monkeypatch.setenv(NO_CACHE_ENV, "1")
+        build = CountingBuilder(source)
+        PatternBundle([source], cache_dir=cache_dir).load(build)
+        PatternBundle([source], cache_dir=cache_dir).load(build)
+
+        assert build.calls == 2
+        assert not cache_dir.exists()
+
+    def test_invalidate_forces_rebuild(self, source, cache_dir):
+        """Test invalidate deletes the bundle file."""
+        build = CountingBuilder(source)
+        bundle = PatternBundle([source], cache_dir=cache_dir)
+        bundle.load(build)
+
+        bundle.invalidate()
+        bundle.load(build)
+
+        assert build.calls == 2
+
+    def test_cache_dir_env_override(self, tmp_path, monkeypatch):
+        """Test MAIRU_CACHE_DIR overrides the cache location."""
+        monkeypatch.setenv("MAIRU_CACHE_DIR", str(tmp_path))
+
+        assert get_cache_dir() == tmp_path.resolve()
+
+
+class TestInterceptorBundle:
+    """Test pattern data loaded through the bundle."""
+
+    def test_build_pattern_data_matches_loaded_catalogs(self):
+        """Test bundled data yields the same patterns as the JSON files."""
+        data, cacheable = interceptor.build_pattern_data()
+
+        assert list(data['dangerous']) == list(interceptor.DANGEROUS_PATTERNS)
+        assert list(data['caution']) == list(interceptor.CAUTION_PATTERNS)
+        assert list(data['typo']) == list(interceptor.TYPO_PATTERNS)
+        assert data['common_commands'] == interceptor.COMMON_COMMANDS
+
+    def test_bundled_data_carries_literals(self):
+        """Test literals are precomputed so startup skips regex analysis."""
+        data, _ = interceptor.build_pattern_data()
+
+        for patterns in (data['dangerous'], data['caution'], data['typo']):
+            for pattern_data in patterns.values():
+                assert 'literals' in pattern_data
+                assert 'compiled' not in pattern_data
+
+    def test_invalid_pattern_is_left_out_and_not_cached(self, monkeypatch,
+                                                        capsys):
+        """Test a regex that does not compile is dropped when building."""
+        def load_all_patterns(loader):
+            return ({"rm_dangerous": {"pattern": r"rm\s+-rf"},
+                     "broken": {"pattern": r"rm[x"}}, {}, {})
+
+        monkeypatch.setattr(interceptor.PatternLoader, "load_all_patterns",
+                            load_all_patterns)
+
+        data, cacheable = interceptor.build_pattern_data()
+
+        assert list(data['dangerous']) == ["rm_dangerous"]
+        assert cacheable is False
+        assert "Invalid pattern 'broken'" in capsys.readouterr().out
+
+    def test_bundle_round_trip_preserves_priority_order(self, tmp_path):
+        """Test pattern order survives writing and reading the bundle."""
+        sources = interceptor.pattern_sources()
+        PatternBundle(sources, cache_dir=tmp_path).load(
+            interceptor.build_pattern_data
+        )
+
+        data = PatternBundle(sources, cache_dir=tmp_path).load(
+            lambda: pytest.fail("bundle should have been reused")
+        )
+
+        assert list(data['dangerous']) == list(interceptor.DANGEROUS_PATTERNS)
+        assert interceptor.PATTERN_BUNDLE_VERSION
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
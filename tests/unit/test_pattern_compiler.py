@@ -330,5 +330,137 @@ class TestPatternCompiler:
         assert not compiled["whitespace"]['compiled'].search("text")
 
 
+    def test_extract_literals_simple_command(self):
+        """Test required literal is extracted from a command pattern."""
+        compiler = PatternCompiler()
+
+        assert compiler.extract_literals(r"chmod\s+(-R\s+)?777") == \
+            frozenset({"chmod"})
+        assert compiler.extract_literals(r"dd\s+if=/dev/zero") == \
+            frozenset({"if=/dev/zero"})
+
+    def test_extract_literals_lowercases(self):
+        """Test literals are lowercased for case-insensitive lookup."""
+        compiler = PatternCompiler()
+
+        assert compiler.extract_literals(r"DROP\s+DATABASE") == \
+            frozenset({"database"})
+
+    def test_extract_literals_alternation(self):
+        """Test alternation yields one literal per branch."""
+        compiler = PatternCompiler()
+
+        literals = compiler.extract_literals(
+            r"(iptables\s+-F|ufw\s+disable|systemctl\s+stop\s+firewalld)"
+        )
+
+        assert literals == frozenset({"iptables", "disable", "systemctl"})
+
+    def test_extract_literals_ignores_optional_parts(self):
+        """Test optional groups never become required literals."""
+        compiler = PatternCompiler()
+
+        literals = compiler.extract_literals(r"(mkfs_long_name)?\s+x")
+
+        assert literals == frozenset({"x"})
+
+    def test_extract_literals_none_when_not_required(self):
+        """Test patterns without a guaranteed literal return None."""
+        compiler = PatternCompiler()
+
+        assert compiler.extract_literals(r"^\s+$") is None
+        assert compiler.extract_literals(r"(rm|\d+)") is None
+        assert compiler.extract_literals("") is None
+
+    def test_compile_patterns_records_literals(self):
+        """Test compile_patterns stores the required literals."""
+        compiler = PatternCompiler()
+
+        compiled = compiler.compile_patterns({
+            "chmod_777": {"pattern": r"chmod\s+777"}
+        })
+
+        assert compiled["chmod_777"]["literals"] == frozenset({"chmod"})
+
+    def test_bundled_patterns_compile_on_first_use(self):
+        """Test data carrying literals is not compiled until needed."""
+        compiler = PatternCompiler()
+
+        record = compiler.compile_patterns({
+            "chmod_777": {"pattern": r"chmod\s+777",
+                          "literals": frozenset({"chmod"})}
+        })["chmod_777"]
+
+        assert record._compiled is None
+        assert record.compiled.search("CHMOD 777 /etc")
+        assert record["compiled"] is record.compiled
+
+    @pytest.mark.parametrize("pattern,commands", [
+        (r"rm\s+-rf\s+/", ("rm",)),
+        (r"mkfs(\.\w+)?\s+/dev/sd[a-z]", ("mkfs",)),
+        (r"kill\b", ("kill",)),
+        (r"DROP\s+DATABASE", ()),
+        (r"^sl$", ()),
+        (r"(iptables\s+-F|ufw\s+disable)", ()),
+        (r"rm\s+x|dd\s+y", ()),
+        (r"rmdirs?\s+/", ()),
+        (r">\s*/dev/sda", ()),
+        (r"curl\s+.*\|\s*(ba)?sh", ()),
+        (r"cd\s+/\s*;\s*rm", ()),
+        (r"make\s*&&\s*rm", ()),
+        (r"wget\s+.*[|;]", ()),
+    ])
+    def test_extract_commands(self, pattern, commands):
+        """Test the leading command name is inferred only when unambiguous."""
+        assert PatternCompiler().extract_commands(pattern) == commands
+
+    def test_explicit_commands_override_inference(self):
+        """Test the optional commands field wins, and [] means agnostic."""
+        compiler = PatternCompiler()
+
+        compiled = compiler.compile_patterns({
+            "firewall": {"pattern": r"(iptables\s+-F|ufw\s+disable)",
+                         "commands": ["iptables", "UFW"]},
+            "raw_rm": {"pattern": r"rm\s+-rf", "commands": []},
+        })
+
+        assert compiled["firewall"]["commands"] == ("iptables", "ufw")
+        assert compiled["raw_rm"]["commands"] == ()
+
+    def test_spanning_patterns_stay_command_agnostic(self):
+        """Test pipes and chains override explicit commands too."""
+        compiler = PatternCompiler()
+
+        compiled = compiler.compile_patterns({
+            "curl_pipe": {"pattern": r"curl\s+.*\|\s*sh",
+                          "commands": ["curl"]},
+        })
+
+        assert compiler.spans_commands(r"curl\s+.*\|\s*sh")
+        assert not compiler.spans_commands(r"(rm\s+-rf|dd\s+if=)")
+        assert compiler.spans_commands(r"rm\s+[\]|x]")
+        assert compiled["curl_pipe"]["commands"] == ()
+
+    def test_build_command_index(self):
+        """Test patterns are numbered across catalogs and bucketed."""
+        compiler = PatternCompiler()
+        dangerous = compiler.compile_patterns({
+            "rm_root": {"pattern": r"rm\s+-rf\s+/"},
+            "fork_bomb": {"pattern": r":\(\)\s*\{"},
+        })
+        caution = compiler.compile_patterns({
+            "rm_any": {"pattern": r"rm\s+-rf"},
+            "firewall": {"pattern": r"(ufw\s+disable|iptables\s+-F)",
+                         "commands": ["ufw", "iptables"]},
+        })
+
+        by_command, agnostic = compiler.build_command_index(
+            [dangerous, caution]
+        )
+
+        assert by_command == {"rm": [0, 2], "ufw": [3], "iptables": [3]}
+        assert agnostic == [1]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
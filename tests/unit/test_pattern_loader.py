@@ -358,6 +358,29 @@ class TestPatternLoader:
             assert pattern["art_file"] == "default.txt", \
                 "Should use default art_file"
 
+    def test_commands_field_is_kept(self):
+        """Test the optional commands field reaches the pattern data."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            warning_catalog = {
+                "version": "1.0",
+                "warnings": {
+                    "wipe": {
+                        "pattern": "(wipefs|sgdisk\\s+--zap-all)",
+                        "commands": ["wipefs", "sgdisk"]
+                    },
+                    "inferred": {"pattern": "rm\\s+-rf"}
+                }
+            }
+            with open(os.path.join(tmpdir, "warning_catalog.json"),
+                      'w') as f:
+                json.dump(warning_catalog, f)
+
+            loader = PatternLoader(data_dir=tmpdir)
+            dangerous, _, _ = loader.load_all_patterns()
+
+            assert dangerous["wipe"]["commands"] == ["wipefs", "sgdisk"]
+            assert "commands" not in dangerous["inferred"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
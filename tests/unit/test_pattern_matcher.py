@@ -0,0 +1,299 @@
+"""
+Unit tests for PatternMatcher class in src/interceptor.py
+"""
+
+import os
+import re
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+from src.interceptor import (
+    PatternCompiler,
+    PatternMatcher,
+    DANGEROUS_PATTERNS,
+    CAUTION_PATTERNS,
+    TYPO_PATTERNS
+)
+
+
+def _compile(patterns):
+    """Compile a {name: pattern} mapping into pattern data."""
+    return PatternCompiler().compile_patterns(
+        {name: {"pattern": pattern} for name, pattern in patterns.items()}
+    )
+
+
+def _sequential(dangerous, caution, typo, command):
+    """Reference implementation: one search per pattern in priority order."""
+    for name, data in dangerous.items():
+        if re.search(data["pattern"], command, re.IGNORECASE):
+            return "critical", name
+    for name, data in caution.items():
+        if re.search(data["pattern"], command, re.IGNORECASE):
+            return "caution", name
+    for name, data in typo.items():
+        if re.search(data["pattern"], command, re.IGNORECASE):
+            return "critical", f"typo_{name}"
+    return "safe", ""
+
+
+class TestPatternMatcher:
+    """Test suite for PatternMatcher class."""
+
+    def test_matches_catalog_like_sequential_scan(self):
+        """Test combined matcher agrees with per-pattern scan on catalogs."""
+        matcher = PatternMatcher(
+            DANGEROUS_PATTERNS, CAUTION_PATTERNS, TYPO_PATTERNS
+        )
+        commands = [
+            "rm -rf /", "chmod 777 file", "chmod 755 file", "ls -la",
+            "> /etc/passwd", "echo c > /proc/sysrq-trigger",
+            "dd if=/dev/random of=/dev/sda", "sudo su", "sl", "cd..",
+            "git push -f", "git status", ":(){ :|:& };:", "DROP DATABASE x",
+            "mkfs /dev/sdb", "echo hi > /tmp/out", "", "   ",
+        ]
+
+        for command in commands:
+            assert matcher.match(command) == _sequential(
+                DANGEROUS_PATTERNS, CAUTION_PATTERNS, TYPO_PATTERNS, command
+            ), command
+
+    def test_priority_wins_over_leftmost_match(self):
+        """Test higher-priority pattern wins even if it matches further right."""
+        dangerous = _compile({
+            "specific": r"/etc/passwd",
+            "generic": r"echo\s+",
+        })
+        matcher = PatternMatcher(dangerous, {}, {})
+
+        assert matcher.match("echo x > /etc/passwd") == ("critical", "specific")
+        assert matcher.match("echo x > /tmp/file") == ("critical", "generic")
+
+    def test_dangerous_checked_before_caution_and_typo(self):
+        """Test level order is dangerous, caution, then typo."""
+        dangerous = _compile({"chmod_777": r"chmod\s+777"})
+        caution = _compile({"chmod_any": r"chmod\s+\d+"})
+        typo = _compile({"chmod_typo": r"^chmod"})
+        matcher = PatternMatcher(dangerous, caution, typo)
+
+        assert matcher.match("chmod 777 f") == ("critical", "chmod_777")
+        assert matcher.match("chmod 755 f") == ("caution", "chmod_any")
+        assert matcher.match("chmod f") == ("critical", "typo_chmod_typo")
+        assert matcher.match("ls") == ("safe", "")
+
+    def test_shared_prefix_patterns_are_factored_correctly(self):
+        """Test patterns sharing a command name still match independently."""
+        dangerous = _compile({
+            "dd_zero": r"dd\s+if=/dev/zero",
+            "dd_random": r"dd\s+if=/dev/random",
+            "ddrescue": r"ddrescue\s+--force",
+        })
+        matcher = PatternMatcher(dangerous, {}, {})
+
+        assert matcher.match("dd if=/dev/zero") == ("critical", "dd_zero")
+        assert matcher.match("dd if=/dev/random") == ("critical", "dd_random")
+        assert matcher.match("ddrescue --force") == ("critical", "ddrescue")
+        assert matcher.match("dd if=file") == ("safe", "")
+
+    def test_top_level_alternation_is_not_split(self):
+        """Test 'a|b' patterns keep their alternation semantics."""
+        dangerous = _compile({"either": r"iptables\s+-F|ufw\s+disable"})
+        matcher = PatternMatcher(dangerous, {}, {})
+
+        assert matcher.match("ufw disable") == ("critical", "either")
+        assert matcher.match("iptables -F") == ("critical", "either")
+        assert matcher.match("iptables -L") == ("safe", "")
+
+    def test_quantified_last_literal_character(self):
+        """Test a quantifier right after the leading literal is respected."""
+        dangerous = _compile({"rmdir": r"rmdirs?\s+/"})
+        matcher = PatternMatcher(dangerous, {}, {})
+
+        assert matcher.match("rmdir /") == ("critical", "rmdir")
+        assert matcher.match("rmdirs /") == ("critical", "rmdir")
+
+    def test_case_insensitive_matching(self):
+        """Test merged patterns keep case-insensitive matching."""
+        dangerous = _compile({"drop_database": r"DROP\s+DATABASE"})
+        matcher = PatternMatcher(dangerous, {}, {})
+
+        assert matcher.match("drop database prod") == \
+            ("critical", "drop_database")
+
+    def test_backreferences_fall_back_to_sequential(self):
+        """Test patterns with backreferences still match correctly."""
+        dangerous = _compile({"repeat": r"(\w+)\s+\1"})
+        matcher = PatternMatcher(dangerous, {}, {})
+
+        assert matcher._combined is None
+        assert matcher.match("go go") == ("critical", "repeat")
+        assert matcher.match("go stop") == ("safe", "")
+
+    def test_large_catalog_matches_sequential_scan(self):
+        """Test a 1,000-pattern catalog keeps exact sequential semantics."""
+        patterns = {
+            f"tool{i}": rf"tool{i}\s+--purge\s+/srv/{i}" for i in range(1000)
+        }
+        dangerous = _compile(patterns)
+        matcher = PatternMatcher(dangerous, {}, {})
+
+        assert len(matcher) == 1000
+        assert matcher.match("tool42 --purge /srv/42") == \
+            ("critical", "tool42")
+        assert matcher.match("tool4 --purge /srv/4") == ("critical", "tool4")
+        assert matcher.match("tool42 --purge /srv/43") == ("safe", "")
+
+    def test_empty_catalogs(self):
+        """Test matcher with no patterns reports everything safe."""
+        matcher = PatternMatcher({}, {}, {})
+
+        assert len(matcher) == 0
+        assert matcher.match("rm -rf /") == ("safe", "")
+
+    def test_prefilter_skips_patterns_without_literals_present(self):
+        """Test commands without any indexed literal get no candidates."""
+        matcher = PatternMatcher(
+            DANGEROUS_PATTERNS, CAUTION_PATTERNS, TYPO_PATTERNS
+        )
+
+        assert matcher.candidates("ls -la") == []
+        assert matcher.candidates("make -j8 all") == []
+
+    def test_prefilter_finds_overlapping_literals(self):
+        """Test literals sharing a start position are all reported."""
+        # Grouped, so they search the raw command instead of being
+        # anchored to a command word
+        dangerous = _compile({
+            "short": r"(?:dd)\s+x",
+            "long": r"(?:ddrescue)\s+y",
+            "inner": r"(?:rescue)\s+z",
+        })
+        matcher = PatternMatcher(dangerous, {}, {})
+
+        assert matcher.candidates("ddrescue") == [0, 1, 2]
+        assert matcher.match("ddrescue z") == ("critical", "inner")
+
+    def test_prefilter_case_insensitive_and_unicode_folding(self):
+        """Test prefilter agrees with case-insensitive regex matching."""
+        dangerous = _compile({"shred_secure": r"shred\s+-n\s+\d{2,}"})
+        matcher = PatternMatcher(dangerous, {}, {})
+
+        assert matcher.match("SHRED -n 10 disk") == \
+            ("critical", "shred_secure")
+        # LATIN SMALL LETTER LONG S matches 's' case-insensitively
+        assert matcher.match("\u017fhred -n 10 disk") == \
+            ("critical", "shred_secure")
+
+    def test_patterns_without_literals_always_checked(self):
+        """Test unindexed patterns are still evaluated with priority."""
+        dangerous = _compile({
+            "digits": r"\d{4}",
+            "chmod_777": r"chmod\s+777",
+        })
+        matcher = PatternMatcher(dangerous, {}, {})
+
+        assert matcher.match("chmod 777 2024") == ("critical", "digits")
+        assert matcher.match("chmod 777 x") == ("critical", "chmod_777")
+        assert matcher.match("ls") == ("safe", "")
+
+    def test_command_patterns_indexed_by_name(self):
+        """Test patterns starting with a command name are indexed by it."""
+        dangerous = _compile({
+            "rm_root": r"rm\s+-rf\s+/",
+            "mkfs_disk": r"mkfs(\.\w+)?\s+/dev/sd[a-z]",
+            "drop_database": r"DROP\s+DATABASE",
+            "any_redirect": r">\s*/dev/sd[a-z]",
+        })
+        matcher = PatternMatcher(dangerous, {}, {})
+
+        assert matcher._by_command == {"rm": [0], "mkfs": [1]}
+        assert PatternCompiler().extract_commands(r"rmdirs?\s+/") == ()
+        assert PatternCompiler().extract_commands(r"^sl$") == ()
+
+    def test_quoted_arguments_are_checked_as_command_lines(self):
+        """Test a quoted argument that reads as a command is checked."""
+        matcher = PatternMatcher(DANGEROUS_PATTERNS, {}, {})
+
+        assert matcher.match('echo "rm -rf /"') == ("critical", "rm_dangerous")
+        assert matcher.match('echo "hello world"') == ("safe", "")
+        assert matcher.match("git commit -m 'fix typo'") == ("safe", "")
+
+    def test_command_patterns_match_every_simple_command(self):
+        """Test chained, wrapped and nested commands are all checked."""
+        matcher = PatternMatcher(DANGEROUS_PATTERNS, {}, {})
+
+        for command in [
+            "ls && rm -rf /",
+            "sudo rm -rf /",
+            "/bin/rm -rf /",
+            "(cd /tmp; rm -rf /)",
+            'bash -c "rm -rf /"',
+            "echo `rm -rf /`",
+            'echo "$(rm -rf /)"',
+            'x="$(rm -rf /)"',
+            'echo "$(echo $(rm -rf /))"',
+            'rm -rf "/"',
+        ]:
+            assert matcher.match(command) == \
+                ("critical", "rm_dangerous"), command
+
+    def test_patterns_spanning_pipes_match_whole_line(self):
+        """Test a rule across a pipe is not split per simple command."""
+        matcher = PatternMatcher(
+            _compile({"curl_pipe": r"curl\s+.*\|\s*(ba)?sh"}), {}, {})
+
+        assert matcher.match("curl http://x | sh") == ("critical", "curl_pipe")
+        assert matcher.match("curl http://x -o x.sh") == ("safe", "")
+
+    def test_command_patterns_see_redirections_without_spaces(self):
+        """Test redirections are matched in normalized form."""
+        matcher = PatternMatcher(DANGEROUS_PATTERNS, {}, {})
+
+        assert matcher.match("echo c>/proc/sysrq-trigger") == \
+            ("critical", "kernel_panic")
+
+    def test_command_and_agnostic_patterns_keep_priority(self):
+        """Test priority holds across command-anchored and raw patterns."""
+        dangerous = _compile({
+            "agnostic": r"(?:/etc/passwd)",
+            "echo_any": r"echo\s+",
+            "late_agnostic": r"secret",
+        })
+        matcher = PatternMatcher(dangerous, {}, {})
+
+        assert matcher.match("echo x > /etc/passwd") == ("critical", "agnostic")
+        assert matcher.match("echo secret") == ("critical", "echo_any")
+        assert matcher.match("cat secret") == ("critical", "late_agnostic")
+
+    def test_match_many_agrees_with_match(self):
+        """Test batch matching returns the pattern match() would pick."""
+        matcher = PatternMatcher(
+            DANGEROUS_PATTERNS, CAUTION_PATTERNS, TYPO_PATTERNS
+        )
+        patterns = matcher.patterns()
+        commands = [
+            "rm -rf /", "chmod 777 file", "ls -la", "> /etc/passwd",
+            "echo c > /proc/sysrq-trigger", "dd if=/dev/random of=/dev/sda",
+            "sudo su", "sl", "git push -f", "DROP DATABASE x",
+            "echo mkfs /dev/sdb", "echo hi > /tmp/out", "", "   ",
+        ]
+
+        for command, index in zip(commands, matcher.match_many(commands)):
+            verdict = ("safe", "") if index is None else patterns[index]
+            assert verdict == matcher.match(command), command
+
+    def test_match_many_keeps_priority_per_command(self):
+        """Test one command's candidates never leak into another's."""
+        dangerous = _compile({
+            "agnostic": r"(?:/etc/passwd)",
+            "echo_any": r"echo\s+",
+            "late_agnostic": r"secret",
+        })
+        matcher = PatternMatcher(dangerous, {}, {})
+
+        assert matcher.match_many(
+            ["echo secret", "cat secret", "echo x > /etc/passwd", "ls"]
+        ) == [1, 2, 0, None]
@@ -0,0 +1,104 @@
+"""
+Unit tests for the pattern table in src/pattern_table.py
+"""
+
+import os
+import re
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+from src.interceptor import PatternCompiler
+from src.pattern_table import (
+    PatternRecord,
+    PatternTable,
+    LEVEL_CAUTION,
+    LEVEL_CRITICAL,
+    NO_PATTERN
+)
+
+
+@pytest.fixture
+def table():
+    """Table with one pattern per catalog."""
+    compiler = PatternCompiler()
+    return PatternTable(
+        compiler.compile_patterns({"rm_root": {"pattern": r"rm\s+/",
+                                               "category": "destroyer"}}),
+        compiler.compile_patterns({"sudo_su": {"pattern": r"sudo\s+su"}}),
+        compiler.compile_patterns({"sl": {"pattern": r"^sl\b",
+                                          "correct": "ls"}})
+    )
+
+
+class TestPatternRecord:
+    """Test suite for PatternRecord."""
+
+    def test_compile_patterns_returns_records(self):
+        """Test compiled patterns are records and the input is unchanged."""
+        data = {"pattern": r"rm\s+-rf", "category": "destroyer"}
+
+        record = PatternCompiler().compile_patterns({"rm": data})["rm"]
+
+        assert isinstance(record, PatternRecord)
+        assert isinstance(record.compiled, re.Pattern)
+        assert record.commands == ("rm",)
+        assert data == {"pattern": r"rm\s+-rf", "category": "destroyer"}
+
+    def test_mapping_access(self):
+        """Test records read like the catalog dictionaries."""
+        record = PatternCompiler().compile_patterns(
+            {"rm": {"pattern": r"rm\s+-rf", "category": "destroyer"}}
+        )["rm"]
+
+        assert record["category"] == "destroyer"
+        assert record["compiled"] is record.compiled
+        assert record.get("art_file", "fired.txt") == "fired.txt"
+        assert set(record) == {"pattern", "category", "compiled",
+                               "literals", "commands"}
+
+    def test_read_only(self):
+        """Test records cannot be changed."""
+        record = PatternCompiler().compile_patterns(
+            {"rm": {"pattern": r"rm\s+-rf"}}
+        )["rm"]
+
+        with pytest.raises(AttributeError):
+            record.pattern = "ls"
+        with pytest.raises(TypeError):
+            record["category"] = "other"
+        with pytest.raises(AttributeError):
+            record.extra = 1
+
+
+class TestPatternTable:
+    """Test suite for PatternTable."""
+
+    def test_ids_follow_priority_order(self, table):
+        """Test IDs number dangerous, caution, then typo patterns."""
+        assert table.names == ("rm_root", "sudo_su", "typo_sl")
+        assert list(table.levels) == \
+            [LEVEL_CRITICAL, LEVEL_CAUTION, LEVEL_CRITICAL]
+
+    def test_id_lookup(self, table):
+        """Test names map to IDs and IDs to records."""
+        assert table.id_of("typo_sl") == 2
+        assert table[table.id_of("typo_sl")]["correct"] == "ls"
+        assert table.id_of("sl") == NO_PATTERN
+
+    def test_first_name_wins(self):
+        """Test a name in two catalogs resolves to the higher priority one."""
+        compiler = PatternCompiler()
+        catalog = compiler.compile_patterns({"dup": {"pattern": "x"}})
+        table = PatternTable(catalog, catalog, {})
+
+        assert len(table) == 2
+        assert table.id_of("dup") == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
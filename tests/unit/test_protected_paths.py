@@ -0,0 +1,218 @@
+"""
+Unit tests for the protected directory index in src/protected_paths.py
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+from src.interceptor import PatternLoader, protected_overlays
+from src.protected_paths import (
+    ProtectedPathIndex,
+    LEVEL_CRITICAL,
+    LEVEL_CAUTION
+)
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32",
+                                reason="POSIX paths")
+
+
+@pytest.fixture
+def index():
+    """Index with the Linux layout (caution /usr contains critical-free dirs)."""
+    return ProtectedPathIndex(
+        critical=["/etc", "/bin", "/srv/db/"],
+        caution=["/usr", "/usr/bin", "/var/log"]
+    )
+
+
+class TestProtectedPathIndex:
+    """Test suite for ProtectedPathIndex."""
+
+    @pytest.mark.parametrize("path,level", [
+        ("/etc", LEVEL_CRITICAL),
+        ("/etc/hosts", LEVEL_CRITICAL),
+        ("/etc/ssh/sshd_config", LEVEL_CRITICAL),
+        ("/srv/db", LEVEL_CRITICAL),
+        ("/usr/bin/python3", LEVEL_CAUTION),
+        ("/usr/local/bin/tool", LEVEL_CAUTION),
+        ("/var/log/syslog", LEVEL_CAUTION),
+        ("/var/lib/dpkg", ""),
+        ("/srv/web", ""),
+        ("/", ""),
+    ])
+    def test_lookup(self, index, path, level):
+        """Test paths inside protected directories get their level."""
+        assert index.lookup(path) == level
+
+    def test_component_boundaries(self, index):
+        """Test prefixes only match whole components (/etcetera is not /etc)."""
+        assert index.lookup("/etcetera/file") == ""
+        assert index.lookup("/binaries") == ""
+
+    def test_critical_wins_over_enclosing_caution(self):
+        """Test a critical directory inside a caution one stays critical."""
+        index = ProtectedPathIndex(critical=["/usr/lib/systemd"],
+                                   caution=["/usr"])
+
+        assert index.lookup("/usr/lib/systemd/system") == LEVEL_CRITICAL
+        assert index.lookup("/usr/lib/other") == LEVEL_CAUTION
+
+    def test_critical_wins_when_listed_in_both(self):
+        """Test a directory in both lists is critical."""
+        index = ProtectedPathIndex(critical=["/opt"], caution=["/opt"])
+
+        assert index.lookup("/opt/app") == LEVEL_CRITICAL
+        assert len(index) == 1
+
+    def test_root_protects_everything(self):
+        """Test protecting / covers every absolute path."""
+        index = ProtectedPathIndex(caution=["/"])
+
+        assert index.lookup("/") == LEVEL_CAUTION
+        assert index.lookup("/home/user") == LEVEL_CAUTION
+
+    def test_many_directories(self):
+        """Test thousands of site paths index without affecting others."""
+        index = ProtectedPathIndex(
+            critical=[f"/mnt/backup{i}" for i in range(5000)]
+        )
+
+        assert len(index) == 5000
+        assert index.lookup("/mnt/backup4999/db") == LEVEL_CRITICAL
+        assert index.lookup("/mnt/backup5000") == ""
+
+    def test_glob_rules(self):
+        """Test glob components match one path component each."""
+        index = ProtectedPathIndex(
+            critical=[{"glob": "/srv/db/*"}],
+            caution=[{"glob": "/home/*/.ssh"}]
+        )
+
+        assert index.lookup("/srv/db/shard1") == LEVEL_CRITICAL
+        assert index.lookup("/srv/db/shard1/data/file") == LEVEL_CRITICAL
+        assert index.lookup("/srv/db") == ""
+        assert index.lookup("/home/alice/.ssh/id_rsa") == LEVEL_CAUTION
+        assert index.lookup("/home/alice/notes") == ""
+
+    def test_glob_without_wildcards_is_a_directory(self):
+        """Test a literal glob behaves like a plain directory."""
+        index = ProtectedPathIndex(critical=[{"glob": "/mnt/backup"}])
+
+        assert index.lookup("/mnt/backup/2024") == LEVEL_CRITICAL
+
+    def test_regex_rules(self):
+        """Test regex rules match from the start of the path."""
+        index = ProtectedPathIndex(
+            critical=[{"regex": r"/data/[0-9]+(/|$)"}],
+            caution=[{"regex": r".*\.sqlite3$"}]
+        )
+
+        assert index.lookup("/data/42/table") == LEVEL_CRITICAL
+        assert index.lookup("/data/latest") == ""
+        assert index.lookup("/tmp/app.sqlite3") == LEVEL_CAUTION
+        assert index.lookup("/backup/data/42") == ""
+
+    def test_caution_directory_with_critical_glob(self):
+        """Test a critical glob inside a caution directory wins."""
+        index = ProtectedPathIndex(critical=[{"glob": "/usr/lib/*.so"}],
+                                   caution=["/usr"])
+
+        assert index.lookup("/usr/lib/libc.so") == LEVEL_CRITICAL
+        assert index.lookup("/usr/lib/libc.a") == LEVEL_CAUTION
+
+    def test_invalid_rule(self):
+        """Test unsupported rules are rejected."""
+        with pytest.raises(ValueError):
+            ProtectedPathIndex(critical=[{"prefix": "/srv"}])
+
+
+@pytest.fixture
+def warnings_dir(tmp_path):
+    """Warnings directory with a small protected_directories.json."""
+    def write(name, platforms):
+        path = tmp_path / name
+        path.write_text(json.dumps({"version": "1.0", "platforms": platforms}),
+                        encoding="utf-8")
+        return str(path)
+
+    write("protected_directories.json",
+          {"linux": {"critical": ["/etc"], "caution": ["/usr"]}})
+    return tmp_path, write
+
+
+class TestProtectedDirectoryCatalog:
+    """Test suite for loading protected directories and overlays."""
+
+    def test_loads_shipped_catalog(self):
+        """Test the shipped catalog covers every supported platform."""
+        loader = PatternLoader(validate_schema=False)
+
+        directories = loader.load_protected_directories()
+
+        assert set(directories) >= {"win32", "linux", "darwin"}
+        assert "/etc" in directories["linux"]["critical"]
+        assert loader.load_errors == []
+
+    def test_overlay_adds_rules(self, warnings_dir):
+        """Test site overlays extend the shipped rules."""
+        data_dir, write = warnings_dir
+        overlay = write("site.json", {
+            "linux": {"critical": [{"glob": "/srv/db/*"}, "/mnt/backup"]}
+        })
+        loader = PatternLoader(str(data_dir), validate_schema=False)
+
+        directories = loader.load_protected_directories([overlay])
+
+        assert directories["linux"]["critical"] == \
+            ["/etc", {"glob": "/srv/db/*"}, "/mnt/backup"]
+        assert directories["linux"]["caution"] == ["/usr"]
+
+    def test_invalid_regex_is_skipped(self, warnings_dir, capsys):
+        """Test an overlay with a broken regex keeps its other rules."""
+        data_dir, write = warnings_dir
+        overlay = write("site.json", {
+            "linux": {"critical": [{"regex": "/data/("}, "/opt"]}
+        })
+        loader = PatternLoader(str(data_dir), validate_schema=False)
+
+        directories = loader.load_protected_directories([overlay])
+
+        assert directories["linux"]["critical"] == ["/etc", "/opt"]
+        assert loader.load_errors == [overlay]
+        assert "Invalid regex" in capsys.readouterr().out
+
+    def test_missing_overlay_is_reported(self, warnings_dir):
+        """Test a missing overlay is a load error (never cached)."""
+        data_dir, _ = warnings_dir
+        loader = PatternLoader(str(data_dir), validate_schema=False)
+
+        loader.load_protected_directories([str(data_dir / "missing.json")])
+
+        assert loader.load_errors == [str(data_dir / "missing.json")]
+
+    def test_missing_catalog_falls_back(self, tmp_path):
+        """Test a missing catalog still protects critical directories."""
+        loader = PatternLoader(str(tmp_path), validate_schema=False)
+
+        directories = loader.load_protected_directories()
+
+        assert "/etc" in directories["linux"]["critical"]
+        assert loader.load_errors
+
+    def test_overlays_from_environment(self, monkeypatch):
+        """Test MAIRU_PROTECTED_DIRS lists overlay files."""
+        monkeypatch.setenv("MAIRU_PROTECTED_DIRS",
+                           os.pathsep.join(["/etc/mairu/a.json", "", "b.json"]))
+
+        assert protected_overlays() == ["/etc/mairu/a.json", "b.json"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,217 @@
+"""
+Unit tests for non-interactive screening in src/screening.py
+"""
+
+import io
+import json
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+import src.screening as screening
+from src.screening import (
+    screen_command,
+    screen_lines,
+    screen_file,
+    shard_file,
+    run_check,
+    run_cli,
+    EXIT_OK,
+    EXIT_CRITICAL_FOUND,
+    EXIT_USAGE_ERROR
+)
+
+
+@pytest.fixture
+def commands_file(tmp_path):
+    """Write a command list with a blank line in the middle."""
+    def write(*lines):
+        path = tmp_path / "commands.txt"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return str(path)
+    return write
+
+
+class TestScreenCommand:
+    """Test suite for screen_command."""
+
+    def test_dangerous_pattern(self):
+        """Test dangerous commands are critical from the pattern layer."""
+        verdict = screen_command("rm -rf /")
+
+        assert verdict["level"] == "critical"
+        assert verdict["layer"] == "pattern"
+        assert verdict["pattern"] == "rm_dangerous"
+
+    def test_caution_pattern(self):
+        """Test caution commands report the caution pattern."""
+        verdict = screen_command("git push -f")
+
+        assert verdict["level"] == "caution"
+        assert verdict["pattern"] == "git_force_push"
+
+    def test_safe_command(self):
+        """Test safe commands produce an empty verdict."""
+        assert screen_command("ls -la") == {
+            "command": "ls -la",
+            "level": "safe",
+            "layer": "",
+            "pattern": "",
+            "path": "",
+        }
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="Linux paths")
+    def test_system_directory_reports_path(self):
+        """Test protected directory hits report the resolved path."""
+        verdict = screen_command("rm /etc/hosts")
+
+        assert verdict["level"] == "critical"
+        assert verdict["layer"] == "system_directory"
+        assert verdict["path"] == "/etc/hosts"
+
+    def test_typo_is_critical(self):
+        """Test typo patterns are reported like in the REPL."""
+        verdict = screen_command("sl")
+
+        assert verdict["level"] == "critical"
+        assert verdict["pattern"] == "typo_sl"
+
+    def test_does_not_print(self, capsys):
+        """Test screening never renders warnings."""
+        screen_command("rm -rf /")
+        screen_command("git push -f")
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+
+
+class TestScreenLines:
+    """Test suite for screen_lines."""
+
+    def test_skips_blank_lines_and_keeps_line_numbers(self):
+        """Test verdict line numbers match the input."""
+        verdicts = list(screen_lines(["ls\n", "\n", "   \n", "rm -rf /\n"]))
+
+        assert [v["line"] for v in verdicts] == [1, 4]
+        assert [v["level"] for v in verdicts] == ["safe", "critical"]
+
+    def test_worker_pool_keeps_input_order(self):
+        """Test multiple workers return the same verdicts in order."""
+        lines = ["ls", "rm -rf /", "git push -f", "sl"] * 50
+
+        assert list(screen_lines(lines, workers=2)) == \
+            list(screen_lines(lines, workers=1))
+
+
+class TestShardedScreening:
+    """Test suite for byte-range sharding of command files."""
+
+    def test_shards_start_on_line_boundaries(self, tmp_path):
+        """Test every shard starts at the beginning of a line."""
+        path = tmp_path / "commands.txt"
+        data = b"".join(f"echo {i}\n".encode() for i in range(100))
+        path.write_bytes(data)
+
+        shards = shard_file(str(path), 7)
+
+        assert shards[0][0] == 0
+        assert shards[-1][1] == len(data)
+        for (_, end), (start, _) in zip(shards, shards[1:]):
+            assert end == start
+            assert data[start - 1:start] == b"\n"
+
+    def test_fewer_shards_than_lines(self, tmp_path):
+        """Test long lines collapse into fewer shards without overlap."""
+        path = tmp_path / "commands.txt"
+        path.write_bytes(b"x" * 1000 + b"\n" + b"ls")
+
+        shards = shard_file(str(path), 8)
+
+        assert shards == [(0, 1001), (1001, 1003)]
+
+    def test_empty_file_has_no_shards(self, tmp_path):
+        """Test empty input produces no work."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+
+        assert shard_file(str(path), 4) == []
+        assert list(screen_file(str(path), workers=2)) == []
+
+    def test_sharded_results_match_single_process(self, tmp_path,
+                                                  monkeypatch):
+        """Test merged shards keep order and global line numbers."""
+        monkeypatch.setattr(screening, "SHARD_BYTES", 64)
+        path = tmp_path / "commands.txt"
+        lines = ["ls", "", "rm -rf /", "git push -f", "  ", "sl"] * 40
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        sharded = list(screen_file(str(path), workers=2))
+
+        assert sharded == list(screen_lines(lines))
+        assert sharded[-1]["line"] == len(lines)
+
+    def test_line_ends_are_the_same_for_every_worker_count(self, tmp_path):
+        """Test a lone carriage return does not split a line."""
+        path = tmp_path / "commands.txt"
+        path.write_bytes(b"rm -rf /\rls\nls\r\ngit push -f\n" * 5)
+
+        single = list(screen_file(str(path), workers=1))
+
+        assert single == list(screen_file(str(path), workers=3))
+        assert len(single) == 15
+        assert single[0]["command"] == "rm -rf /\rls"
+
+
+class TestRunCheck:
+    """Test suite for the --check mode."""
+
+    def test_writes_one_json_line_per_command(self, commands_file):
+        """Test output is JSON lines and summary goes to the report."""
+        output, report = io.StringIO(), io.StringIO()
+
+        status = run_check(commands_file("ls", "", "git push -f"),
+                           output=output, report=report)
+
+        lines = output.getvalue().splitlines()
+        assert status == EXIT_OK
+        assert [json.loads(line)["level"] for line in lines] == \
+            ["safe", "caution"]
+        assert "commands/sec" in report.getvalue()
+
+    def test_exit_code_when_critical_found(self, commands_file):
+        """Test a critical verdict makes --check fail."""
+        status = run_check(commands_file("ls", "rm -rf /"),
+                           output=io.StringIO(), report=io.StringIO())
+
+        assert status == EXIT_CRITICAL_FOUND
+
+    def test_missing_file(self, tmp_path):
+        """Test unreadable input is a usage error."""
+        report = io.StringIO()
+
+        status = run_check(str(tmp_path / "missing.txt"),
+                           output=io.StringIO(), report=report)
+
+        assert status == EXIT_USAGE_ERROR
+        assert "Cannot read" in report.getvalue()
+
+    def test_workers_without_check_is_rejected(self):
+        """Test --workers alone is an argument error."""
+        with pytest.raises(SystemExit) as exc_info:
+            run_cli(["--workers", "2"])
+
+        assert exc_info.value.code == 2
+
+    def test_negative_workers_rejected(self):
+        """Test invalid worker counts are argument errors."""
+        with pytest.raises(SystemExit):
+            run_cli(["--check", "-", "--workers", "-1"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,139 @@
+"""
+Unit tests for the streaming shell executor in src/shell_executor.py
+"""
+
+import io
+import os
+import sys
+import time
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+import src.shell_executor as shell_executor
+from src.shell_executor import is_command_not_found, run_streaming
+
+
+class RecordingOutput(io.StringIO):
+    """StringIO that remembers when each write happened."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append((time.monotonic(), text))
+        return super().write(text)
+
+
+class CountingOutput:
+    """Output that keeps only the size of what was written."""
+
+    def __init__(self):
+        self.characters = 0
+        self.largest = 0
+
+    def write(self, text):
+        self.characters += len(text)
+        self.largest = max(self.largest, len(text))
+
+    def flush(self):
+        pass
+
+
+class TestNotFoundMessages:
+    """Test suite for recognizing "command not found" output."""
+
+    @pytest.mark.parametrize("stderr", [
+        "sh: 1: mkdi: not found\n",
+        "bash: mkdi: command not found\n",
+        "'mkdi' is not recognized as an internal or external command,\n",
+        "'mkdi' は、内部コマンドまたは外部コマンド、\n",
+        "用語 'mkdi' は、コマンドレット、関数として認識されません。\n",
+    ])
+    def test_not_found(self, stderr):
+        """Test shell messages for missing commands are recognized."""
+        assert is_command_not_found(stderr)
+
+    def test_other_errors(self):
+        """Test other errors are not mistaken for missing commands."""
+        assert not is_command_not_found("make: *** [all] Error 1\n")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell commands")
+class TestRunStreaming:
+    """Test suite for running commands with streamed output."""
+
+    def test_forwards_stdout_and_stderr(self):
+        """Test both streams reach the output."""
+        output = io.StringIO()
+
+        result = run_streaming("echo out; echo err >&2; exit 3",
+                               output=output, encoding="utf-8")
+
+        assert result.returncode == 3
+        assert not result.not_found
+        assert "out\n" in output.getvalue()
+        assert "err\n" in output.getvalue()
+
+    def test_output_arrives_while_running(self):
+        """Test output is forwarded before the command exits."""
+        output = RecordingOutput()
+
+        start = time.monotonic()
+        run_streaming("echo first; sleep 0.5; echo second",
+                      output=output, encoding="utf-8")
+        finished = time.monotonic()
+
+        first_write = next(when for when, text in output.writes
+                           if "first" in text)
+        assert first_write - start < finished - start - 0.3
+
+    def test_command_not_found(self):
+        """Test a missing command is classified and its message held."""
+        output = io.StringIO()
+
+        result = run_streaming("definitely-missing-mairu-command",
+                               output=output, encoding="utf-8")
+
+        assert result.not_found
+        assert output.getvalue() == ""
+
+    def test_not_found_text_of_successful_command(self):
+        """Test a held first line is printed if the command succeeds."""
+        output = io.StringIO()
+
+        result = run_streaming("echo 'file: not found' >&2; true",
+                               output=output, encoding="utf-8")
+
+        assert not result.not_found
+        assert output.getvalue() == "file: not found\n"
+
+    def test_multibyte_characters_split_across_chunks(self, monkeypatch):
+        """Test characters split between reads are decoded whole."""
+        monkeypatch.setattr(shell_executor, "CHUNK_SIZE", 1)
+        output = io.StringIO()
+
+        run_streaming("printf 'かぼちゃ 🎃\\n'; printf 'おばけ\\n' >&2",
+                      output=output, encoding="utf-8")
+
+        assert "かぼちゃ 🎃\n" in output.getvalue()
+        assert "おばけ\n" in output.getvalue()
+        assert "�" not in output.getvalue()
+
+    def test_large_output_is_chunked(self):
+        """Test large output is forwarded in bounded pieces."""
+        output = CountingOutput()
+
+        run_streaming("head -c 5000000 /dev/zero | tr '\\0' a",
+                      output=output, encoding="utf-8")
+
+        assert output.characters == 5_000_000
+        assert output.largest <= shell_executor.CHUNK_SIZE
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,168 @@
+"""
+Unit tests for the shell command lexer in src/shell_lexer.py
+"""
+
+import os
+import shlex
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+from src.shell_lexer import Redirect, parse_command
+
+
+def argvs(command, posix=True):
+    """Get the argv of every segment."""
+    return [segment.argv for segment in parse_command(command, posix).segments]
+
+
+class TestWords:
+    """Test suite for word splitting and quoting."""
+
+    @pytest.mark.parametrize("command", [
+        "rm -rf /tmp/test",
+        'rm "/tmp/my file.txt"',
+        "rm '/tmp/my file.txt'",
+        'echo "a \\"quoted\\" word" plain',
+        "echo a\\ b c",
+        "echo pre'fix'\"suffix\"",
+        "echo '' \"\"",
+    ])
+    def test_matches_shlex(self, command):
+        """Test simple commands split like shlex in POSIX mode."""
+        assert argvs(command) == [tuple(shlex.split(command))]
+
+    def test_operators_inside_quotes_are_words(self):
+        """Test quoted operators and redirections stay in the argument."""
+        parsed = parse_command('echo "a > b; rm -rf /" \'x | y\'')
+
+        assert len(parsed.segments) == 1
+        assert parsed.segments[0].argv == ("echo", "a > b; rm -rf /", "x | y")
+        assert parsed.output_targets == ()
+
+    def test_unterminated_quote_runs_to_end(self):
+        """Test an unterminated quote is reported, not rejected."""
+        parsed = parse_command('rm "/tmp/unfinished file')
+
+        assert parsed.unterminated_quote
+        assert parsed.segments[0].argv == ("rm", "/tmp/unfinished file")
+
+    def test_windows_keeps_backslashes(self):
+        """Test non-POSIX mode keeps backslashes in paths."""
+        assert argvs(r'del "C:\Program Files\app" C:\Windows\x.dll',
+                     posix=False) == \
+            [("del", r"C:\Program Files\app", r"C:\Windows\x.dll")]
+
+    def test_empty_command(self):
+        """Test an empty or blank command has no segments."""
+        assert parse_command("").segments == ()
+        assert parse_command("   ").segments == ()
+
+
+class TestOperators:
+    """Test suite for chain operators and pipelines."""
+
+    def test_chain_operators(self):
+        """Test every chain operator ends a segment."""
+        parsed = parse_command("a; b && c || d & e | f |& g")
+
+        assert [s.argv[0] for s in parsed.segments] == list("abcdefg")
+        assert [s.operator for s in parsed.segments] == \
+            [";", "&&", "||", "&", "|", "|&", ""]
+
+    def test_operators_without_spaces(self):
+        """Test operators split words they touch."""
+        assert argvs("ls&&rm x;cat y|wc") == \
+            [("ls",), ("rm", "x"), ("cat", "y"), ("wc",)]
+
+    def test_subshells_are_segments(self):
+        """Test commands in (...) and $(...) are checked as segments."""
+        assert ("rm", "-rf", "/") in argvs("(cd /tmp; rm -rf /)")
+        assert ("rm", "-rf", "/") in argvs("echo $(rm -rf /)")
+
+    def test_pipelines(self):
+        """Test segments group into pipelines."""
+        parsed = parse_command("cat a | grep b && ls | wc -l")
+
+        assert [[s.argv[0] for s in p] for p in parsed.pipelines] == \
+            [["cat", "grep"], ["ls", "wc"]]
+
+    def test_segment_text(self):
+        """Test each segment keeps its source text."""
+        parsed = parse_command("echo 'a b'  >out ;  ls")
+
+        assert [s.text for s in parsed.segments] == ["echo 'a b'  >out", "ls"]
+
+
+class TestRedirections:
+    """Test suite for redirections and heredocs."""
+
+    @pytest.mark.parametrize("command", [
+        "echo x > /tmp/out",
+        "echo x >/tmp/out",
+        "echo x>/tmp/out",
+        "echo x >> /tmp/out",
+        "echo x 1> /tmp/out",
+        "echo x &> /tmp/out",
+        "echo x >| /tmp/out",
+        'echo x > "/tmp/out"',
+    ])
+    def test_output_targets(self, command):
+        """Test every output redirection form yields its target."""
+        assert parse_command(command).output_targets == ("/tmp/out",)
+
+    def test_redirections_are_not_arguments(self):
+        """Test redirections are separated from argv."""
+        segment = parse_command("sort data 2>> /var/log/err < in").segments[0]
+
+        assert segment.argv == ("sort", "data")
+        assert segment.redirects == (Redirect("2", ">>", "/var/log/err"),
+                                     Redirect("", "<", "in"))
+
+    def test_descriptor_duplication_is_not_a_file(self):
+        """Test 2>&1 does not write a file named 1."""
+        parsed = parse_command("make > build.log 2>&1")
+
+        assert parsed.output_targets == ("build.log",)
+
+    def test_digits_inside_word_are_not_descriptors(self):
+        """Test a2>f is the word a2 redirected to f."""
+        segment = parse_command("echo a2>f").segments[0]
+
+        assert segment.argv == ("echo", "a2")
+        assert segment.redirects == (Redirect("", ">", "f"),)
+
+    def test_missing_target(self):
+        """Test a redirection without a target has no output target."""
+        assert parse_command("echo test >").output_targets == ()
+
+    def test_targets_in_every_segment(self):
+        """Test output targets are collected across the chain."""
+        parsed = parse_command("echo a > /tmp/a && echo b > /dev/sda")
+
+        assert parsed.output_targets == ("/tmp/a", "/dev/sda")
+
+    def test_heredoc_markers(self):
+        """Test heredoc delimiters are recorded, not treated as files."""
+        parsed = parse_command("cat <<'EOF' > /tmp/out")
+
+        assert parsed.heredocs == ("EOF",)
+        assert parsed.output_targets == ("/tmp/out",)
+
+
+class TestCaching:
+    """Test suite for parse result caching."""
+
+    def test_same_command_is_parsed_once(self):
+        """Test repeated commands return the cached tree."""
+        command = "rm -rf /tmp/cached-lexer-test"
+
+        assert parse_command(command) is parse_command(command)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
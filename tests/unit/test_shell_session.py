@@ -0,0 +1,161 @@
+"""
+Unit tests for the persistent shell backend in src/shell_session.py
+"""
+
+import io
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+import src.shell_session as shell_session
+from src.shell_session import (
+    PERSISTENT_SHELL_ENV,
+    ShellSession,
+    get_shell_session,
+    persistent_shell_enabled
+)
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "forkpty") or not os.path.exists(shell_session.SHELL),
+    reason="needs pseudo-terminals and /bin/sh"
+)
+
+
+@pytest.fixture
+def session():
+    """A started shell session, stopped after the test."""
+    session = ShellSession()
+    session.start()
+    yield session
+    session.close()
+
+
+def run(session, command):
+    """Run a command and get (result, output)."""
+    output = io.StringIO()
+    result = session.run(command, output=output, encoding="utf-8")
+    return result, output.getvalue()
+
+
+class TestShellSession:
+    """Test suite for running commands in one long-lived shell."""
+
+    def test_output_and_exit_status(self, session):
+        """Test output and exit status come back for every command."""
+        assert run(session, "echo hello") == ((0, False), "hello\n")
+        assert run(session, "false")[0].returncode == 1
+        assert run(session, "printf 'no newline'")[1] == "no newline"
+        assert run(session, "echo err >&2; exit_code=4; (exit 4)") == \
+            ((4, False), "err\n")
+
+    def test_state_survives_between_commands(self, session):
+        """Test variables and functions persist in the shell."""
+        run(session, "GREETING=boo")
+        run(session, "haunt() { echo \"$GREETING $1\"; }")
+
+        assert run(session, "haunt house")[1] == "boo house\n"
+
+    def test_multiline_and_quoted_commands(self, session):
+        """Test commands with newlines and quotes run intact."""
+        assert run(session, "echo 'a\nb' \"it's\"")[1] == "a\nb it's\n"
+        assert run(session, "cat <<EOF\nline\nEOF")[1] == "line\n"
+
+    def test_syntax_error_keeps_session(self, session):
+        """Test a broken command does not break the protocol."""
+        result, _ = run(session, "echo 'unterminated")
+
+        assert result.returncode != 0
+        assert run(session, "echo still here")[1] == "still here\n"
+
+    def test_follows_working_directory_and_environment(
+            self, session, tmp_path, monkeypatch):
+        """Test MairuCLI's cd and export reach the shell."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("MAIRU_SESSION_TEST", "pumpkin")
+
+        assert run(session, "pwd")[1] == f"{os.getcwd()}\n"
+        assert run(session, "echo $MAIRU_SESSION_TEST")[1] == "pumpkin\n"
+
+        monkeypatch.delenv("MAIRU_SESSION_TEST")
+        assert run(session, "echo \"[$MAIRU_SESSION_TEST]\"")[1] == "[]\n"
+
+    def test_command_not_found(self, session):
+        """Test a missing command is classified and its message held."""
+        result, output = run(session, "definitely-missing-mairu-command")
+
+        assert result.not_found
+        assert output == ""
+
+    def test_restarts_after_shell_exits(self, session):
+        """Test a command that ends the shell gets a new one next time."""
+        assert run(session, "exit 3")[0].returncode == 3
+        assert not session.alive
+
+        assert run(session, "echo back")[1] == "back\n"
+
+
+class TestShellDefinitions:
+    """Test suite for recording and expanding aliases and functions."""
+
+    def test_aliases_expand_to_what_they_run(self):
+        """Test aliases (also nested ones) are replaced in every command."""
+        session = ShellSession()
+        session.record_definitions("command alias x=rm y='x -rf'")
+
+        assert session.expand_definitions("x -rf /") == "rm -rf /"
+        assert session.expand_definitions("ls && y /") == "ls ; rm -rf /"
+        assert session.expand_definitions("ls /") == "ls /"
+
+    def test_functions_get_their_arguments(self):
+        """Test a function call becomes its body with the arguments."""
+        session = ShellSession()
+        session.record_definitions('wipe() { rm "$@"; }')
+        session.record_definitions("function first { rm -rf ${1}; }")
+
+        assert session.expand_definitions("wipe -rf /") == "{ rm -rf /; }"
+        assert session.expand_definitions("first / x") == "{ rm -rf /; }"
+
+    def test_removed_and_sourced_definitions(self, tmp_path):
+        """Test unalias/unset -f forget and sourced files define."""
+        aliases = tmp_path / "aliases.sh"
+        aliases.write_text("alias x='rm -rf'\n")
+        session = ShellSession()
+
+        session.record_definitions(f". {aliases}")
+        assert session.expand_definitions("x /") == "rm -rf /"
+
+        session.record_definitions("f() { ls; }")
+        session.record_definitions("unalias x; unset -f f")
+        assert session.expand_definitions("x /; f") == "x /; f"
+
+
+class TestGetShellSession:
+    """Test suite for enabling the persistent shell."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test commands get their own shell unless enabled."""
+        monkeypatch.delenv(PERSISTENT_SHELL_ENV, raising=False)
+
+        assert not persistent_shell_enabled()
+        assert get_shell_session() is None
+
+    def test_enabled(self, monkeypatch):
+        """Test the shared session is started when enabled."""
+        monkeypatch.setenv(PERSISTENT_SHELL_ENV, "1")
+        monkeypatch.setattr(shell_session, "_session", None)
+
+        session = get_shell_session()
+        try:
+            assert session is get_shell_session()
+            assert session.alive
+        finally:
+            session.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,113 @@
+"""
+Unit tests for the typo suggestion index in src/typo_index.py
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+from src.typo_index import (
+    TypoIndex,
+    edit_kind,
+    SHELL_WORDS,
+    EDIT_EXTRA,
+    EDIT_MISSING,
+    EDIT_MISSING_LAST,
+    EDIT_SWAPPED,
+    EDIT_WRONG
+)
+
+
+@pytest.fixture
+def index():
+    """Index with a few builtins followed by $PATH-like names."""
+    return TypoIndex(["ls", "cat", "grep", "mkdir", "python", "python3",
+                      "docker", "git", "sed"],
+                     known=SHELL_WORDS, fold_case=False)
+
+
+class TestEditKind:
+    """Test suite for classifying single edits."""
+
+    @pytest.mark.parametrize("word,name,edit", [
+        ("mkdi", "mkdir", EDIT_MISSING_LAST),
+        ("gre", "grep", EDIT_MISSING_LAST),
+        ("mdir", "mkdir", EDIT_MISSING),
+        ("gitt", "git", EDIT_EXTRA),
+        ("grap", "grep", EDIT_WRONG),
+        ("gerp", "grep", EDIT_SWAPPED),
+        ("dokcer", "docker", EDIT_SWAPPED),
+        ("pgre", "grep", ""),
+        ("grep", "grep", ""),
+        ("cta", "act", ""),
+    ])
+    def test_edit_kind(self, word, name, edit):
+        """Test each kind of single edit is recognized."""
+        assert edit_kind(word, name) == edit
+
+
+class TestTypoIndex:
+    """Test suite for TypoIndex lookups."""
+
+    @pytest.mark.parametrize("word,names", [
+        ("gerp", ["grep"]),
+        ("dokcer", ["docker"]),
+        ("mkdi", ["mkdir"]),
+        ("pyhton", ["python"]),
+        ("pytho", ["python"]),
+        ("gti", ["git"]),
+        ("cta", ["cat"]),
+    ])
+    def test_finds_names_one_edit_away(self, index, word, names):
+        """Test substitutions, insertions, deletions and swaps are found."""
+        assert [c.name for c in index.candidates(word)] == names
+
+    def test_candidates_in_index_order(self, index):
+        """Test several matches come back builtins first."""
+        assert [c.name for c in index.candidates("pythn3")] == ["python3"]
+        assert [c.name for c in index.candidates("pythn")] == ["python"]
+        assert [(c.name, c.edit) for c in index.candidates("pythons")] == \
+            [("python", EDIT_EXTRA), ("python3", EDIT_WRONG)]
+
+    def test_known_words_are_never_typos(self, index):
+        """Test commands and shell builtins are not corrected."""
+        assert index.candidates("sed") == []
+        assert index.candidates("set") == []
+        assert "git" in index
+        assert "export" in index
+
+    def test_short_names_are_not_suggested(self, index):
+        """Test two-letter commands are never suggestions."""
+        assert index.candidates("lx") == []
+        assert index.candidates("l") == []
+
+    def test_paths_and_assignments_are_not_typos(self, index):
+        """Test only plain command words are checked."""
+        assert index.candidates("./gti") == []
+        assert index.candidates("GIT=1") == []
+
+    def test_case_folding(self):
+        """Test Windows-style indexes ignore case."""
+        index = TypoIndex(["Notepad"], fold_case=True)
+
+        assert "NOTEPAD" in index
+        assert [c.name for c in index.candidates("NOTEPD")] == ["notepad"]
+
+    def test_thousands_of_commands(self):
+        """Test lookups stay exact with a large command set."""
+        names = [f"tool{number:04d}" for number in range(5000)]
+        index = TypoIndex(names + ["grep"])
+
+        assert [c.name for c in index.candidates("gerp")] == ["grep"]
+        for word in ("tool004", "tool12345", "tlo0999"):
+            assert {c.name for c in index.candidates(word)} == \
+                {name for name in names if edit_kind(word, name)}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,144 @@
+"""
+Unit tests for the verdict cache in src/verdict_cache.py
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+import src.verdict_cache as verdict_cache
+from src.screening import check_layers
+from src.verdict_cache import VerdictCache
+
+
+class CountingCheck:
+    """Screening function that records how often it runs."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, command):
+        self.calls.append(command)
+        return check_layers(command)
+
+
+@pytest.fixture
+def check():
+    """Counting wrapper around check_layers."""
+    return CountingCheck()
+
+
+class TestVerdictCache:
+    """Test suite for VerdictCache."""
+
+    def test_repeated_command_hits(self, check):
+        """Test a repeated command is screened once."""
+        cache = VerdictCache()
+
+        first = cache.get("git status", check)
+        second = cache.get("git status", check)
+
+        assert second == first
+        assert check.calls == ["git status"]
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_cached_result_matches_fresh_check(self, check):
+        """Test cached results are the real layer results."""
+        cache = VerdictCache()
+        cache.get("rm -rf /", check)
+
+        assert cache.get("rm -rf /", check) == check_layers("rm -rf /")
+        assert cache.get("rm -rf /", check).level == "critical"
+
+    def test_cwd_change_invalidates(self, check, tmp_path, monkeypatch):
+        """Test the same relative command is rechecked after cd."""
+        cache = VerdictCache()
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+
+        monkeypatch.chdir(tmp_path / "a")
+        cache.get("rm notes.txt", check)
+        monkeypatch.chdir(tmp_path / "b")
+        cache.get("rm notes.txt", check)
+
+        assert len(check.calls) == 2
+        assert len(cache) == 2
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="Linux paths")
+    def test_relative_path_into_system_directory(self, check, tmp_path,
+                                                  monkeypatch):
+        """Test a safe relative command becomes critical after cd /."""
+        cache = VerdictCache()
+
+        monkeypatch.chdir(tmp_path)
+        assert cache.get("rm etc/hosts", check).sys_level != "critical"
+        monkeypatch.chdir("/")
+        assert cache.get("rm etc/hosts", check).sys_level == "critical"
+
+    def test_pattern_version_change_invalidates(self, check, monkeypatch):
+        """Test a new pattern version is never served old verdicts."""
+        cache = VerdictCache()
+        cache.get("ls", check)
+
+        monkeypatch.setattr(verdict_cache, "_pattern_version", lambda: "new")
+        cache.get("ls", check)
+
+        assert check.calls == ["ls", "ls"]
+
+    @pytest.mark.parametrize("command", [
+        "rm $HOME/notes.txt", "rm ~/notes.txt", "del %APPDATA%\\x"
+    ])
+    def test_environment_expansion_bypasses(self, check, command):
+        """Test commands expanded from the environment are never cached."""
+        cache = VerdictCache()
+
+        cache.get(command, check)
+        cache.get(command, check)
+
+        assert len(check.calls) == 2
+        assert len(cache) == 0
+        assert cache.get_stats()["bypassed"] == 2
+
+    def test_evicts_least_recently_used(self, check):
+        """Test the cache stays within its size bound."""
+        cache = VerdictCache(max_entries=2)
+
+        cache.get("ls", check)
+        cache.get("pwd", check)
+        cache.get("ls", check)          # ls is now most recent
+        cache.get("whoami", check)      # evicts pwd
+        cache.get("ls", check)
+
+        assert len(cache) == 2
+        assert check.calls == ["ls", "pwd", "whoami"]
+
+    def test_zero_size_disables(self, check):
+        """Test max_entries=0 always screens fresh."""
+        cache = VerdictCache(max_entries=0)
+
+        cache.get("ls", check)
+        cache.get("ls", check)
+
+        assert len(check.calls) == 2
+
+    def test_clear_resets_counters(self, check):
+        """Test clear empties the cache and its statistics."""
+        cache = VerdictCache()
+        cache.get("ls", check)
+        cache.get("ls", check)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get_stats()["hits"] == 0
+        assert cache.get_stats()["hit_rate"] == 0.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
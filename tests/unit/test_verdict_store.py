@@ -0,0 +1,167 @@
+"""
+Unit tests for the persistent verdict store in src/verdict_store.py
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+import src.verdict_store as verdict_store
+from src.screening import check_layers
+from src.verdict_store import (
+    VerdictStore,
+    check_layers_stored,
+    get_verdict_store,
+    is_path_independent
+)
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    """Database path in a temporary cache directory."""
+    return str(tmp_path / "cache" / "verdicts.sqlite3")
+
+
+@pytest.fixture
+def shared_store(store_path, monkeypatch):
+    """Replace the shared store with one in a temporary directory."""
+    store = VerdictStore(store_path, "test")
+    monkeypatch.setattr(verdict_store, "_store", store)
+    yield store
+    store.close()
+
+
+class TestVerdictStore:
+    """Test suite for VerdictStore."""
+
+    def test_entries_persist_across_sessions(self, store_path):
+        """Test a new store instance reads flushed verdicts."""
+        first = VerdictStore(store_path, "v1")
+        first.put("rm -rf /", check_layers("rm -rf /"))
+        first.close()
+
+        second = VerdictStore(store_path, "v1")
+
+        assert second.get("rm -rf /") == check_layers("rm -rf /")
+        assert second.get("ls") is None
+        assert (second.hits, second.misses) == (1, 1)
+        second.close()
+
+    def test_unflushed_entries_are_readable(self, store_path):
+        """Test buffered writes are visible before the flush."""
+        store = VerdictStore(store_path, "v1")
+        store.put("ls", check_layers("ls"))
+
+        assert store.get("ls") == check_layers("ls")
+        store.close()
+
+    def test_other_versions_are_not_read(self, store_path):
+        """Test entries from another checks version are ignored."""
+        old = VerdictStore(store_path, "old")
+        old.put("ls", check_layers("ls"))
+        old.close()
+
+        new = VerdictStore(store_path, "new")
+
+        assert new.get("ls") is None
+        assert new.get_stats()["entries"] == 0
+        assert new.get_stats()["total_entries"] == 1
+        new.close()
+
+    def test_size_is_bounded(self, store_path):
+        """Test least recently used entries are evicted beyond the bound."""
+        store = VerdictStore(store_path, "v1", max_entries=10)
+        checks = check_layers("ls")
+        for i in range(25):
+            store.put(f"echo {i}", checks)
+            store.flush()
+
+        assert store.get_stats()["total_entries"] <= 10
+        assert store.get("echo 24") == checks
+        assert store.get("echo 0") is None
+        store.close()
+
+    def test_clear(self, store_path):
+        """Test clear removes every entry."""
+        store = VerdictStore(store_path, "v1")
+        store.put("ls", check_layers("ls"))
+        store.flush()
+
+        store.clear()
+
+        assert store.get("ls") is None
+        assert store.get_stats()["total_entries"] == 0
+        store.close()
+
+    def test_unusable_location_disables_store(self, tmp_path):
+        """Test a store that cannot be created is skipped silently."""
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        store = VerdictStore(str(blocker / "verdicts.sqlite3"), "v1")
+
+        store.put("ls", check_layers("ls"))
+
+        assert store.get("ls") is None
+
+
+class TestStoredChecks:
+    """Test suite for check_layers_stored."""
+
+    @pytest.mark.parametrize("command", [
+        "ls -la", "rm -rf /", "chmod 777 /srv/app", "echo hi > /etc/hosts"
+    ])
+    def test_path_independent(self, command):
+        """Test commands with only absolute paths can be stored."""
+        assert is_path_independent(command)
+
+    @pytest.mark.parametrize("command", [
+        "rm notes.txt", "rm -rf ../build", "rm $HOME/x", "rm ~/x"
+    ])
+    def test_path_dependent(self, command):
+        """Test relative paths and expansions are never stored."""
+        assert not is_path_independent(command)
+
+    def test_stores_path_independent_commands(self, shared_store):
+        """Test absolute commands are stored and served."""
+        first = check_layers_stored("chmod 777 /srv/app")
+        second = check_layers_stored("chmod 777 /srv/app")
+
+        assert first == second == check_layers("chmod 777 /srv/app")
+        assert (shared_store.hits, shared_store.misses) == (1, 1)
+
+    def test_skips_relative_commands(self, shared_store):
+        """Test cwd-relative commands are never stored."""
+        check_layers_stored("rm notes.txt")
+        check_layers_stored("rm notes.txt")
+
+        assert shared_store.hits == 0
+        assert shared_store.get("rm notes.txt") is None
+
+    @pytest.mark.parametrize("command", ["mkdi /srv/app", "gerp -r x /srv"])
+    def test_skips_near_misses_of_builtins(self, shared_store, command):
+        """Test verdicts that change when the word is installed are not kept."""
+        check_layers_stored(command)
+
+        assert shared_store.get(command) is None
+
+    def test_stores_other_unknown_words(self, shared_store):
+        """Test words no $PATH change can make a typo are stored."""
+        check_layers_stored("gst /srv/app")
+
+        assert shared_store.get("gst /srv/app") is not None
+
+    def test_disabled_by_environment(self, monkeypatch):
+        """Test MAIRU_NO_CACHE disables the store."""
+        monkeypatch.setenv("MAIRU_NO_CACHE", "1")
+
+        assert get_verdict_store() is None
+        assert check_layers_stored("ls") == check_layers("ls")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])